@@ -1,6 +1,35 @@
 from django.apps import AppConfig
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.db.migrations.recorder import MigrationRecorder
+from django.db.models.signals import post_delete, post_migrate, post_save
+from apps.api.timing import install_sql_wrapper
+
+
+def ensure_search_index(sender, using, **kwargs):
+    """
+    Reinstalls the search triggers that SQLite drops when a migration
+    rebuilds the article table.
+    """
+    from apps.core.services.search_service import SearchService
+
+    connection = connections[using]
+    applied = MigrationRecorder(connection).applied_migrations()
+    if ('api', '0005_article_search_index') in applied:
+        SearchService.install(connection)
 
 
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.api'
+
+    def ready(self):
+        post_migrate.connect(ensure_search_index, sender=self)
+        connection_created.connect(install_sql_wrapper, dispatch_uid='apps.api.timing')
+
+        from django.contrib.auth import get_user_model
+        from apps.api.authentication import invalidate_cached_user
+
+        user_model = get_user_model()
+        post_save.connect(invalidate_cached_user, sender=user_model, dispatch_uid='apps.api.invalidate_cached_user')
+        post_delete.connect(invalidate_cached_user, sender=user_model, dispatch_uid='apps.api.invalidate_cached_user')
@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+from apps.api import metrics
+
+USER_CACHE_REQUESTS = metrics.REGISTRY.counter(
+    'jwt_user_cache_requests_total', 'JWT user lookups, by result (hit or miss).', ('result',)
+)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that caches the user of a token by user id for
+    JWT_USER_CACHE_TTL seconds, instead of selecting it on every request.
+
+    Cached users go through the same active and revoked token checks. The
+    entry is deleted whenever the user is saved or deleted (see
+    invalidate_cached_user), so profile updates, deactivations and account
+    deletions apply to the next request.
+    """
+    KEY = 'jwt_user:{}'
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None or not settings.JWT_USER_CACHE_TTL:
+            return super().get_user(validated_token)
+
+        key = self.KEY.format(user_id)
+        user = cache.get(key)
+        if user is None:
+            USER_CACHE_REQUESTS.inc(result='miss')
+            user = super().get_user(validated_token)
+            cache.set(key, user, settings.JWT_USER_CACHE_TTL)
+            return user
+
+        USER_CACHE_REQUESTS.inc(result='hit')
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(_("The user's password has been changed."), code='password_changed')
+        return user
+
+    @staticmethod
+    def invalidate(user_id) -> None:
+        """
+        Drops the cached user, now and again once the current transaction
+        commits, so a request cannot cache the old row in between.
+        """
+        key = CachedJWTAuthentication.KEY.format(user_id)
+        cache.delete(key)
+        transaction.on_commit(lambda: cache.delete(key))
+
+
+def invalidate_cached_user(sender, instance, **kwargs):
+    CachedJWTAuthentication.invalidate(getattr(instance, api_settings.USER_ID_FIELD))
@@ -0,0 +1,35 @@
+import hashlib
+from functools import wraps
+from django.views.decorators.cache import cache_page
+from apps.api import metrics
+from apps.core.services.cache_service import CacheService
+
+
+def versioned_cache_page(timeout, namespaces):
+    """
+    Same as ``cache_page``, but the cache key also carries the current version
+    of every namespace the response depends on.
+
+    Bumping one of those namespaces through ``CacheService.invalidate`` makes
+    the cached entry unreachable without touching unrelated entries.
+
+    Args:
+        timeout (int): Cache timeout in seconds.
+        namespaces (Callable): Called with the view arguments
+            ``(request, *args, **kwargs)``; returns the namespaces to key on.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapper(request, *args, **kwargs):
+            versions = CacheService.get_versions(namespaces(request, *args, **kwargs))
+            key_prefix = hashlib.md5(
+                repr(sorted(versions.items())).encode(), usedforsecurity=False
+            ).hexdigest()
+            response = cache_page(timeout, key_prefix=key_prefix)(view_func)(request, *args, **kwargs)
+            if request.method in ('GET', 'HEAD'):
+                # The cache middleware only asks to store the response on a miss
+                hit = not getattr(request, '_cache_update_cache', True)
+                metrics.CACHE_PAGE_REQUESTS.inc(view=metrics.view_name(request), result='hit' if hit else 'miss')
+            return response
+        return _wrapper
+    return decorator
@@ -0,0 +1,50 @@
+import hashlib
+from functools import wraps
+from django.utils.cache import get_conditional_response
+from apps.core.services.cache_service import CacheService
+
+
+def conditional_view(namespaces):
+    """
+    Adds an ETag validator to a GET view and answers ``If-None-Match`` with
+    304 before the view runs, so an unchanged resource is never queried nor
+    serialized.
+
+    The ETag is a weak validator built from the current version of the cache
+    namespaces the response depends on (the same ones ``versioned_cache_page``
+    keys it on) and the representation asked for (path, query string, host
+    and Accept header). The validator and the cached body therefore always
+    change together, and checking it costs no database query.
+
+    Both only change when CacheService bumps a namespace: writes that bypass
+    the API views and services (the shell, raw SQL, a management command
+    that does not invalidate) leave them stale until
+    ``CacheService.invalidate`` is called for the affected namespaces.
+
+    Args:
+        namespaces (Callable): Called with the view arguments
+            ``(request, *args, **kwargs)``; returns the namespaces to key on.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view_func(request, *args, **kwargs)
+
+            versions = CacheService.get_versions(namespaces(request, *args, **kwargs))
+            digest = hashlib.md5(repr((
+                sorted(versions.items()),
+                request.get_full_path(),
+                request.get_host(),
+                request.META.get('HTTP_ACCEPT', ''),
+            )).encode(), usedforsecurity=False).hexdigest()
+            etag = f'W/"{digest}"'
+
+            response = get_conditional_response(request, etag=etag)
+            if response is None:
+                response = view_func(request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                response.headers['ETag'] = etag
+            return response
+        return _wrapper
+    return decorator
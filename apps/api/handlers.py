@@ -1,14 +1,18 @@
 from rest_framework.views import exception_handler
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, Throttled
 from rest_framework.response import Response
 from rest_framework import status
 from django.http import JsonResponse
+from apps.api import metrics
 
 def custom_exception_handler(exc, context):
     """
     Custom exception handler for API errors.
     Returns JSON responses for all error types.
     """
+    if isinstance(exc, Throttled):
+        metrics.THROTTLED_REQUESTS.inc(view=metrics.view_name(context['request']))
+
     # Call REST framework's default exception handler first
     response = exception_handler(exc, context)
 
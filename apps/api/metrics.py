@@ -0,0 +1,312 @@
+import atexit
+import json
+import os
+import re
+import secrets
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.conf import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250)
+
+
+class Metric:
+    """
+    Base class of the metrics, holding one value per combination of labels.
+    """
+    type = None
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def key(self, labels: Dict) -> Tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def describe(self) -> Dict:
+        return {'type': self.type, 'help': self.documentation, 'labelnames': self.labelnames}
+
+    def reset(self) -> None:
+        with self.lock:
+            self.values.clear()
+
+
+class Counter(Metric):
+    type = 'counter'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self.key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def samples(self) -> List:
+        with self.lock:
+            return [[list(key), value] for key, value in self.values.items()]
+
+
+class Histogram(Metric):
+    """
+    Histogram of observed values. Each combination of labels keeps the count
+    of every bucket (not cumulative), then the sum and count of the values.
+    """
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str], buckets: Iterable[float]):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self.key(labels)
+        with self.lock:
+            counts = self.values.get(key)
+            if counts is None:
+                counts = self.values[key] = [0] * (len(self.buckets) + 3)
+            counts[bisect_left(self.buckets, value)] += 1
+            counts[-2] += value
+            counts[-1] += 1
+
+    def describe(self) -> Dict:
+        return {**super().describe(), 'buckets': self.buckets}
+
+    def samples(self) -> List:
+        with self.lock:
+            return [[list(key), list(counts)] for key, counts in self.values.items()]
+
+
+class Registry:
+    """
+    Registry of the metrics of this process.
+
+    With METRICS_MULTIPROC_DIR set, every process writes a snapshot of its
+    metrics to ``<dir>/metrics_<pid>_<token>.json`` at most every
+    METRICS_FLUSH_INTERVAL seconds, when it serves a scrape and when it
+    exits, and a scrape adds up the snapshots of all processes. The random
+    token keeps a process from overwriting the file of an earlier one with
+    the same PID. The scrape moves the files of stopped processes into
+    ``metrics_aggregate.json`` so the counters never go back.
+    """
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+        self.flushed_at = 0.0
+        self.token = secrets.token_hex(4)
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Iterable[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def reset(self) -> None:
+        for metric in self.metrics.values():
+            metric.reset()
+        self.flushed_at = 0.0
+
+    def after_fork(self) -> None:
+        """
+        Starts the child of a fork from empty metrics and its own file.
+        """
+        self.reset()
+        self.token = secrets.token_hex(4)
+
+    def snapshot(self) -> Dict:
+        return {
+            name: {**metric.describe(), 'samples': metric.samples()}
+            for name, metric in self.metrics.items()
+        }
+
+    @staticmethod
+    def directory() -> Optional[Path]:
+        return Path(settings.METRICS_MULTIPROC_DIR) if settings.METRICS_MULTIPROC_DIR else None
+
+    def flush(self, force: bool = False) -> None:
+        """
+        Writes the snapshot of this process in multiprocess mode, unless it
+        was written less than METRICS_FLUSH_INTERVAL seconds ago.
+        """
+        directory = self.directory()
+        now = time.monotonic()
+        if directory is None or (not force and now - self.flushed_at < settings.METRICS_FLUSH_INTERVAL):
+            return
+        self.flushed_at = now
+
+        directory.mkdir(parents=True, exist_ok=True)
+        _write(directory / f'metrics_{os.getpid()}_{self.token}.json', self.snapshot())
+
+    def compact(self, directory: Path) -> None:
+        """
+        Adds the files of stopped processes to ``metrics_aggregate.json``
+        and removes them. Only done where processes can be checked (POSIX).
+        """
+        if fcntl is None:
+            return
+        with open(directory / 'metrics.lock', 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            stopped = [
+                path for path in directory.glob('metrics_*.json')
+                if (match := PROCESS_FILE.fullmatch(path.name)) and not _running(int(match.group(1)))
+            ]
+            if not stopped:
+                return
+            aggregate = directory / AGGREGATE_FILE
+            merged = {}
+            for path in [aggregate, *stopped]:
+                _merge(merged, _read(path))
+            _write(aggregate, _samples(merged))
+            for path in stopped:
+                path.unlink(missing_ok=True)
+
+    def collect(self) -> Dict:
+        """
+        Returns the metrics of this process, or of all processes in
+        multiprocess mode.
+        """
+        directory = self.directory()
+        if directory is None:
+            return self.snapshot()
+
+        self.flush(force=True)
+        self.compact(directory)
+        merged = {}
+        for path in sorted(directory.glob('metrics_*.json')):
+            _merge(merged, _read(path))
+        return _samples(merged)
+
+
+PROCESS_FILE = re.compile(r'metrics_(\d+)_[0-9a-f]+\.json')
+AGGREGATE_FILE = 'metrics_aggregate.json'
+
+
+def _running(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _read(path: Path) -> Dict:
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def _write(path: Path, snapshot: Dict) -> None:
+    temporary = path.with_name(path.name + '.tmp')
+    temporary.write_text(json.dumps(snapshot), encoding='utf-8')
+    os.replace(temporary, path)
+
+
+def _merge(merged: Dict, snapshot: Dict) -> None:
+    """
+    Adds a snapshot to ``merged``, whose samples are keyed by labels.
+    """
+    for name, metric in snapshot.items():
+        target = merged.setdefault(name, {**metric, 'samples': {}})
+        for labels, value in metric['samples']:
+            key = tuple(labels)
+            if metric['type'] == 'counter':
+                target['samples'][key] = target['samples'].get(key, 0) + value
+            else:
+                current = target['samples'].get(key)
+                target['samples'][key] = value if current is None else [a + b for a, b in zip(current, value)]
+
+
+def _samples(merged: Dict) -> Dict:
+    return {
+        name: {**metric, 'samples': [[list(key), value] for key, value in metric['samples'].items()]}
+        for name, metric in merged.items()
+    }
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render(metrics: Dict) -> str:
+    """
+    Formats collected metrics in the Prometheus text exposition format.
+    """
+    lines = []
+    for name, metric in sorted(metrics.items()):
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        names = metric['labelnames']
+        for values, value in sorted(metric['samples']):
+            if metric['type'] == 'counter':
+                lines.append(f'{name}{_labels(names, values)} {_number(value)}')
+                continue
+
+            cumulative = 0
+            for bound, count in zip([*metric['buckets'], '+Inf'], value[:-2]):
+                cumulative += count
+                le = 'le="%s"' % (bound if bound == '+Inf' else _number(float(bound)))
+                lines.append(f'{name}_bucket{_labels(names, values, le)} {cumulative}')
+            lines.append(f'{name}_sum{_labels(names, values)} {_number(float(value[-2]))}')
+            lines.append(f'{name}_count{_labels(names, values)} {value[-1]}')
+    return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+REQUEST_DURATION = REGISTRY.histogram(
+    'http_request_duration_seconds', 'Time to handle a request, by route.', ('view', 'method')
+)
+REQUESTS = REGISTRY.counter(
+    'http_requests_total', 'Requests handled, by route and status code.', ('view', 'method', 'status')
+)
+REQUEST_QUERIES = REGISTRY.histogram(
+    'http_request_queries', 'SQL queries run by the requests measured by RequestTimingMiddleware, by route.',
+    ('view',), buckets=QUERY_BUCKETS
+)
+CACHE_PAGE_REQUESTS = REGISTRY.counter(
+    'cache_page_requests_total', 'Cached page lookups, by route and result (hit or miss).', ('view', 'result')
+)
+THROTTLED_REQUESTS = REGISTRY.counter(
+    'throttled_requests_total', 'Requests rejected by the API throttles, by route.', ('view',)
+)
+
+# A forked worker starts from the metrics of its parent otherwise
+os.register_at_fork(after_in_child=REGISTRY.after_fork)
+# An idle worker would never write its last requests otherwise
+atexit.register(REGISTRY.flush, force=True)
+
+
+def view_name(request) -> str:
+    """
+    Returns the route label of a request, e.g. ``api:v1:article-list``.
+    Unresolved paths share one label to keep the number of series bounded.
+    """
+    match = getattr(request, 'resolver_match', None)
+    return match.view_name if match else '<unmatched>'
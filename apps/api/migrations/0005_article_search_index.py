@@ -0,0 +1,22 @@
+from django.db import migrations
+from apps.core.services.search_service import SearchService
+
+
+def install_search_index(apps, schema_editor):
+    SearchService.install(schema_editor.connection)
+    SearchService.rebuild(schema_editor.connection)
+
+
+def uninstall_search_index(apps, schema_editor):
+    SearchService.uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_alter_comment_options_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_search_index, uninstall_search_index),
+    ]
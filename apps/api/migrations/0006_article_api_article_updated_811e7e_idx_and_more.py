@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-18 11:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_article_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['updated_at'], name='api_article_updated_811e7e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='keyword',
+            index=models.Index(fields=['updated_at'], name='api_keyword_updated_4e9828_idx'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2 on 2026-10-18 11:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Article = apps.get_model('api', 'Article')
+    Comment = apps.get_model('api', 'Comment')
+    UserStats = apps.get_model('api', 'UserStats')
+
+    def count(model, field):
+        return Coalesce(Subquery(
+            model.objects.filter(**{field: OuterRef('pk')}).order_by().values(field).annotate(
+                count=Count('id')
+            ).values('count'),
+            output_field=IntegerField()
+        ), Value(0))
+
+    Article.objects.update(comment_count=count(Comment, 'article'))
+
+    user_ids = set(Article.objects.values_list('author', flat=True).distinct())
+    user_ids |= set(Comment.objects.values_list('author', flat=True).distinct())
+    UserStats.objects.bulk_create([UserStats(user_id=user_id) for user_id in user_ids], batch_size=1000)
+    UserStats.objects.update(article_count=count(Article, 'author'), comment_count=count(Comment, 'author'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_article_api_article_updated_811e7e_idx_and_more'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('article_count', models.IntegerField(default=0)),
+                ('comment_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'User stats',
+                'verbose_name_plural': 'User stats',
+            },
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='comment_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-18 11:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_userstats_article_comment_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['type', 'status', '-created_at', '-id'], name='article_public_feed_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2 on 2026-10-18 11:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_usage(apps, schema_editor):
+    Article = apps.get_model('api', 'Article')
+    KeywordUsage = apps.get_model('api', 'KeywordUsage')
+
+    # Article.ArticleType.PUBLISHED and Article.ArticleStatus.PUBLIC
+    public = Q(article__type=1, article__status=1)
+    usage = Article.keywords.through.objects.order_by().values('keyword').annotate(
+        articles=Count('id'), public=Count('id', filter=public)
+    ).values_list('keyword', 'articles', 'public')
+    KeywordUsage.objects.bulk_create([
+        KeywordUsage(keyword_id=keyword_id, article_count=articles, public_count=public)
+        for keyword_id, articles, public in usage
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_article_article_public_feed_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KeywordUsage',
+            fields=[
+                ('keyword', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='usage', serialize=False, to='api.keyword')),
+                ('article_count', models.IntegerField(default=0)),
+                ('public_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Keyword usage',
+                'verbose_name_plural': 'Keyword usage',
+                'indexes': [models.Index(fields=['-article_count', 'keyword'], name='keyword_usage_total_idx'), models.Index(fields=['-public_count', 'keyword'], name='keyword_usage_public_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_usage, migrations.RunPython.noop),
+    ]
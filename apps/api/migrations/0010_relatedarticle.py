@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-18 12:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_keywordusage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedArticle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_articles', to='api.article')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_from', to='api.article')),
+            ],
+            options={
+                'verbose_name': 'Related article',
+                'verbose_name_plural': 'Related articles',
+                'indexes': [models.Index(fields=['article', '-score', '-related'], name='related_article_rank_idx'), models.Index(fields=['related'], name='api_related_related_aecc74_idx')],
+                'constraints': [models.UniqueConstraint(fields=('article', 'related'), name='related_article_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-18 12:49
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_article_author_feed_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='article',
+            name='api_article_updated_811e7e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='keyword',
+            name='api_keyword_updated_4e9828_idx',
+        ),
+    ]
@@ -2,6 +2,17 @@ from django.db import models
 from django.contrib.auth.models import User
 from apps.api.models.keyword import Keyword
 
+class ArticleQuerySet(models.QuerySet):
+    def public_feed(self):
+        """
+        Published public articles, newest first. Served by the
+        article_public_feed_idx index without sorting.
+        """
+        return self.filter(
+            type=Article.ArticleType.PUBLISHED, status=Article.ArticleStatus.PUBLIC
+        ).order_by('-created_at', '-id')
+
+
 class Article(models.Model):
     class ArticleType(models.IntegerChoices):
         DRAFT = 0, 'Draft'
@@ -21,6 +32,10 @@ class Article(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     keywords = models.ManyToManyField(Keyword, related_name='articles')
+    # Maintained by CounterService, see recount_activity to repair it
+    comment_count = models.IntegerField(default=0)
+
+    objects = ArticleQuerySet.as_manager()
 
     def __str__(self):
         return self.title
@@ -32,6 +47,11 @@ class Article(models.Model):
             models.Index(fields=['status']),
             models.Index(fields=['type']),
             models.Index(fields=['created_at']),
+            # Equality on type and status, then already in feed order. A
+            # partial index would not be used by SQLite, which can't match its
+            # condition against the bound query parameters.
+            models.Index(fields=['type', 'status', '-created_at', '-id'], name='article_public_feed_idx'),
+            models.Index(fields=['author', '-created_at', '-id'], name='article_author_feed_idx'),
         ]
         verbose_name = 'Article'
         verbose_name_plural = 'Articles'
\ No newline at end of file
@@ -0,0 +1,26 @@
+from django.db import models
+from apps.api.models.keyword import Keyword
+
+class KeywordUsage(models.Model):
+    """
+    Number of articles tagged with a keyword, maintained by
+    KeywordUsageService on every write.
+
+    ``public_count`` only counts published public articles. Rows are created
+    on the first article of the keyword.
+    """
+    keyword = models.OneToOneField(Keyword, on_delete=models.CASCADE, primary_key=True, related_name='usage')
+    article_count = models.IntegerField(default=0)
+    public_count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f'Usage of {self.keyword_id}'
+
+    class Meta:
+        indexes = [
+            # Top N keywords are read in index order, without sorting
+            models.Index(fields=['-article_count', 'keyword'], name='keyword_usage_total_idx'),
+            models.Index(fields=['-public_count', 'keyword'], name='keyword_usage_public_idx'),
+        ]
+        verbose_name = 'Keyword usage'
+        verbose_name_plural = 'Keyword usage'
@@ -0,0 +1,29 @@
+from django.db import models
+from apps.api.models.article import Article
+
+class RelatedArticle(models.Model):
+    """
+    One of the most similar published public articles to an article,
+    maintained by RelatedArticleService.
+
+    ``score`` is the Jaccard similarity of the keywords of both articles,
+    each keyword weighted by its rarity.
+    """
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='related_articles')
+    related = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='related_from')
+    score = models.FloatField()
+
+    def __str__(self):
+        return f'{self.article_id} -> {self.related_id}'
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['article', 'related'], name='related_article_unique'),
+        ]
+        indexes = [
+            # The list of an article is read in index order, without sorting
+            models.Index(fields=['article', '-score', '-related'], name='related_article_rank_idx'),
+            models.Index(fields=['related']),
+        ]
+        verbose_name = 'Related article'
+        verbose_name_plural = 'Related articles'
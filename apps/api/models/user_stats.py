@@ -0,0 +1,19 @@
+from django.db import models
+from django.contrib.auth.models import User
+
+class UserStats(models.Model):
+    """
+    Activity counters of a user, maintained by CounterService on every write.
+
+    Rows are created on the first article or comment of the user.
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    article_count = models.IntegerField(default=0)
+    comment_count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f'Stats of {self.user_id}'
+
+    class Meta:
+        verbose_name = 'User stats'
+        verbose_name_plural = 'User stats'
@@ -0,0 +1,196 @@
+import json
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, CursorPagination, PageNumberPagination, _reverse_ordering
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the newest-first ``(-created_at, -id)`` ordering.
+
+    DRF's CursorPagination only keeps the first ordering field in the cursor
+    and skips rows sharing its value with an offset. Here the cursor holds
+    every ordering field of the row it stops at, and the page seeks past
+    that row in the full ordering, so rows created in the same instant are
+    neither skipped nor scanned again. No COUNT(*) and no OFFSET scan are
+    issued, and pages stay stable while new rows are being inserted at the
+    head of the list. The ordering must be unique, e.g. end with the id.
+    """
+    ordering = ('-created_at', '-id')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+        position = self.cursor.position if self.cursor is not None else None
+
+        queryset = queryset.order_by(*(_reverse_ordering(self.ordering) if reverse else self.ordering))
+        if position is not None:
+            queryset = queryset.filter(self._after(queryset.model, position, reverse))
+
+        # One extra row tells whether there is a page after this one
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        following = None
+        if len(results) > self.page_size:
+            following = self._get_position_from_instance(results[-1], self.ordering)
+
+        if reverse:
+            self.page.reverse()
+            self.next_position, self.previous_position = position, following
+        else:
+            self.next_position, self.previous_position = following, position
+        self.has_next = self.next_position is not None
+        self.has_previous = self.previous_position is not None
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def _after(self, model, position: str, reverse: bool) -> Q:
+        """
+        Returns the condition on the rows following a position in the
+        ordering, or preceding it for a reverse cursor.
+        """
+        names = [order.lstrip('-') for order in self.ordering]
+        try:
+            values = [
+                model._meta.get_field(name).to_python(value)
+                for name, value in zip(names, json.loads(position), strict=True)
+            ]
+        except (TypeError, ValueError, ValidationError, FieldDoesNotExist):
+            raise NotFound(self.invalid_cursor_message)
+
+        lookups = ['lt' if order.startswith('-') != reverse else 'gt' for order in self.ordering]
+        # (a, b) < (x, y) is a < x or (a = x and b < y); the bound on the first
+        # field alone lets the database seek the index instead of scanning it
+        condition = Q(**{f'{names[0]}__{lookups[0]}e': values[0]})
+        after = Q()
+        for i in range(len(names)):
+            after |= Q(**dict(zip(names[:i], values[:i])), **{f'{names[i]}__{lookups[i]}': values[i]})
+        return condition & after
+
+    def _get_position_from_instance(self, instance, ordering):
+        return json.dumps([str(getattr(instance, order.lstrip('-'))) for order in ordering])
+
+
+class SelectablePagination(BasePagination):
+    """
+    Pagination that lets each request pick between page numbers and cursors.
+
+    Page number pagination stays the default so existing clients keep working.
+    Cursor pagination is used when the request sends ``?pagination=cursor``
+    or already carries a ``cursor`` parameter (e.g. a ``next`` link).
+    """
+    mode_query_param = 'pagination'
+    page_number_class = PageNumberPagination
+    cursor_class = CreatedAtCursorPagination
+
+    def __init__(self):
+        self.paginator = None
+
+    @property
+    def display_page_controls(self):
+        return getattr(self.paginator, 'display_page_controls', False)
+
+    def get_paginator(self, request):
+        """
+        Returns the paginator instance selected by the request parameters.
+        """
+        mode = request.query_params.get(self.mode_query_param)
+        if mode == 'cursor' or self.cursor_class.cursor_query_param in request.query_params:
+            return self.cursor_class()
+        return self.page_number_class()
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.paginator = self.get_paginator(request)
+        return self.paginator.paginate_queryset(queryset, request, view=view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return self.page_number_class().get_paginated_response_schema(schema)
+
+    def get_schema_operation_parameters(self, view):
+        return self.page_number_class().get_schema_operation_parameters(view) + [
+            {
+                'name': self.mode_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Set to "cursor" to use keyset pagination.',
+                'schema': {'type': 'string', 'enum': ['page', 'cursor']},
+            },
+        ] + self.cursor_class().get_schema_operation_parameters(view)
+
+    def to_html(self):
+        return self.paginator.to_html()
+
+
+class LookaheadPagination:
+    """
+    Page number pagination for results that can't be counted cheaply, such
+    as ranked search hits.
+
+    One extra row is fetched to know whether a next page exists, so no
+    COUNT(*) query is needed.
+    """
+    page_size = api_settings.PAGE_SIZE
+    page_query_param = 'page'
+
+    def get_page_number(self, request):
+        try:
+            page_number = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            raise NotFound('Invalid page.')
+        if page_number < 1:
+            raise NotFound('Invalid page.')
+        return page_number
+
+    def paginate(self, fetch, request):
+        """
+        Fetches one page of results.
+
+        Args:
+            fetch (Callable): Called with ``(limit, offset)``, returns a list.
+            request (Request): The current request.
+
+        Returns:
+            list: The results of the requested page.
+        """
+        self.request = request
+        self.page_number = self.get_page_number(request)
+        results = fetch(self.page_size + 1, (self.page_number - 1) * self.page_size)
+        self.has_next = len(results) > self.page_size
+        return results[:self.page_size]
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self):
+        if self.page_number == 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page_number - 1)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
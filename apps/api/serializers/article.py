@@ -3,19 +3,67 @@ from apps.api.models.article import Article
 from apps.api.serializers.comment import CommentSerializer
 from apps.api.serializers.keyword import KeywordSerializer
 from apps.api.serializers.user import UserSerializer
+from apps.api.timing import TimedSerializerMixin
 
-class ArticleSerializer(serializers.ModelSerializer):
+class ArticleSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     author = UserSerializer(read_only=True)
     keywords = KeywordSerializer(many=True, read_only=True)
     comments = CommentSerializer(many=True, read_only=True)
     class Meta:
         model = Article
-        fields = ('id', 'title', 'subtitle', 'content', 'type', 'status', 'keywords', 'author', 'created_at', 'updated_at', 'comments')
-        read_only_fields = ('author',)
+        fields = ('id', 'title', 'subtitle', 'content', 'type', 'status', 'keywords', 'author', 'comment_count', 'created_at', 'updated_at', 'comments')
+        read_only_fields = ('author', 'comment_count')
+
+class ArticleDetailSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    """
+    Article representation without embedded comments.
+
+    The detail view adds the first page of comments itself, the remaining
+    pages are served by /articles/{id}/comments/.
+    """
+    author = UserSerializer(read_only=True)
+    keywords = KeywordSerializer(many=True, read_only=True)
+    class Meta:
+        model = Article
+        fields = ('id', 'title', 'subtitle', 'content', 'type', 'status', 'keywords', 'author', 'comment_count', 'created_at', 'updated_at')
+        read_only_fields = ('author', 'comment_count')
+
+class ArticleSummarySerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    """
+    Lightweight representation used by list endpoints.
+
+    Expects the queryset from ArticleService.get_article_summaries, which
+    annotates ``excerpt`` instead of loading the full content.
+    """
+    author = UserSerializer(read_only=True)
+    keywords = KeywordSerializer(many=True, read_only=True)
+    excerpt = serializers.CharField(read_only=True)
+    comment_count = serializers.IntegerField(read_only=True)
+    class Meta:
+        model = Article
+        fields = ('id', 'title', 'subtitle', 'excerpt', 'type', 'status', 'keywords', 'author', 'comment_count', 'created_at', 'updated_at')
+
+class ArticleSearchResultSerializer(ArticleSummarySerializer):
+    """
+    Summary representation of a search hit with its rank and highlighted
+    snippet (HTML-escaped, matches wrapped in <mark>).
+    """
+    rank = serializers.FloatField(read_only=True)
+    snippet = serializers.CharField(read_only=True, allow_null=True)
+    class Meta(ArticleSummarySerializer.Meta):
+        fields = ArticleSummarySerializer.Meta.fields + ('rank', 'snippet')
+
+class ArticleRelatedSerializer(ArticleSummarySerializer):
+    """
+    Summary representation of a related article with its similarity score.
+    """
+    score = serializers.FloatField(read_only=True)
+    class Meta(ArticleSummarySerializer.Meta):
+        fields = ArticleSummarySerializer.Meta.fields + ('score',)
 
 class ArticleCreateSerializer(serializers.ModelSerializer):
     keywords = serializers.ListField(
-        child=serializers.CharField(), required=False
+        child=serializers.CharField(max_length=50), required=False
     )
     class Meta:
         model = Article
@@ -2,8 +2,9 @@ from rest_framework import serializers
 from apps.api.models.article import Article
 from apps.api.models.comment import Comment
 from apps.api.serializers.user import UserSerializer
+from apps.api.timing import TimedSerializerMixin
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     author = UserSerializer(read_only=True)
     article = serializers.PrimaryKeyRelatedField(queryset=Article.objects.all(), write_only=True)
 
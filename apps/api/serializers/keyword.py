@@ -1,7 +1,9 @@
 from rest_framework import serializers
 from apps.api.models.keyword import Keyword
+from apps.api.models.keyword_usage import KeywordUsage
+from apps.api.timing import TimedSerializerMixin
 
-class BaseKeywordSerializer(serializers.ModelSerializer):
+class BaseKeywordSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     def validate_name(self, value):
         return value.strip().lower()
     
@@ -17,4 +19,13 @@ class KeywordCreateSerializer(BaseKeywordSerializer):
         extra_kwargs = {
             'name': {'validators': []}  # Remove validação de unicidade automática
         }
-    
\ No newline at end of file
+    
+class KeywordUsageSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    id = serializers.IntegerField(source='keyword_id')
+    name = serializers.CharField(source='keyword.name')
+    articles = serializers.IntegerField(source='article_count')
+    public_articles = serializers.IntegerField(source='public_count')
+
+    class Meta:
+        model = KeywordUsage
+        fields = ('id', 'name', 'articles', 'public_articles')
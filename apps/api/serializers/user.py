@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from apps.api.timing import TimedSerializerMixin
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ('id', 'username', 'email', 'first_name', 'last_name')
@@ -14,7 +15,11 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             'password': {'write_only': True}
         }
 
-class UserDetailSerializer(serializers.ModelSerializer):
+class UserDetailSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    """
+    User representation with activity counts, read from the stored counters.
+    Select ``stats`` along with the users to serialize many of them.
+    """
     articles = serializers.SerializerMethodField()
     comments = serializers.SerializerMethodField()
 
@@ -23,7 +28,9 @@ class UserDetailSerializer(serializers.ModelSerializer):
         fields = ('id', 'username', 'email', 'first_name', 'last_name', 'articles', 'comments')
 
     def get_articles(self, obj):
-        return obj.articles.count()
+        stats = getattr(obj, 'stats', None)
+        return stats.article_count if stats else 0
 
     def get_comments(self, obj):
-        return obj.comments.count() 
\ No newline at end of file
+        stats = getattr(obj, 'stats', None)
+        return stats.comment_count if stats else 0
@@ -1,12 +1,18 @@
 from rest_framework.test import APITestCase
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from apps.api.models.article import Article
 from apps.api.models.keyword import Keyword
+from apps.api.throttling import get_store
 
 User = get_user_model()
 
 class BaseAPITestCase(APITestCase):
     def setUp(self):
+        # Limpar respostas em cache de outros testes
+        cache.clear()
+        get_store().clear()
+
         # Criar usuário de teste
         self.user = User.objects.create_user(
             username='testuser',
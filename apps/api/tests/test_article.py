@@ -1,3 +1,11 @@
+from apps.api.models.article import Article
+from apps.api.models.keyword import Keyword
+from apps.core.services.article_service import ArticleService
+from apps.core.services.comment_service import CommentService
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from apps.api.tests.base import BaseAPITestCase
 from django.urls import reverse
 from rest_framework import status
@@ -50,4 +58,265 @@ class ArticleAPITests(BaseAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         # Verify that the article was deleted
         response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_list_articles_with_cursor_pagination(self):
+        """Test paging through articles with keyset cursors"""
+        for index in range(12):
+            Article.objects.create(
+                title=f'Article {index}',
+                subtitle='Subtitle',
+                content='Content',
+                author=self.user
+            )
+        url = reverse('api:v1:article-list')
+        response = self.client.get(url, {'pagination': 'cursor'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('count', response.data)
+        self.assertEqual(len(response.data['results']), 10)
+        self.assertEqual(response.data['results'][0]['title'], 'Article 11')
+
+        # New articles must not shift the next page
+        Article.objects.create(title='Newest', subtitle='Subtitle', content='Content', author=self.user)
+        response = self.client.get(response.data['next'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [article['title'] for article in response.data['results']],
+            ['Article 1', 'Article 0', 'Test Article']
+        )
+        self.assertIsNone(response.data['next'])
+
+    def test_cursor_pagination_pages_through_equal_timestamps(self):
+        """Test that cursors page on (created_at, id), so ties are neither skipped nor repeated"""
+        for index in range(24):
+            Article.objects.create(title=f'Article {index}', subtitle='Subtitle', content='Content', author=self.user)
+        Article.objects.update(created_at=self.article.created_at)
+        expected = list(Article.objects.order_by('-id').values_list('id', flat=True))
+
+        url = reverse('api:v1:article-list')
+        pages = [self.client.get(url, {'pagination': 'cursor'}).data]
+        while pages[-1]['next']:
+            pages.append(self.client.get(pages[-1]['next']).data)
+        self.assertEqual([article['id'] for page in pages for article in page['results']], expected)
+
+        previous = self.client.get(pages[-1]['previous']).data
+        self.assertEqual(previous['results'], pages[-2]['results'])
+        self.assertIsNotNone(previous['next'])
+
+        response = self.client.get(url, {'cursor': 'cD0yMDI0LTAxLTAx'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_update_article_invalidates_cached_list(self):
+        """Test that updating an article refreshes the cached list"""
+        self.authenticate()
+        url = reverse('api:v1:article-list')
+        self.assertEqual(self.client.get(url).data['results'][0]['title'], 'Test Article')
+
+        detail_url = reverse('api:v1:article-detail', args=[self.article.id])
+        self.client.patch(detail_url, {'title': 'Renamed Article'}, format='json')
+
+        self.assertEqual(self.client.get(url).data['results'][0]['title'], 'Renamed Article')
+
+    def test_list_articles_uses_summary_representation(self):
+        """Test that the list carries comment counts instead of comments"""
+        CommentService.create_comment({'article': self.article, 'content': 'First'}, self.user)
+        CommentService.create_comment({'article': self.article, 'content': 'Second'}, self.user)
+        url = reverse('api:v1:article-list')
+
+        # page, count, keywords prefetch
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+
+        article = response.data['results'][0]
+        self.assertEqual(article['comment_count'], 2)
+        self.assertEqual(article['excerpt'], 'Test Content')
+        self.assertNotIn('comments', article)
+        self.assertNotIn('content', article)
+
+    def test_create_article_resolves_keywords_in_constant_queries(self):
+        """Test that keyword resolution does not issue queries per keyword"""
+        def create(names):
+            data = {'title': 'Tagged', 'subtitle': 'Subtitle', 'content': 'Content', 'keywords': names}
+            with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+                article = ArticleService.create_article(data, self.user)
+            return article, len(queries)
+
+        # Both share a keyword with the setUp article, so both store related articles
+        _, few_queries = create(['alpha', 'test'])
+        article, many_queries = create([f'Tag {index} ' for index in range(20)] + ['TEST', 'alpha'])
+
+        self.assertEqual(few_queries, many_queries)
+        self.assertEqual(article.keywords.count(), 22)
+        self.assertTrue(article.keywords.filter(name='tag 7').exists())
+        self.assertEqual(Keyword.objects.filter(name='test').count(), 1)
+
+    def test_unchanged_article_answers_not_modified(self):
+        """Test conditional GETs on the article detail and list"""
+        detail_url = reverse('api:v1:article-detail', args=[self.article.id])
+        list_url = reverse('api:v1:article-list')
+
+        # The validator comes from the cache versions, nothing is queried
+        for url in [detail_url, list_url]:
+            response = self.client.get(url)
+            etag = response['ETag']
+
+            with self.assertNumQueries(0):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(response['ETag'], etag)
+
+    def test_article_etag_changes_with_the_cached_body(self):
+        """Test that a new ETag always comes with a fresh body"""
+        self.authenticate()
+        detail_url = reverse('api:v1:article-detail', args=[self.article.id])
+        list_url = reverse('api:v1:article-list')
+
+        def responses():
+            return self.client.get(detail_url), self.client.get(list_url)
+
+        seen = responses()
+        response = self.client.post(
+            reverse('api:v1:comment-list'), {'content': 'First', 'article': self.article.id}, format='json'
+        )
+        detail, articles = responses()
+        self.assertNotEqual(detail['ETag'], seen[0]['ETag'])
+        self.assertNotEqual(articles['ETag'], seen[1]['ETag'])
+        self.assertEqual(detail.data['comments']['results'][0]['content'], 'First')
+        self.assertEqual(articles.data['results'][0]['comment_count'], 1)
+
+        # The old validator no longer matches
+        response = self.client.get(list_url, HTTP_IF_NONE_MATCH=seen[1]['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['comment_count'], 1)
+
+        seen = detail, articles
+        self.client.put(reverse('api:v1:keyword-detail', args=[self.keyword.id]), {'name': 'renamed'}, format='json')
+        detail, articles = responses()
+        self.assertNotEqual(detail['ETag'], seen[0]['ETag'])
+        self.assertNotEqual(articles['ETag'], seen[1]['ETag'])
+        self.assertEqual(articles.data['results'][0]['keywords'][0]['name'], 'renamed')
+
+    def test_public_feed_lists_published_public_articles(self):
+        """Test that the feed skips drafts, archived and private articles"""
+        Article.objects.create(title='Draft', subtitle='S', content='C', author=self.user)
+        Article.objects.create(
+            title='Private', subtitle='S', content='C', author=self.user,
+            type=Article.ArticleType.PUBLISHED, status=Article.ArticleStatus.PRIVATE
+        )
+        Article.objects.create(
+            title='Newest', subtitle='S', content='C', author=self.user,
+            type=Article.ArticleType.PUBLISHED, status=Article.ArticleStatus.PUBLIC
+        )
+        response = self.client.get(reverse('api:v1:article-feed'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([article['title'] for article in response.data['results']], ['Newest', 'Test Article'])
+        self.assertNotIn('count', response.data)
+
+    def test_public_feed_uses_feed_index(self):
+        """Test that the feed query plan is served by the feed index, unsorted"""
+        queryset = ArticleService.get_public_feed()[:10]
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                # Tiny test tables are cheaper to scan, plan as for a large one
+                cursor.execute('SET LOCAL enable_seqscan = off')
+            plan = queryset.explain()
+        self.assertIn('article_public_feed_idx', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_author_feed_is_paginated_in_constant_queries(self):
+        """Test that the author feed serializes articles with a fixed number of queries"""
+        self.authenticate()
+        url = reverse('api:v1:article-by-author', args=[self.user.id])
+
+        def feed():
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return response, len(queries)
+
+        _, few_queries = feed()
+        for index in range(8):
+            article = ArticleService.create_article(
+                {'title': f'Article {index}', 'subtitle': 'S', 'content': 'C', 'keywords': [f'tag {index}', 'test']},
+                self.user
+            )
+            CommentService.create_comment({'article': article, 'content': 'Hi'}, self.user)
+        response, many_queries = feed()
+
+        # author lookup, count, page, keywords and comments prefetches
+        self.assertEqual(few_queries, 5)
+        self.assertEqual(many_queries, few_queries)
+        self.assertEqual(response.data['count'], 9)
+        first = response.data['results'][0]
+        self.assertEqual((first['title'], first['content'], first['comment_count']), ('Article 7', 'C', 1))
+        self.assertEqual(first['comments'][0]['author']['username'], 'testuser')
+        self.assertEqual([keyword['name'] for keyword in first['keywords']], ['tag 7', 'test'])
+
+    def test_author_feed_is_cached_per_author(self):
+        """Test that only the author's writes invalidate their cached feed"""
+        self.authenticate()
+        other = User.objects.create_user(username='other', password='testpass123')
+        url = reverse('api:v1:article-by-author', args=[self.user.id])
+        self.client.get(url)
+
+        # Another author's writes keep the cached feed
+        self.client.force_authenticate(user=other)
+        response = self.client.post(reverse('api:v1:article-list'), {
+            'title': 'Elsewhere', 'subtitle': 'S', 'content': 'C', 'type': 1, 'status': 1
+        }, format='json')
+        self.client.post(reverse('api:v1:comment-list'), {'content': 'Hi', 'article': response.data['id']}, format='json')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url).data['count'], 1)
+
+        # A comment on one of the author's articles changes its comment count
+        self.client.post(reverse('api:v1:comment-list'), {'content': 'Hi', 'article': self.article.id}, format='json')
+        self.assertEqual(self.client.get(url).data['results'][0]['comment_count'], 1)
+
+        self.client.force_authenticate(user=self.user)
+        self.client.post(reverse('api:v1:article-list'), {
+            'title': 'Mine', 'subtitle': 'S', 'content': 'C', 'type': 1, 'status': 1
+        }, format='json')
+        self.assertEqual(self.client.get(url).data['count'], 2)
+
+    def test_user_writes_invalidate_the_articles_embedding_them(self):
+        """Test that renaming or deleting a user refreshes their articles and comments"""
+        other = User.objects.create_user(username='other', password='testpass123')
+        self.client.force_authenticate(user=other)
+        self.client.post(reverse('api:v1:comment-list'), {'content': 'Hi', 'article': self.article.id}, format='json')
+        list_url = reverse('api:v1:article-list')
+        detail_url = reverse('api:v1:article-detail', args=[self.article.id])
+        self.client.get(list_url)
+        self.client.get(detail_url)
+
+        self.client.put(reverse('api:v1:user-detail', args=[other.id]), {'username': 'renamed'}, format='json')
+        self.assertEqual(self.client.get(detail_url).data['comments']['results'][0]['author']['username'], 'renamed')
+
+        self.client.force_authenticate(user=self.user)
+        self.client.put(reverse('api:v1:user-detail', args=[self.user.id]), {'username': 'writer'}, format='json')
+        self.assertEqual(self.client.get(list_url).data['results'][0]['author']['username'], 'writer')
+
+        self.client.delete(reverse('api:v1:user-detail', args=[other.id]))
+        self.assertEqual(self.client.get(list_url).data['results'][0]['comment_count'], 0)
+        self.assertEqual(self.client.get(detail_url).data['comments']['results'], [])
+
+        self.client.delete(reverse('api:v1:user-detail', args=[self.user.id]))
+        self.assertEqual(self.client.get(list_url).data['results'], [])
+        self.assertEqual(self.client.get(detail_url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_author_feed_of_unknown_author(self):
+        """Test that unknown and malformed author IDs are not found"""
+        self.authenticate()
+        for author_id in (0, 'abc'):
+            response = self.client.get(reverse('api:v1:article-by-author', args=[author_id]))
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_author_feed_uses_author_feed_index(self):
+        """Test that the author feed query plan is served by its index, unsorted"""
+        queryset = ArticleService.get_articles_by_author(self.user.id)[:10]
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute('SET LOCAL enable_seqscan = off')
+            plan = queryset.explain()
+        self.assertIn('article_author_feed_idx', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
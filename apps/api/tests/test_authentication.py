@@ -0,0 +1,48 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from apps.api.authentication import USER_CACHE_REQUESTS
+from apps.api.tests.base import BaseAPITestCase
+from apps.core.services.user_service import UserService
+
+
+class CachedJWTAuthenticationTestCase(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        USER_CACHE_REQUESTS.reset()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+        self.url = reverse('api:v1:comment-list')
+
+    def comment(self):
+        return self.client.post(self.url, {'content': 'Hi', 'article': self.article.id}, format='json')
+
+    def cache_results(self):
+        return {key[0]: value for key, value in USER_CACHE_REQUESTS.values.items()}
+
+    def test_user_is_selected_once(self):
+        self.assertEqual(self.comment().status_code, status.HTTP_201_CREATED)
+        with self.assertNumQueries(0):
+            response = self.client.options(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.cache_results(), {'miss': 1, 'hit': 1})
+
+    def test_update_user_invalidates_the_cache(self):
+        self.comment()
+        UserService.update_user(self.user, {'username': 'renamed'})
+
+        response = self.comment()
+        self.assertEqual(response.data['author']['username'], 'renamed')
+        self.assertEqual(self.cache_results(), {'miss': 2})
+
+    def test_deactivated_and_deleted_users_are_rejected(self):
+        self.comment()
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.comment().status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.user.is_active = True
+        self.user.save()
+        self.comment()
+        UserService().delete_user(self.user)
+        self.assertEqual(self.comment().status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,62 @@
+from apps.api.models.comment import Comment
+from apps.api.tests.base import BaseAPITestCase
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+
+class CommentAPITestCase(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse('api:v1:comment-list')
+        self.authenticate()
+
+    def test_create_comment(self):
+        data = {'content': 'New comment', 'article': self.article.id}
+        response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['content'], 'New comment')
+        self.assertEqual(response.data['author']['id'], self.user.id)
+
+    def test_list_comments_with_cursor_pagination(self):
+        for index in range(3):
+            Comment.objects.create(article=self.article, author=self.user, content=f'Comment {index}')
+        response = self.client.get(self.url, {'pagination': 'cursor'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('count', response.data)
+        self.assertEqual(
+            [comment['content'] for comment in response.data['results']],
+            ['Comment 2', 'Comment 1', 'Comment 0']
+        )
+
+
+    def test_create_comment_only_invalidates_its_article(self):
+        articles_url = reverse('api:v1:article-list')
+        detail_url = reverse('api:v1:article-detail', args=[self.article.id])
+        self.client.get(articles_url)
+        self.client.get(detail_url)
+        cache.set('unrelated', 'kept')
+
+        data = {'content': 'Fresh comment', 'article': self.article.id}
+        self.client.post(self.url, data, format='json')
+
+        response = self.client.get(detail_url)
+        self.assertEqual(response.data['comments']['results'][0]['content'], 'Fresh comment')
+        self.assertEqual(cache.get('unrelated'), 'kept')
+
+    def test_article_detail_embeds_first_comment_page(self):
+        for index in range(12):
+            Comment.objects.create(article=self.article, author=self.user, content=f'Comment {index}')
+        url = reverse('api:v1:article-detail', args=[self.article.id])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['comments']['results']), 10)
+        self.assertEqual(response.data['comments']['results'][0]['content'], 'Comment 11')
+
+        next_url = response.data['comments']['next']
+        self.assertIn(reverse('api:v1:article-comments', args=[self.article.id]), next_url)
+        response = self.client.get(next_url)
+        self.assertEqual(
+            [comment['content'] for comment in response.data['results']],
+            ['Comment 1', 'Comment 0']
+        )
+        self.assertIsNone(response.data['next'])
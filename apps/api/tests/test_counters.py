@@ -0,0 +1,75 @@
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from apps.api.models.article import Article
+from apps.api.models.comment import Comment
+from apps.api.models.user_stats import UserStats
+from apps.api.serializers.user import UserDetailSerializer
+from apps.api.tests.base import BaseAPITestCase
+from apps.core.services.article_service import ArticleService
+from apps.core.services.comment_service import CommentService
+from apps.core.services.user_service import UserService
+
+class CounterTestCase(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.reader = User.objects.create_user(username='reader', password='testpass123')
+        call_command('recount_activity', stdout=StringIO())
+
+    def assertCounts(self, user, articles, comments):
+        stats = UserStats.objects.get(user=user)
+        self.assertEqual((stats.article_count, stats.comment_count), (articles, comments))
+
+    def test_comment_writes_update_counters(self):
+        self.client.force_authenticate(user=self.reader)
+        url = reverse('api:v1:comment-list')
+        response = self.client.post(url, {'content': 'Hi', 'article': self.article.id}, format='json')
+        self.client.post(url, {'content': 'Again', 'article': self.article.id}, format='json')
+
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.comment_count, 2)
+        self.assertCounts(self.reader, 0, 2)
+
+        detail = self.client.get(reverse('api:v1:article-detail', args=[self.article.id]))
+        self.assertEqual(detail.data['comment_count'], 2)
+
+        self.client.delete(reverse('api:v1:comment-detail', args=[response.data['id']]))
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.comment_count, 1)
+        self.assertCounts(self.reader, 0, 1)
+
+    def test_article_and_user_deletes_update_counters(self):
+        other = ArticleService.create_article({'title': 'Other', 'subtitle': 'S', 'content': 'C'}, self.reader)
+        CommentService.create_comment({'article': self.article, 'content': 'On yours'}, self.reader)
+        CommentService.create_comment({'article': other, 'content': 'On mine'}, self.user)
+        CommentService.create_comment({'article': other, 'content': 'Own'}, self.reader)
+        self.assertCounts(self.reader, 1, 2)
+        self.assertCounts(self.user, 1, 1)
+
+        ArticleService.delete_article(other)
+        self.assertCounts(self.reader, 0, 1)
+        self.assertCounts(self.user, 1, 0)
+
+        UserService().delete_user(self.reader)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.comment_count, 0)
+
+    def test_recount_repairs_counters(self):
+        Comment.objects.create(article=self.article, author=self.reader, content='Raw')
+        Article.objects.create(title='Raw', subtitle='S', content='C', author=self.reader)
+
+        call_command('recount_activity', stdout=StringIO())
+
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.comment_count, 1)
+        self.assertCounts(self.reader, 1, 1)
+        self.assertCounts(self.user, 1, 0)
+
+    def test_user_detail_reads_stored_counters(self):
+        users = User.objects.select_related('stats').order_by('id')
+        with self.assertNumQueries(1):
+            data = UserDetailSerializer(users, many=True).data
+
+        self.assertEqual([(user['articles'], user['comments']) for user in data], [(1, 0), (0, 0)])
+        self.assertEqual(UserService.get_user_profile(self.user)['articles_count'], 1)
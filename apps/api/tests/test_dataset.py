@@ -0,0 +1,56 @@
+import json
+import os
+import random
+import tempfile
+from io import StringIO
+from django.core.management import call_command
+from apps.api.models.article import Article
+from apps.api.models.comment import Comment
+from apps.api.models.keyword import Keyword
+from apps.api.models.related_article import RelatedArticle
+from apps.api.models.user_stats import UserStats
+from apps.api.tests.base import BaseAPITestCase
+from apps.core.services.dataset_service import DatasetService
+
+class DatasetTestCase(BaseAPITestCase):
+    def test_generate_dataset(self):
+        stats = DatasetService.generate(
+            users=5, articles=40, keywords=20, comments=100, chunk_size=15, content_words=10, seed=7
+        )
+
+        self.assertEqual(stats['users'], 5)
+        self.assertEqual(stats['articles'], 40)
+        self.assertEqual(stats['comments'], 100)
+        self.assertEqual(Comment.objects.count(), 100)
+        self.assertEqual(Keyword.objects.filter(name__startswith='tag-').count(), 20)
+        self.assertEqual(sum(Article.objects.values_list('comment_count', flat=True)), 100)
+        self.assertEqual(sum(UserStats.objects.values_list('comment_count', flat=True)), 100)
+
+    def test_generate_dataset_command_rebuilds_related_articles(self):
+        call_command(
+            'generate_dataset', users=2, articles=10, keywords=3, comments=0, content_words=5, seed=1,
+            stdout=StringIO()
+        )
+        self.assertTrue(RelatedArticle.objects.exists())
+
+    def test_zipf_sampler_favours_top_ranks(self):
+        sample = DatasetService.zipf_sampler(100, 1.1, random.Random(3))
+        draws = [index for _ in range(2000) for index in sample(1)]
+        self.assertGreater(draws.count(0), draws.count(9) * 5)
+        drawn = sample(50)
+        self.assertEqual(len(drawn), len(set(drawn)))
+
+    def test_benchmark_endpoints_saves_baseline(self):
+        DatasetService.generate(users=2, articles=5, keywords=3, comments=5, content_words=5, seed=1)
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'baseline.json')
+            call_command('benchmark_endpoints', repeat=2, filter='api: article', output=output, stdout=StringIO())
+            call_command('benchmark_endpoints', repeat=1, filter='api: article detail', compare=output, stdout=StringIO())
+            with open(output, encoding='utf-8') as stream:
+                report = json.load(stream)
+
+        result = report['results']['api: article detail']
+        self.assertEqual(result['status'], [200])
+        self.assertGreater(result['bytes'], 0)
+        self.assertLessEqual(result['p50_ms'], result['p95_ms'])
+        self.assertEqual(report['meta']['articles'], 6)
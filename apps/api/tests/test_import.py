@@ -0,0 +1,73 @@
+import io
+import json
+import tempfile
+from django.core.management import call_command
+from apps.api.models.article import Article
+from apps.api.models.comment import Comment
+from apps.api.models.keyword import Keyword
+from apps.api.models.related_article import RelatedArticle
+from apps.api.tests.base import BaseAPITestCase
+from apps.core.services.import_service import ImportService
+
+class ImportServiceTestCase(BaseAPITestCase):
+    def test_import_articles_from_ndjson(self):
+        lines = [
+            {'title': f'Imported {index}', 'subtitle': 'Legacy', 'content': 'Body', 'author': 'testuser',
+             'type': 1, 'status': 1, 'keywords': ['Legacy', 'test', f'batch {index % 2}'],
+             'comments': [{'author': 'testuser', 'content': 'Nice'}]}
+            for index in range(5)
+        ]
+        stream = io.StringIO('\n'.join(
+            [json.dumps(line) for line in lines] + ['', 'not json', json.dumps({'title': 'x', 'content': 'y', 'author': 'ghost'})]
+        ))
+
+        stats = ImportService.import_articles(stream, chunk_size=2)
+
+        self.assertEqual(stats['articles'], 5)
+        self.assertEqual(stats['comments'], 5)
+        self.assertEqual(stats['keyword_links'], 15)
+        self.assertEqual(stats['skipped'], 2)
+        self.assertEqual(Article.objects.filter(title__startswith='Imported').count(), 5)
+        self.assertEqual(Comment.objects.count(), 5)
+        self.assertEqual(Keyword.objects.filter(name='legacy').get().articles.count(), 5)
+        self.assertEqual(Keyword.objects.filter(name='test').get().articles.count(), 6)
+        self.assertEqual(set(Article.objects.filter(title__startswith='Imported').values_list('comment_count', flat=True)), {1})
+        self.assertEqual((self.user.stats.article_count, self.user.stats.comment_count), (5, 5))
+
+    def test_malformed_records_are_skipped(self):
+        valid = {'title': 'Valid', 'content': 'Body', 'author': 'testuser'}
+        lines = [
+            {**valid, 'title': 42},
+            {**valid, 'subtitle': ['not', 'text']},
+            {**valid, 'type': 7},
+            {**valid, 'status': 'public'},
+            {**valid, 'keywords': 'python'},
+            {**valid, 'keywords': ['python', 3]},
+            {**valid, 'comments': 5},
+            {**valid, 'author': ['testuser']},
+            {**valid, 'keywords': ['python'], 'comments': ['Nice', {'author': 'testuser', 'content': 1}]},
+        ]
+        stream = io.StringIO('\n'.join(json.dumps(line) for line in lines))
+
+        stats = ImportService.import_articles(stream)
+
+        self.assertEqual((stats['articles'], stats['comments'], stats['skipped']), (1, 0, 8))
+        self.assertEqual([error.split(':')[0] for error in stats['errors']], [f'line {n}' for n in range(1, 9)])
+        article = Article.objects.get(title='Valid')
+        self.assertEqual((article.type, article.status), (Article.ArticleType.DRAFT, Article.ArticleStatus.PRIVATE))
+        self.assertEqual(list(article.keywords.values_list('name', flat=True)), ['python'])
+
+    def test_import_command_rebuilds_related_articles(self):
+        record = {'title': 'Imported', 'content': 'Body', 'author': 'testuser', 'type': 1, 'status': 1,
+                  'keywords': ['test']}
+        with tempfile.NamedTemporaryFile('w', suffix='.ndjson') as stream:
+            stream.write(json.dumps(record))
+            stream.flush()
+
+            output = io.StringIO()
+            call_command('import_articles', stream.name, '--skip-related', stdout=output)
+            self.assertIn('run rebuild_related_articles', output.getvalue())
+            self.assertFalse(RelatedArticle.objects.exists())
+
+            call_command('import_articles', stream.name, stdout=io.StringIO())
+        self.assertTrue(RelatedArticle.objects.filter(article=self.article).exists())
@@ -0,0 +1,119 @@
+from apps.api.models.article import Article
+from apps.api.models.keyword import Keyword
+from apps.api.tests.base import BaseAPITestCase
+from apps.core.services.keyword_service import KeywordService
+from apps.core.services.keyword_suggest_service import KeywordIndex, KeywordSuggestService
+from apps.core.services.keyword_usage_service import KeywordUsageService
+from django.urls import reverse
+from rest_framework import status
+
+
+class KeywordIndexTestCase(BaseAPITestCase):
+    def test_lookup_ranks_by_usage_then_name(self):
+        index = KeywordIndex([(1, 'python', 5), (2, 'pytest', 9), (3, 'pyramid', 5), (4, 'django', 20)])
+        self.assertEqual([keyword['name'] for keyword in index.lookup('py')], ['pytest', 'pyramid', 'python'])
+        self.assertEqual(index.lookup('pyt', 1), [{'id': 2, 'name': 'pytest', 'usage': 9}])
+        self.assertEqual(index.lookup('rust'), [])
+
+    def test_dense_prefixes_match_a_full_ranking(self):
+        keywords = [(i, f'k{i:04d}', i % 37) for i in range(1000)]
+        index = KeywordIndex(keywords)
+        self.assertIn('k0', index.top)
+
+        index.add(1000, 'k0999x')
+        index.remove('k0036')
+        index.rename('k0035', 'k0000a')
+        keywords = [keyword for keyword in keywords if keyword[1] not in ('k0035', 'k0036')]
+        keywords += [(1000, 'k0999x', 0), (35, 'k0000a', 35)]
+        for prefix in ('', 'k', 'k0', 'k00', 'k000', 'k099', 'k0999'):
+            expected = sorted(
+                (keyword for keyword in keywords if keyword[1].startswith(prefix)),
+                key=lambda keyword: (-keyword[2], keyword[1])
+            )[:10]
+            self.assertEqual([keyword['name'] for keyword in index.lookup(prefix)],
+                             [keyword[1] for keyword in expected])
+
+    def test_prefix_grown_dense_is_ranked_once(self):
+        index = KeywordIndex([(i, f'k{i:03d}', i) for i in range(KeywordIndex.DENSE)])
+        self.assertNotIn('k', index.top)
+
+        index.add(KeywordIndex.DENSE, 'k999')
+        self.assertEqual(index.lookup('k', 2), [{'id': 127, 'name': 'k127', 'usage': 127},
+                                                {'id': 126, 'name': 'k126', 'usage': 126}])
+        self.assertEqual(len(index.top['k']), KeywordIndex.MAX_RESULTS)
+
+
+class KeywordSuggestAPITestCase(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        KeywordSuggestService._index = None
+        self.url = reverse('api:v1:keyword-suggest')
+
+        popular = Keyword.objects.create(name='testing')
+        for index in range(2):
+            article = Article.objects.create(title=f'Article {index}', content='Content', author=self.user)
+            article.keywords.add(popular)
+        Keyword.objects.create(name='tests')
+        KeywordUsageService.rebuild()
+
+    def tearDown(self):
+        KeywordSuggestService._index = None
+
+    def test_suggest_is_public_and_ranked_by_usage(self):
+        response = self.client.get(self.url, {'prefix': ' TES '})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(keyword['name'], keyword['usage']) for keyword in response.data['results']],
+            [('testing', 2), ('test', 1), ('tests', 0)]
+        )
+
+    def test_suggest_limit(self):
+        response = self.client.get(self.url, {'prefix': 'test', 'limit': 1})
+        self.assertEqual([keyword['name'] for keyword in response.data['results']], ['testing'])
+
+        response = self.client.get(self.url, {'prefix': 'test', 'limit': 'many'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_blank_prefix_returns_nothing(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['results'], [])
+
+    def test_warm_up_builds_the_index(self):
+        KeywordSuggestService.warm_up()
+        self.assertIn('testing', KeywordSuggestService._index.keywords)
+
+    def test_warm_lookup_runs_no_query(self):
+        KeywordSuggestService.warm_up()
+        with self.assertNumQueries(0):
+            self.assertEqual(len(KeywordSuggestService.suggest('t')), 3)
+
+    def test_created_keyword_is_suggested_after_commit(self):
+        KeywordSuggestService.get_index()
+        with self.captureOnCommitCallbacks(execute=True):
+            KeywordService.get_or_create_keywords(['Testbed'])
+            self.assertNotIn('testbed', [keyword['name'] for keyword in KeywordSuggestService.suggest('testb')])
+        self.assertEqual([keyword['name'] for keyword in KeywordSuggestService.suggest('testb')], ['testbed'])
+
+    def test_renamed_keyword_keeps_its_usage(self):
+        KeywordSuggestService.get_index()
+        self.authenticate()
+        keyword = Keyword.objects.get(name='testing')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.put(reverse('api:v1:keyword-detail', args=[keyword.id]), {'name': 'tested'}, format='json')
+        self.assertEqual(
+            [(keyword['name'], keyword['usage']) for keyword in KeywordSuggestService.suggest('test')],
+            [('tested', 2), ('test', 1), ('tests', 0)]
+        )
+
+    def test_renamed_and_deleted_keywords_leave_the_index(self):
+        KeywordSuggestService.get_index()
+        self.authenticate()
+        keyword = Keyword.objects.get(name='tests')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.put(reverse('api:v1:keyword-detail', args=[keyword.id]), {'name': 'quality'}, format='json')
+        self.assertEqual([keyword['name'] for keyword in KeywordSuggestService.suggest('q')], ['quality'])
+        self.assertNotIn('tests', [keyword['name'] for keyword in KeywordSuggestService.suggest('test')])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(reverse('api:v1:keyword-detail', args=[keyword.id]))
+        self.assertEqual(KeywordSuggestService.suggest('q'), [])
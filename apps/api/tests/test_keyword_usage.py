@@ -0,0 +1,85 @@
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from apps.api.models.article import Article
+from apps.api.models.keyword_usage import KeywordUsage
+from apps.api.tests.base import BaseAPITestCase
+from apps.core.services.article_service import ArticleService
+from apps.core.services.user_service import UserService
+
+class KeywordUsageTestCase(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.writer = User.objects.create_user(username='writer', password='testpass123')
+        self.url = reverse('api:v1:keyword-popular')
+        call_command('rebuild_keyword_usage', stdout=StringIO())
+
+    def create_article(self, keywords, public=True, author=None):
+        data = {'title': 'Title', 'subtitle': 'S', 'content': 'C', 'keywords': keywords}
+        if public:
+            data.update(type=Article.ArticleType.PUBLISHED, status=Article.ArticleStatus.PUBLIC)
+        return ArticleService.create_article(data, author or self.writer)
+
+    def assertUsage(self, expected):
+        self.assertEqual(
+            {usage.keyword.name: (usage.article_count, usage.public_count)
+             for usage in KeywordUsage.objects.select_related('keyword')},
+            expected
+        )
+
+    def test_article_writes_update_usage(self):
+        first = self.create_article(['test', 'django'])
+        self.create_article(['django'], public=False)
+        self.assertUsage({'test': (2, 2), 'django': (2, 1)})
+
+        self.authenticate()
+        self.client.patch(reverse('api:v1:article-detail', args=[first.id]), {'status': 0}, format='json')
+        self.assertUsage({'test': (2, 1), 'django': (2, 0)})
+
+        first.refresh_from_db()
+        ArticleService.delete_article(first)
+        self.assertUsage({'test': (1, 1), 'django': (1, 0)})
+
+        UserService().delete_user(self.writer)
+        self.assertUsage({'test': (1, 1), 'django': (0, 0)})
+
+    def test_popular_ranks_by_scope(self):
+        self.create_article(['django'])
+        self.create_article(['django', 'python'], public=False)
+        self.create_article(['python'], public=False)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(keyword['name'], keyword['articles'], keyword['public_articles']) for keyword in response.data['results']],
+            [('test', 1, 1), ('django', 2, 1)]
+        )
+
+        response = self.client.get(self.url, {'scope': 'all', 'limit': 2})
+        self.assertEqual([keyword['name'] for keyword in response.data['results']], ['django', 'python'])
+
+        self.assertEqual(self.client.get(self.url, {'scope': 'drafts'}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_popular_reads_usage_in_one_query(self):
+        for index in range(5):
+            self.create_article([f'tag {index}', 'django'])
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {'limit': 3})
+        self.assertEqual(len(response.data['results']), 3)
+
+    def test_popular_is_refreshed_by_article_writes(self):
+        self.assertEqual([keyword['name'] for keyword in self.client.get(self.url).data['results']], ['test'])
+        self.authenticate()
+        self.client.post(reverse('api:v1:article-list'), {
+            'title': 'New', 'subtitle': 'S', 'content': 'C', 'type': 1, 'status': 1, 'keywords': ['fresh', 'fresh2'],
+        }, format='json')
+        self.assertEqual(len(self.client.get(self.url).data['results']), 3)
+
+    def test_rebuild_repairs_usage(self):
+        Article.objects.create(title='Raw', content='C', author=self.writer).keywords.add(self.keyword)
+        KeywordUsage.objects.filter(keyword=self.keyword).update(article_count=40)
+
+        call_command('rebuild_keyword_usage', stdout=StringIO())
+        self.assertUsage({'test': (2, 1)})
@@ -0,0 +1,86 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from apps.api import metrics
+from apps.api.tests.base import BaseAPITestCase
+from apps.api.throttling import AnonRateThrottle
+
+
+@override_settings(METRICS_MULTIPROC_DIR='', REQUEST_TIMING_SAMPLE_RATE=1.0)
+class MetricsTestCase(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        metrics.REGISTRY.reset()
+
+    def scrape(self):
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        return response.content.decode()
+
+    def test_requests_and_cache_lookups_are_counted(self):
+        url = reverse('api:v1:article-list')
+        self.client.get(url)
+        self.client.get(url)
+
+        body = self.scrape()
+        self.assertIn('http_requests_total{view="api:v1:article-list",method="GET",status="200"} 2', body)
+        self.assertIn('http_request_duration_seconds_count{view="api:v1:article-list",method="GET"} 2', body)
+        self.assertIn('http_request_duration_seconds_bucket{view="api:v1:article-list",method="GET",le="+Inf"} 2', body)
+        self.assertIn('http_request_queries_count{view="api:v1:article-list"} 2', body)
+        self.assertIn('cache_page_requests_total{view="api:v1:article-list",result="miss"} 1', body)
+        self.assertIn('cache_page_requests_total{view="api:v1:article-list",result="hit"} 1', body)
+
+    def test_throttled_requests_are_counted(self):
+        url = reverse('api:v1:user-list')
+        with mock.patch.object(AnonRateThrottle, 'THROTTLE_RATES', {'anon': '1/min', 'user': '1/min'}):
+            self.client.get(url)
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        body = self.scrape()
+        self.assertIn('throttled_requests_total{view="api:v1:user-list"} 1', body)
+        self.assertIn('http_requests_total{view="api:v1:user-list",method="GET",status="429"} 1', body)
+
+    def test_metrics_are_restricted_to_allowed_addresses(self):
+        response = self.client.get(reverse('metrics'), REMOTE_ADDR='10.0.0.1')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_multiprocess_mode_adds_up_the_processes(self):
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.client.get(reverse('api:v1:article-list'))
+        snapshot = metrics.REGISTRY.snapshot()
+        Path(directory, 'metrics_999999_0a1b2c3d.json').write_text(json.dumps(snapshot), encoding='utf-8')
+
+        with override_settings(METRICS_MULTIPROC_DIR=directory):
+            collected = metrics.REGISTRY.collect()
+
+        requests = dict((tuple(labels), value) for labels, value in collected['http_requests_total']['samples'])
+        self.assertEqual(requests[('api:v1:article-list', 'GET', '200')], 2)
+        durations = dict((tuple(labels), value) for labels, value in collected['http_request_duration_seconds']['samples'])
+        self.assertEqual(durations[('api:v1:article-list', 'GET')][-1], 2)
+        self.assertTrue(list(Path(directory).glob('metrics_*.json')))
+
+    def test_files_of_stopped_processes_are_aggregated(self):
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.client.get(reverse('api:v1:article-list'))
+        snapshot = json.dumps(metrics.REGISTRY.snapshot())
+        # Two processes that reused the same PID, both stopped
+        Path(directory, 'metrics_999999_0a1b2c3d.json').write_text(snapshot, encoding='utf-8')
+        Path(directory, 'metrics_999999_4e5f6a7b.json').write_text(snapshot, encoding='utf-8')
+
+        with override_settings(METRICS_MULTIPROC_DIR=directory):
+            metrics.REGISTRY.collect()
+            collected = metrics.REGISTRY.collect()
+
+        requests = dict((tuple(labels), value) for labels, value in collected['http_requests_total']['samples'])
+        self.assertEqual(requests[('api:v1:article-list', 'GET', '200')], 3)
+        self.assertEqual(
+            {path.name for path in Path(directory).glob('metrics_*.json')},
+            {'metrics_aggregate.json', f'metrics_{os.getpid()}_{metrics.REGISTRY.token}.json'},
+        )
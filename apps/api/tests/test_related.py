@@ -0,0 +1,152 @@
+import random
+from unittest import mock
+from io import StringIO
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from apps.api.models.article import Article
+from apps.api.models.related_article import RelatedArticle
+from apps.api.tests.base import BaseAPITestCase
+from apps.core.services.article_service import ArticleService
+from apps.core.services.cache_service import CacheService
+from apps.core.services.related_article_service import RelatedArticleService
+
+class RelatedArticleTestCase(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        call_command('rebuild_keyword_usage', stdout=StringIO())
+
+    def create_article(self, title, keywords, public=True):
+        data = {'title': title, 'subtitle': 'S', 'content': 'C', 'keywords': keywords}
+        if public:
+            data.update(type=Article.ArticleType.PUBLISHED, status=Article.ArticleStatus.PUBLIC)
+        # Related lists are computed once the transaction commits
+        with self.captureOnCommitCallbacks(execute=True):
+            article = ArticleService.create_article(data, self.user)
+        CacheService.invalidate(CacheService.ARTICLES)
+        return article
+
+    def related_titles(self, article):
+        response = self.client.get(reverse('api:v1:article-related', args=[article.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [related['title'] for related in response.data['results']]
+
+    def stored_lists(self):
+        lists = {}
+        for entry in RelatedArticle.objects.order_by('article', '-score', '-related'):
+            lists.setdefault(entry.article_id, []).append((entry.related_id, round(entry.score, 9)))
+        return lists
+
+    def test_rare_keywords_weigh_more(self):
+        for index in range(6):
+            self.create_article(f'Filler {index}', ['python'])
+        source = self.create_article('Source', ['python', 'django', 'orm'])
+        self.create_article('Common', ['python'])
+        self.create_article('Rare', ['orm', 'sql'])
+        self.create_article('Draft', ['python', 'django', 'orm'], public=False)
+
+        titles = self.related_titles(source)
+        self.assertEqual(titles[0], 'Rare')
+        self.assertEqual(len(titles), 8)
+        self.assertNotIn('Draft', titles)
+        self.assertNotIn('Source', titles)
+
+    def test_list_is_kept_to_top_k(self):
+        source = self.create_article('Source', ['python'])
+        for index in range(RelatedArticleService.TOP_K + 3):
+            self.create_article(f'Other {index}', ['python'])
+
+        self.assertEqual(RelatedArticle.objects.filter(article=source).count(), RelatedArticleService.TOP_K)
+
+        # Equal scores go to the newest articles
+        call_command('rebuild_related_articles', stdout=StringIO())
+        CacheService.invalidate(CacheService.ARTICLES)
+        self.assertEqual(self.related_titles(source)[0], f'Other {RelatedArticleService.TOP_K + 2}')
+        self.assertEqual(self.related_titles(source)[-1], 'Other 3')
+
+    def test_unpublish_and_delete_refill_the_lists(self):
+        source = self.create_article('Source', ['python', 'django'])
+        close = self.create_article('Close', ['python', 'django'])
+        far = self.create_article('Far', ['python', 'rust', 'go'])
+        self.assertEqual(self.related_titles(source), ['Close', 'Far'])
+
+        self.authenticate()
+        detail_url = reverse('api:v1:article-detail', args=[close.id])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(detail_url, {'status': 0}, format='json')
+        self.assertEqual(self.related_titles(source), ['Far'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(detail_url, {'status': 1}, format='json')
+        self.assertEqual(self.related_titles(source), ['Close', 'Far'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(reverse('api:v1:article-detail', args=[far.id]))
+        self.assertEqual(self.related_titles(source), ['Close'])
+
+    def test_deleted_keyword_leaves_the_lists(self):
+        source = self.create_article('Source', ['python', 'django'])
+        close = self.create_article('Close', ['python', 'django'])
+        self.create_article('Far', ['django', 'rust'])
+        self.assertEqual(self.related_titles(source), ['Close', 'Far'])
+
+        self.authenticate()
+        keyword = source.keywords.get(name='django')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(reverse('api:v1:keyword-detail', args=[keyword.id]))
+        self.assertEqual(self.related_titles(source), ['Close'])
+        self.assertEqual(self.stored_lists()[source.id], [(close.id, 1.0)])
+
+    def test_a_write_refills_at_most_refresh_limit_lists(self):
+        self.enterContext(mock.patch.object(RelatedArticleService, 'TOP_K', 1))
+        sources = [self.create_article(f'Source {index}', ['python', 'django', f'own {index}']) for index in range(3)]
+        # The closest to each, so the only entry of every list
+        withdrawn = self.create_article('Withdrawn', ['python', 'django'])
+        self.assertEqual(set(RelatedArticle.objects.filter(article__in=sources).values_list('related', flat=True)),
+                         {withdrawn.id})
+
+        with mock.patch.object(RelatedArticleService, 'REFRESH_LIMIT', 1):
+            with self.captureOnCommitCallbacks(execute=True):
+                ArticleService.delete_article(withdrawn)
+
+        # The newest list is refilled, the others are left empty for rebuild
+        self.assertEqual([RelatedArticle.objects.filter(article=source).count() for source in sources], [0, 0, 1])
+
+    def test_refilling_waits_for_the_commit(self):
+        source = self.create_article('Source', ['python'])
+        other = self.create_article('Other', ['python'])
+        self.create_article('Third', ['python'])
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            ArticleService.delete_article(other)
+            # The entry is dropped at once, the list is not recomputed yet
+            self.assertEqual(RelatedArticle.objects.filter(article=source).count(), 1)
+        self.assertEqual(len(callbacks), 1)
+
+    def test_incremental_lists_match_the_batch_rebuild(self):
+        rng = random.Random(3)
+        names = [f'tag{index}' for index in range(8)]
+        for index in range(40):
+            self.create_article(f'Article {index}', rng.sample(names, rng.randint(1, 4)), public=rng.random() < 0.8)
+        # The weights drift as articles are added, refresh with the final ones
+        RelatedArticleService.refresh(Article.objects.values_list('id', flat=True))
+        incremental = self.stored_lists()
+
+        call_command('rebuild_related_articles', '--chunk-size', '7', stdout=StringIO())
+        self.assertEqual(self.stored_lists(), incremental)
+
+
+    def test_related_runs_constant_queries(self):
+        source = self.create_article('Source', ['python'])
+        self.create_article('First', ['python'])
+        with self.assertNumQueries(3):
+            self.related_titles(source)
+
+        for index in range(5):
+            self.create_article(f'More {index}', ['python', f'tag {index}'])
+        with self.assertNumQueries(3):
+            self.assertEqual(len(self.related_titles(source)), 6)
+
+    def test_unknown_article_is_not_found(self):
+        response = self.client.get(reverse('api:v1:article-related', args=[0]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
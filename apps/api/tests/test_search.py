@@ -0,0 +1,42 @@
+from apps.api.models.article import Article
+from apps.api.tests.base import BaseAPITestCase
+from django.urls import reverse
+from rest_framework import status
+
+class ArticleSearchAPITestCase(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse('api:v1:article-search')
+        self.django = Article.objects.create(
+            title='Django caching', subtitle='Performance', content='Cache the <b>rendered</b> pages.',
+            author=self.user
+        )
+        self.python = Article.objects.create(
+            title='Python tips', subtitle='Language', content='Django is written in Python.',
+            author=self.user
+        )
+
+    def test_search_ranks_title_matches_first(self):
+        response = self.client.get(self.url, {'q': 'django'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([hit['id'] for hit in response.data['results']], [self.django.id, self.python.id])
+        self.assertIn('<mark>Django</mark>', response.data['results'][1]['snippet'])
+        self.assertNotIn('content', response.data['results'][0])
+
+    def test_search_snippets_are_escaped(self):
+        response = self.client.get(self.url, {'q': 'rendered'})
+        self.assertIn('&lt;b&gt;<mark>rendered</mark>&lt;/b&gt;', response.data['results'][0]['snippet'])
+
+    def test_search_index_follows_updates_and_deletes(self):
+        self.python.title = 'Flask tips'
+        self.python.content = 'Nothing else.'
+        self.python.save()
+        self.django.delete()
+
+        self.assertEqual(self.client.get(self.url, {'q': 'django'}).data['results'], [])
+        response = self.client.get(self.url, {'q': 'flask'})
+        self.assertEqual([hit['id'] for hit in response.data['results']], [self.python.id])
+
+    def test_search_requires_query(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
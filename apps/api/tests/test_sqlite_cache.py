@@ -0,0 +1,58 @@
+import tempfile
+from pathlib import Path
+from django.test import SimpleTestCase
+from apps.core.cache.sqlite import SQLiteCache
+
+
+class SQLiteCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        self.location = str(Path(self.enterContext(tempfile.TemporaryDirectory()), 'cache.sqlite3'))
+        self.cache = self.make_cache()
+
+    def make_cache(self, **options):
+        return SQLiteCache(self.location, {'OPTIONS': options})
+
+    def test_values_are_shared_between_instances(self):
+        other = self.make_cache()
+        self.cache.set('page', {'results': [1, 2]}, 60)
+        self.cache.set_many({'a': 'x', 'b': 2})
+
+        self.assertEqual(other.get('page'), {'results': [1, 2]})
+        self.assertEqual(other.get_many(['a', 'b', 'missing']), {'a': 'x', 'b': 2})
+        self.assertFalse(other.add('a', 'y'))
+        self.assertTrue(other.delete('a'))
+        self.assertIsNone(self.cache.get('a'))
+
+        other.clear()
+        self.assertIsNone(self.cache.get('page'))
+
+    def test_incr_is_atomic_across_instances(self):
+        other = self.make_cache()
+        self.cache.set('version', 10, None)
+        self.assertEqual(other.incr('version'), 11)
+        self.assertEqual(self.cache.incr('version', 5), 16)
+        self.assertEqual(other.decr('version'), 15)
+
+        with self.assertRaises(ValueError):
+            self.cache.incr('missing')
+        self.cache.set('text', 'a')
+        with self.assertRaises(ValueError):
+            self.cache.incr('text')
+
+    def test_expired_entries_are_missing_and_replaceable(self):
+        self.cache.set('old', 'value', 0)
+        self.assertIsNone(self.cache.get('old'))
+        self.assertFalse(self.cache.has_key('old'))
+        self.assertTrue(self.cache.add('old', 'new'))
+        self.assertEqual(self.cache.get('old'), 'new')
+
+    def test_least_recently_read_entries_are_culled(self):
+        cache = self.make_cache(MAX_ENTRIES=4, CULL_FREQUENCY=2)
+        cache.ACCESS_RESOLUTION = 0
+        for index in range(4):
+            cache.set(f'key{index}', index)
+        # Reading the two oldest entries makes key2 and key3 the least recent
+        cache.get_many(['key0', 'key1'])
+        cache.set('key4', 4)
+
+        self.assertEqual(cache.get_many([f'key{index}' for index in range(5)]), {'key0': 0, 'key1': 1, 'key4': 4})
@@ -0,0 +1,42 @@
+import tempfile
+from pathlib import Path
+from unittest import mock
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from apps.api.tests.base import BaseAPITestCase
+from apps.api.throttling import AnonRateThrottle, TokenBucketStore
+
+
+class TokenBucketStoreTestCase(BaseAPITestCase):
+    def test_bucket_refills_at_the_rate(self):
+        store = TokenBucketStore(':memory:')
+        taken = [store.take('key', 3, 1.0, 100.0)[1] for _ in range(4)]
+        self.assertEqual(taken, [True, True, True, False])
+
+        self.assertEqual(store.take('key', 3, 1.0, 101.5), (0.5, True))
+        self.assertEqual(store.take('key', 3, 1.0, 101.5), (0.5, False))
+        # The bucket never holds more than its capacity
+        self.assertEqual(store.take('key', 3, 1.0, 1000.0), (2, True))
+
+    def test_stores_on_the_same_file_share_the_buckets(self):
+        path = str(Path(self.enterContext(tempfile.TemporaryDirectory()), 'throttle.sqlite3'))
+        first, second = TokenBucketStore(path), TokenBucketStore(path)
+
+        self.assertTrue(first.take('key', 2, 0.001, 100.0)[1])
+        self.assertTrue(second.take('key', 2, 0.001, 100.0)[1])
+        self.assertFalse(first.take('key', 2, 0.001, 100.0)[1])
+        self.assertEqual(second.connect().execute('SELECT count(*) FROM throttle_bucket').fetchone(), (1,))
+
+
+class ThrottleTestCase(BaseAPITestCase):
+    def test_limit_survives_cache_clear(self):
+        url = reverse('api:v1:user-list')
+        with mock.patch.object(AnonRateThrottle, 'THROTTLE_RATES', {'anon': '2/min', 'user': '2/min'}):
+            self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+            self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+            cache.clear()
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response['Retry-After'], '30')
@@ -0,0 +1,47 @@
+import json
+from django.test import override_settings
+from django.urls import reverse
+from apps.api.tests.base import BaseAPITestCase
+
+
+def parse_server_timing(header):
+    metrics = {}
+    for metric in header.split(', '):
+        name, *params = metric.split(';')
+        metrics[name] = dict(param.split('=', 1) for param in params)
+    return metrics
+
+
+@override_settings(REQUEST_TIMING_SAMPLE_RATE=1.0)
+class RequestTimingTestCase(BaseAPITestCase):
+    def test_api_response_has_server_timing(self):
+        with self.assertLogs('apps.api.timing', 'INFO') as logs:
+            response = self.client.get(reverse('api:v1:article-detail', args=[self.article.id]))
+
+        metrics = parse_server_timing(response['Server-Timing'])
+        self.assertEqual(set(metrics), {'db', 'serialize', 'api', 'total'})
+        self.assertGreater(float(metrics['serialize']['dur']), 0)
+        self.assertEqual(metrics['api']['desc'], '"0 calls"')
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record['view'], 'api:v1:article-detail')
+        self.assertEqual(record['status'], 200)
+        self.assertGreater(record['sql_count'], 0)
+        self.assertEqual(metrics['db']['desc'], f'"{record["sql_count"]} queries"')
+
+    @override_settings(API_TRANSPORT='local', API_URL='http://testserver')
+    def test_frontend_page_counts_api_calls(self):
+        with self.assertLogs('apps.api.timing', 'INFO') as logs:
+            response = self.client.get(reverse('frontend:article_detail', args=[self.article.id]))
+
+        self.assertEqual(response.status_code, 200)
+        record = json.loads(logs.records[0].getMessage())
+        self.assertGreaterEqual(record['api_count'], 1)
+        self.assertGreater(record['api_ms'], 0)
+        self.assertIn('api;dur=', response['Server-Timing'])
+
+    @override_settings(REQUEST_TIMING_SAMPLE_RATE=0)
+    def test_unsampled_requests_are_not_measured(self):
+        with self.assertNoLogs('apps.api.timing', 'INFO'):
+            response = self.client.get(reverse('api:v1:article-list'))
+        self.assertNotIn('Server-Timing', response)
@@ -0,0 +1,154 @@
+import logging
+import os
+import random
+import sqlite3
+import threading
+from typing import Tuple
+from django.conf import settings
+from rest_framework import throttling
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucketStore:
+    """
+    Token buckets kept in a SQLite database on local disk, shared by all the
+    worker processes of the host.
+
+    Each key is one row (tokens left, last update, time the bucket is full
+    again), refilled and drawn from by a single UPSERT, so a check is one
+    statement whatever the rate. The state is disposable: writes are not
+    synced to disk, and rows of full buckets are purged from time to time
+    since a full bucket is the same as a missing one.
+    """
+    PURGE_PROBABILITY = 0.001
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS throttle_bucket (
+            key TEXT PRIMARY KEY,
+            tokens REAL NOT NULL,
+            allowed INTEGER NOT NULL,
+            updated_at REAL NOT NULL,
+            full_at REAL NOT NULL
+        ) WITHOUT ROWID
+    '''
+
+    # Refills the bucket for the time elapsed, then takes a token if one is
+    # left. SET expressions all read the row as it was before the update.
+    REFILLED = 'min(:capacity, tokens + max(:now - updated_at, 0) * :rate)'
+    TAKE = f'''
+        INSERT INTO throttle_bucket (key, tokens, allowed, updated_at, full_at)
+        VALUES (:key, :capacity - 1, 1, :now, :now + 1 / :rate)
+        ON CONFLICT (key) DO UPDATE SET
+            tokens = {REFILLED} - ({REFILLED} >= 1),
+            allowed = {REFILLED} >= 1,
+            updated_at = :now,
+            full_at = :now + (:capacity - {REFILLED} + ({REFILLED} >= 1)) / :rate
+        RETURNING tokens, allowed
+    '''
+
+    def __init__(self, path: str):
+        self.path = path
+        self.local = threading.local()
+
+    def connect(self) -> sqlite3.Connection:
+        connection = getattr(self.local, 'connection', None)
+        # Connections are not shared with forked processes
+        if connection is None or self.local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=1, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=OFF')
+            connection.execute(self.SCHEMA)
+            self.local.connection, self.local.pid = connection, os.getpid()
+        return connection
+
+    def take(self, key: str, capacity: int, rate: float, now: float) -> Tuple[float, bool]:
+        """
+        Takes a token from the bucket of a key.
+
+        Args:
+            key (str): The bucket key.
+            capacity (int): Tokens in a full bucket.
+            rate (float): Tokens added per second.
+            now (float): The current time in seconds.
+
+        Returns:
+            Tuple[float, bool]: The tokens left, and whether a token was taken.
+        """
+        connection = self.connect()
+        tokens, allowed = connection.execute(
+            self.TAKE, {'key': key, 'capacity': capacity, 'rate': rate, 'now': now}
+        ).fetchone()
+        if random.random() < self.PURGE_PROBABILITY:
+            connection.execute('DELETE FROM throttle_bucket WHERE full_at <= ?', (now,))
+        return tokens, bool(allowed)
+
+    def clear(self) -> None:
+        self.connect().execute('DELETE FROM throttle_bucket')
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_store() -> TokenBucketStore:
+    """
+    Returns the store at THROTTLE_STORE_PATH, one per path and process.
+    """
+    path = str(settings.THROTTLE_STORE_PATH)
+    store = _stores.get(path)
+    if store is None:
+        with _stores_lock:
+            store = _stores.setdefault(path, TokenBucketStore(path))
+    return store
+
+
+class TokenBucketRateThrottle(throttling.SimpleRateThrottle):
+    """
+    Rate throttle backed by a token bucket in the shared TokenBucketStore
+    instead of a history of request times in the cache.
+
+    A rate of ``100/day`` is a bucket of 100 tokens refilled at 100 per day,
+    so the limit holds across worker processes and is not reset by clearing
+    the cache. If the store cannot be reached, requests are let through.
+    """
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        rate = self.num_requests / self.duration
+        try:
+            tokens, allowed = get_store().take(self.key, self.num_requests, rate, self.timer())
+        except sqlite3.Error:
+            logger.warning('Throttle store unavailable, letting the request through', exc_info=True)
+            return True
+
+        self.wait_time = None if allowed else (1 - tokens) / rate
+        return allowed
+
+    def wait(self):
+        return self.wait_time
+
+
+class AnonRateThrottle(TokenBucketRateThrottle, throttling.AnonRateThrottle):
+    pass
+
+
+class UserRateThrottle(TokenBucketRateThrottle, throttling.UserRateThrottle):
+    pass
+
+
+class SuggestRateThrottle(TokenBucketRateThrottle):
+    """
+    Throttle of the keyword suggestions, requested on every keystroke, with
+    its own ``suggest`` rate per user or, for anonymous clients, per address.
+    """
+    scope = 'suggest'
+
+    def get_cache_key(self, request, view):
+        ident = request.user.pk if request.user.is_authenticated else self.get_ident(request)
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
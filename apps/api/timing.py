@@ -0,0 +1,132 @@
+import time
+from contextvars import ContextVar, Token
+from typing import Optional, Tuple
+
+# Timings of the request being sampled in the current context, or None
+_current: ContextVar[Optional['RequestTimings']] = ContextVar('request_timings', default=None)
+# Set while a serializer is being timed, so nested serializers are not counted twice
+_serializing: ContextVar[bool] = ContextVar('request_timings_serializing', default=False)
+
+
+class RequestTimings:
+    """
+    Time spent by one request in SQL, serializers and calls to the API.
+
+    Durations are in seconds. The API time of a frontend request includes
+    the SQL and serializer time of the API views it calls in process, which
+    is counted in those totals too.
+    """
+    __slots__ = ('started', 'sql_count', 'sql_time', 'serializer_time', 'api_count', 'api_time')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.serializer_time = 0.0
+        self.api_count = 0
+        self.api_time = 0.0
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self, total: float) -> str:
+        """
+        Formats the timings as a Server-Timing header value, in milliseconds.
+        """
+        return ', '.join((
+            f'db;dur={self.sql_time * 1000:.1f};desc="{self.sql_count} queries"',
+            f'serialize;dur={self.serializer_time * 1000:.1f}',
+            f'api;dur={self.api_time * 1000:.1f};desc="{self.api_count} calls"',
+            f'total;dur={total * 1000:.1f}',
+        ))
+
+    def as_dict(self, total: float) -> dict:
+        return {
+            'sql_count': self.sql_count,
+            'sql_ms': round(self.sql_time * 1000, 2),
+            'serializer_ms': round(self.serializer_time * 1000, 2),
+            'api_count': self.api_count,
+            'api_ms': round(self.api_time * 1000, 2),
+            'total_ms': round(total * 1000, 2),
+        }
+
+
+def begin() -> Tuple[RequestTimings, Token]:
+    """
+    Starts sampling the request handled in the current context.
+
+    Returns:
+        - Tuple[RequestTimings, Token]: The timings, filled in until end() is
+          called with the token.
+    """
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def end(token: Token) -> None:
+    _current.reset(token)
+
+
+def current() -> Optional[RequestTimings]:
+    """
+    Returns the timings of the request handled in the current context, or
+    None when it is not sampled.
+    """
+    return _current.get()
+
+
+def record_api_call(duration: float) -> None:
+    """
+    Adds a call to the API to the timings of the current request, if sampled.
+    """
+    timings = _current.get()
+    if timings is not None:
+        timings.api_count += 1
+        timings.api_time += duration
+
+
+def sql_wrapper(execute, sql, params, many, context):
+    """
+    Database execute wrapper that times the queries of sampled requests.
+
+    It is installed on every connection, so requests that are not sampled
+    pay for a context variable lookup per query.
+    """
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.sql_time += time.perf_counter() - started
+        timings.sql_count += 1
+
+
+def install_sql_wrapper(sender, connection, **kwargs):
+    if sql_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(sql_wrapper)
+
+
+class TimedSerializerMixin:
+    """
+    Serializer mixin that adds the time spent in to_representation to the
+    timings of the current request.
+
+    Only the outermost serializer is timed, so the nested serializers of an
+    article (author, keywords, comments) are part of the article's time.
+    """
+    def to_representation(self, instance):
+        timings = _current.get()
+        if timings is None or _serializing.get():
+            return super().to_representation(instance)
+
+        token = _serializing.set(True)
+        started = time.perf_counter()
+        try:
+            return super().to_representation(instance)
+        finally:
+            timings.serializer_time += time.perf_counter() - started
+            _serializing.reset(token)
+
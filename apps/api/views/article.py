@@ -1,46 +1,175 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, ValidationError
 from apps.api.models.article import Article
 from apps.core.services.article_service import ArticleService
+from apps.core.services.cache_service import CacheService
+from apps.core.services.keyword_usage_service import KeywordUsageService
+from apps.core.services.related_article_service import RelatedArticleService
 from apps.core.exceptions.business_exceptions import BusinessException
-from apps.api.serializers.article import ArticleSerializer, ArticleCreateSerializer
+from apps.api.serializers.article import (
+    ArticleSerializer, ArticleCreateSerializer, ArticleDetailSerializer, ArticleSearchResultSerializer,
+    ArticleRelatedSerializer, ArticleSummarySerializer
+)
+from apps.api.serializers.comment import CommentSerializer
+from apps.api.pagination import CreatedAtCursorPagination, LookaheadPagination, SelectablePagination
+from apps.api.cache import versioned_cache_page
+from apps.api.etags import conditional_view
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.urls import reverse
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
-from django.core.cache import cache
 
-@method_decorator(cache_page(60 * 5), name='list')
+
+def article_list_namespaces(request, *args, **kwargs):
+    return [CacheService.ARTICLES]
+
+def article_namespaces(request, *args, **kwargs):
+    return [CacheService.article(kwargs['pk'])]
+
+def author_namespaces(request, *args, **kwargs):
+    # Only the writes of the author (and comments on their articles) change it
+    return [CacheService.author(kwargs['author_id'])]
+
+def related_namespaces(request, *args, **kwargs):
+    # Any article write can change the list
+    return [CacheService.ARTICLES, CacheService.article(kwargs['pk'])]
+
+@method_decorator(conditional_view(article_list_namespaces), name='list')
+@method_decorator(conditional_view(article_namespaces), name='retrieve')
+@method_decorator(conditional_view(article_namespaces), name='comments')
+@method_decorator(conditional_view(article_list_namespaces), name='feed')
+@method_decorator(versioned_cache_page(60 * 5, article_list_namespaces), name='list')
+@method_decorator(versioned_cache_page(60 * 5, article_list_namespaces), name='feed')
+@method_decorator(versioned_cache_page(60 * 5, article_list_namespaces), name='search')
+@method_decorator(versioned_cache_page(60 * 5, article_namespaces), name='retrieve')
+@method_decorator(versioned_cache_page(60 * 5, article_namespaces), name='comments')
+@method_decorator(versioned_cache_page(60 * 5, related_namespaces), name='related')
+@method_decorator(versioned_cache_page(60 * 5, author_namespaces), name='by_author')
 class ArticleViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing article operations.
     
     This viewset provides the following actions:
     - Create article (POST /articles/)
-    - Get articles by author (GET /articles/author/{author_id}/)
+    - Get articles by author, paginated (GET /articles/author/{author_id}/)
+    - List comments of an article (GET /articles/{id}/comments/)
+    - Related articles by shared keywords (GET /articles/{id}/related/)
+    - Public feed of published public articles (GET /articles/feed/)
+    - Full-text search (GET /articles/search/?q=)
+    
+    Pagination:
+    - Page numbers by default, keyset cursors with ?pagination=cursor
+
+    Conditional requests:
+    - List, feed, detail and comments send an ETag and answer If-None-Match with 304
     
     Authentication:
-    - Reading/creating/updating/deleting requires authentication
+    - List, detail, comments, related, feed and search are public
+    - Creating/updating/deleting and the author feed require authentication
     """
     
     queryset = Article.objects.all().select_related('author').prefetch_related('keywords', 'comments')
     serializer_class = ArticleSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = SelectablePagination
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['title', 'subtitle', 'status', 'type', 'author', 'keywords']
 
     def get_permissions(self):
-        if self.action in ['list', 'retrieve']:
+        if self.action in ['list', 'retrieve', 'comments', 'related', 'search', 'feed']:
             return [permissions.AllowAny()]
         return [permissions.IsAuthenticated()]
 
+    def get_queryset(self):
+        if self.action == 'list':
+            return ArticleService.get_article_summaries()
+        if self.action == 'retrieve':
+            return Article.objects.all().select_related('author').prefetch_related('keywords')
+        if self.action in ['comments', 'related']:
+            return Article.objects.all()
+        return super().get_queryset()
+
     def get_serializer_class(self):
         if self.action == 'create':
             return ArticleCreateSerializer
+        if self.action in ['list', 'feed']:
+            return ArticleSummarySerializer
+        if self.action == 'retrieve':
+            return ArticleDetailSerializer
         return ArticleSerializer
 
+    def retrieve(self, request, pk=None):
+        """
+        Retrieve an article with the first page of its comments.
+
+        Parameters:
+            - pk (int): The ID of the article to retrieve.
+
+        Returns:
+            - Response: A JSON response containing the article data. The
+              ``comments`` field holds the first page of comments and the
+              link to the next page of /articles/{id}/comments/.
+
+        Exceptions:
+            - NotFound: If the article does not exist
+        """
+        article = self.get_object()
+        data = self.get_serializer(article).data
+
+        paginator = CreatedAtCursorPagination()
+        page = paginator.paginate_queryset(ArticleService.get_article_comments(article), request, view=self)
+        paginator.base_url = request.build_absolute_uri(
+            reverse('api:v1:article-comments', args=[article.id])
+        )
+        data['comments'] = {
+            'next': paginator.get_next_link(),
+            'results': CommentSerializer(page, many=True).data,
+        }
+        return Response(data, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=['get'], url_path='comments')
+    def comments(self, request, pk=None):
+        """
+        Retrieve the comments of an article, newest first.
+
+        Parameters:
+            - pk (int): The ID of the article whose comments to retrieve.
+
+        Returns:
+            - Response: A cursor paginated JSON response with the comments.
+
+        Exceptions:
+            - NotFound: If the article does not exist
+        """
+        article = self.get_object()
+
+        paginator = CreatedAtCursorPagination()
+        page = paginator.paginate_queryset(ArticleService.get_article_comments(article), request, view=self)
+        return paginator.get_paginated_response(CommentSerializer(page, many=True).data)
+
+    @action(detail=True, methods=['get'], url_path='related')
+    def related(self, request, pk=None):
+        """
+        Retrieve the published public articles most similar to an article.
+
+        Parameters:
+            - pk (int): The ID of the article.
+
+        Returns:
+            - Response: A JSON response with up to ten articles in the summary
+              representation, each with its similarity ``score``, read from
+              the precomputed related articles.
+
+        Exceptions:
+            - NotFound: If the article does not exist
+        """
+        article = self.get_object()
+        related = ArticleService.get_related_articles(article)
+        return Response({'results': ArticleRelatedSerializer(related, many=True).data}, status=status.HTTP_200_OK)
+
     def create(self, request):
         """
         Create a new article.
@@ -61,38 +190,84 @@ class ArticleViewSet(viewsets.ModelViewSet):
 
         try:
             article = ArticleService.create_article(serializer.validated_data, user)
-            cache.clear()
+            CacheService.invalidate(CacheService.ARTICLES, CacheService.author(user.id))
             return Response(ArticleSerializer(article).data, status=status.HTTP_201_CREATED)
         except BusinessException as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    def perform_update(self, serializer):
+        was_public = KeywordUsageService.is_public(serializer.instance)
+        with transaction.atomic():
+            article = serializer.save()
+            KeywordUsageService.article_updated(article, was_public)
+            RelatedArticleService.article_updated(article, was_public)
+        CacheService.invalidate_article(article.id, article.author_id)
+
+    def perform_destroy(self, instance):
+        article_id = instance.id
+        ArticleService.delete_article(instance)
+        CacheService.invalidate_article(article_id, instance.author_id, deleted=True)
         
+    @action(detail=False, methods=['get'], url_path='feed')
+    def feed(self, request):
+        """
+        Retrieve the published public articles, newest first.
+
+        Parameters:
+            - cursor (str): The cursor of the page to retrieve.
+
+        Returns:
+            - Response: A cursor paginated JSON response with the articles in
+              the summary representation.
+        """
+        paginator = CreatedAtCursorPagination()
+        page = paginator.paginate_queryset(ArticleService.get_public_feed(), request, view=self)
+        return paginator.get_paginated_response(self.get_serializer(page, many=True).data)
+
+    @action(detail=False, methods=['get'], url_path='search')
+    def search(self, request):
+        """
+        Search articles by title, subtitle and content.
+
+        Parameters:
+            - q (str): The search terms. All of them must match.
+            - page (int): The page of results to retrieve.
+
+        Returns:
+            - Response: A paginated JSON response with the matching articles,
+              best ranked first, each with a highlighted content snippet.
+
+        Exceptions:
+            - ValidationError: If no search terms are provided
+        """
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            raise ValidationError({'q': 'This query parameter is required.'})
+
+        paginator = LookaheadPagination()
+        articles = paginator.paginate(
+            lambda limit, offset: ArticleService.search_articles(query, limit, offset), request
+        )
+        return paginator.get_paginated_response(ArticleSearchResultSerializer(articles, many=True).data)
+
     @action(detail=False, methods=['get'], url_path='author/(?P<author_id>[^/.]+)')
     def by_author(self, request, author_id=None):
         """
-        Retrieve all articles by a specific author.
+        Retrieve the articles of an author, newest first.
 
         Parameters:
             - author_id (int): The ID of the author whose articles to retrieve
+            - page (int) or cursor (str): The page to retrieve
 
         Returns:
-            - Response: A JSON response containing the author's articles
+            - Response: A paginated JSON response with the author's articles,
+              their keywords and comments
 
         Exceptions:
-            - BusinessException: If there is an error retrieving the articles
             - NotFound: If the author does not exist
         """
-        try:
-            # Get the author
-            author = User.objects.get(id=author_id)
-            
-            # Get articles by author
-            articles = ArticleService.get_articles_by_author(author)
-            
-            # Serialize and return the articles
-            serializer = self.get_serializer(articles, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-            
-        except User.DoesNotExist:
+        if not author_id.isdigit() or not User.objects.filter(id=author_id).exists():
             raise NotFound(f"Author with id {author_id} not found")
-        except BusinessException as e:
-            return Response({"error": str(e.default_detail)}, status=e.status_code)
\ No newline at end of file
+
+        page = self.paginate_queryset(ArticleService.get_articles_by_author(int(author_id)))
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
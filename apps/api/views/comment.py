@@ -1,11 +1,24 @@
 from rest_framework import viewsets, permissions, pagination
 from apps.api.models.comment import Comment
 from apps.api.serializers.comment import CommentSerializer
+from apps.api.pagination import SelectablePagination
+from apps.api.cache import versioned_cache_page
+from apps.core.services.cache_service import CacheService
+from apps.core.services.comment_service import CommentService
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
-from django.core.cache import cache
-@method_decorator(cache_page(60 * 5), name='list')
+
+
+def comment_list_namespaces(request, *args, **kwargs):
+    """
+    Comment lists filtered by article only depend on that article.
+    """
+    article_id = request.GET.get('article', '')
+    if article_id.isdigit():
+        return [CacheService.article(article_id)]
+    return [CacheService.COMMENTS]
+
+@method_decorator(versioned_cache_page(60 * 5, comment_list_namespaces), name='list')
 class CommentViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing comment operations.
@@ -13,6 +26,9 @@ class CommentViewSet(viewsets.ModelViewSet):
     This viewset provides the following actions:
     - Create comment (POST /comments/)
     
+    Pagination:
+    - Page numbers by default, keyset cursors with ?pagination=cursor
+    
     Authentication:
     - Creating/updating/deleting requires authentication
     """
@@ -20,10 +36,24 @@ class CommentViewSet(viewsets.ModelViewSet):
     queryset = Comment.objects.all().select_related('author')
     serializer_class = CommentSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = SelectablePagination
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['article', 'author', 'content']
     
 
     def perform_create(self, serializer):
-        cache.clear()
-        serializer.save(author=self.request.user)
\ No newline at end of file
+        comment = CommentService.create_comment(serializer.validated_data, self.request.user)
+        serializer.instance = comment
+        CacheService.invalidate_comment(comment.article_id, comment.article.author_id)
+
+    def perform_update(self, serializer):
+        previous_article = serializer.instance.article
+        comment = CommentService.update_comment(serializer.instance, serializer.validated_data)
+        CacheService.invalidate_comment(previous_article.id, previous_article.author_id)
+        if comment.article_id != previous_article.id:
+            CacheService.invalidate_comment(comment.article_id, comment.article.author_id)
+
+    def perform_destroy(self, instance):
+        article = instance.article
+        CommentService.delete_comment(instance)
+        CacheService.invalidate_comment(article.id, article.author_id)
\ No newline at end of file
@@ -1,23 +1,43 @@
 from rest_framework import viewsets, permissions, status, pagination
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from apps.api.models.keyword import Keyword
-from apps.api.serializers.keyword import KeywordCreateSerializer, KeywordSerializer
+from apps.api.serializers.keyword import KeywordCreateSerializer, KeywordSerializer, KeywordUsageSerializer
 from apps.core.services.keyword_service import KeywordService
+from apps.core.services.cache_service import CacheService
+from apps.core.services.keyword_suggest_service import KeywordSuggestService
+from apps.core.services.keyword_usage_service import KeywordUsageService
+from apps.core.services.related_article_service import RelatedArticleService
+from apps.api.cache import versioned_cache_page
+from apps.api.etags import conditional_view
+from apps.api.throttling import SuggestRateThrottle
 from apps.core.exceptions.business_exceptions import BusinessException
+from django.db import transaction
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
-from django.core.cache import cache
-@method_decorator(cache_page(60 * 5), name='list')
+
+
+def keyword_namespaces(request, *args, **kwargs):
+    return [CacheService.KEYWORDS]
+
+@method_decorator(conditional_view(keyword_namespaces), name='list')
+@method_decorator(conditional_view(keyword_namespaces), name='retrieve')
+@method_decorator(versioned_cache_page(60 * 5, keyword_namespaces), name='list')
+@method_decorator(versioned_cache_page(
+    60 * 5, lambda request, *args, **kwargs: [CacheService.KEYWORDS, CacheService.ARTICLES]
+), name='popular')
 class KeywordViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing keyword operations.
     
     This viewset provides the following actions:
     - Create keyword (POST /keywords/)
+    - Suggest keywords by prefix (GET /keywords/suggest/?prefix=)
+    - Most used keywords (GET /keywords/popular/)
     
     Authentication:
     - Reading/creating/updating/deleting requires authentication
+    - Suggestions and popular keywords are public
     """
     
     queryset = Keyword.objects.all()
@@ -47,8 +67,64 @@ class KeywordViewSet(viewsets.ModelViewSet):
         
         try:
             keyword = KeywordService.create_keyword(serializer.validated_data['name'])
-            cache.clear()
+            CacheService.invalidate_keyword()
             response_serializer = KeywordSerializer(keyword)
             return Response(response_serializer.data, status=status.HTTP_201_CREATED)
         except BusinessException as e:
-            return Response({"error": str(e.default_detail)}, status=e.status_code)
\ No newline at end of file
+            return Response({"error": str(e.default_detail)}, status=e.status_code)
+
+    @action(detail=False, methods=['get'], permission_classes=[permissions.AllowAny],
+            throttle_classes=[SuggestRateThrottle])
+    def suggest(self, request):
+        """
+        Suggests the most used keywords starting with ``prefix``, from the
+        in-memory keyword index (no database query per lookup).
+
+        Query parameters:
+            prefix: The typed text.
+            limit: Maximum number of suggestions (1 to 10, default 10).
+        """
+        prefix = request.query_params.get('prefix', '')
+        try:
+            limit = min(max(int(request.query_params.get('limit', 10)), 1), 10)
+        except ValueError:
+            return Response({'error': 'limit must be an integer.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({'prefix': prefix, 'results': KeywordSuggestService.suggest(prefix, limit)})
+
+    @action(detail=False, methods=['get'], permission_classes=[permissions.AllowAny])
+    def popular(self, request):
+        """
+        Retrieves the most used keywords with their article counts, read from
+        the materialized KeywordUsage table.
+
+        Query parameters:
+            limit: Number of keywords (1 to 100, default 20).
+            scope: ``public`` to rank by published public articles (default),
+                ``all`` to rank by every article.
+        """
+        scope = request.query_params.get('scope', 'public')
+        if scope not in ('public', 'all'):
+            return Response({'error': 'scope must be public or all.'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            limit = min(max(int(request.query_params.get('limit', 20)), 1), 100)
+        except ValueError:
+            return Response({'error': 'limit must be an integer.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        usage = KeywordUsageService.get_popular(limit, public=scope == 'public')
+        return Response({'scope': scope, 'results': KeywordUsageSerializer(usage, many=True).data})
+
+    def perform_update(self, serializer):
+        old_name = serializer.instance.name
+        keyword = serializer.save()
+        CacheService.invalidate_keyword(keyword.articles.values_list('id', 'author_id'))
+        if keyword.name != old_name:
+            KeywordSuggestService.keyword_renamed(old_name, keyword)
+
+    def perform_destroy(self, instance):
+        articles = list(instance.articles.values_list('id', 'author_id'))
+        with transaction.atomic():
+            RelatedArticleService.keyword_deleted(instance)
+            instance.delete()
+        CacheService.invalidate_keyword(articles)
+        KeywordSuggestService.keyword_removed(instance.name)
\ No newline at end of file
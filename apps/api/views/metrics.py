@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.views.decorators.http import require_GET
+from apps.api import metrics
+
+
+@require_GET
+def metrics_view(request):
+    """
+    Serves the metrics of all worker processes in the Prometheus text
+    exposition format, to the addresses in METRICS_ALLOWED_IPS (or anyone
+    when it is empty).
+    """
+    allowed = settings.METRICS_ALLOWED_IPS
+    if allowed and request.META.get('REMOTE_ADDR') not in allowed:
+        return HttpResponseForbidden()
+
+    return HttpResponse(
+        metrics.render(metrics.REGISTRY.collect()),
+        content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
@@ -2,6 +2,7 @@ from rest_framework import viewsets, permissions, status, pagination
 from rest_framework.response import Response
 from django.contrib.auth import get_user_model
 from rest_framework.exceptions import ValidationError, NotFound, PermissionDenied
+from apps.core.services.cache_service import CacheService
 from apps.core.services.user_service import UserService
 from apps.core.exceptions.business_exceptions import BusinessException
 from apps.api.serializers.user import UserSerializer, UserRegistrationSerializer
@@ -89,6 +90,7 @@ class UserViewSet(viewsets.ModelViewSet):
         if serializer.is_valid():
             try:
                 updated_user = UserService.update_user(user, serializer.validated_data)
+                CacheService.invalidate_user(updated_user.id, UserService.get_embedding_articles(updated_user))
                 return Response(self.get_serializer(updated_user).data, status=status.HTTP_200_OK)
             except BusinessException as e:
                 raise ValidationError({'error': str(e)})
@@ -119,7 +121,10 @@ class UserViewSet(viewsets.ModelViewSet):
             if not user:
                 raise NotFound('User not found')
 
+            user_id = user.id
+            articles = UserService.get_embedding_articles(user)
             UserService.delete_user(self, user)
+            CacheService.invalidate_user(user_id, articles)
             return Response(status=status.HTTP_204_NO_CONTENT)
         except BusinessException as e:
             raise ValidationError({'error': str(e)})
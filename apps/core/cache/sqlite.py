@@ -0,0 +1,193 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+# SQLite integers are 64-bit signed
+INTEGER_RANGE = range(-2 ** 63, 2 ** 63)
+
+
+class SQLiteCache(BaseCache):
+    """
+    Cache backend stored in a SQLite database in WAL mode, shared by all
+    the worker processes of the host.
+
+    LOCATION is the database path. Integers are stored as SQLite integers,
+    so ``incr`` is a single atomic UPDATE; other values are pickled. Past
+    MAX_ENTRIES, expired entries are removed first, then the least recently
+    read 1/CULL_FREQUENCY of the entries. The entries are counted once every
+    1% of MAX_ENTRIES writes of a process, which bounds how far the cache can
+    go past its size. The last read time is written at most every
+    ACCESS_RESOLUTION seconds per entry, so hot reads rarely write.
+    """
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+    ACCESS_RESOLUTION = 1.0
+
+    SCHEMA = (
+        '''
+        CREATE TABLE IF NOT EXISTS cache_entry (
+            key TEXT PRIMARY KEY,
+            value BLOB NOT NULL,
+            expires REAL,
+            accessed REAL NOT NULL
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS cache_entry_accessed ON cache_entry (accessed)',
+    )
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        self.location = location
+        self.local = threading.local()
+        self.cull_every = max(self._max_entries // 100, 1)
+        self.writes = 0
+
+    def connect(self) -> sqlite3.Connection:
+        connection = getattr(self.local, 'connection', None)
+        # Connections are not shared with forked processes
+        if connection is None or self.local.pid != os.getpid():
+            connection = sqlite3.connect(self.location, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            for statement in self.SCHEMA:
+                connection.execute(statement)
+            self.local.connection, self.local.pid = connection, os.getpid()
+        return connection
+
+    def encode(self, value):
+        if type(value) is int and value in INTEGER_RANGE:
+            return value
+        return pickle.dumps(value, self.pickle_protocol)
+
+    @staticmethod
+    def decode(value):
+        return value if isinstance(value, int) else pickle.loads(value)
+
+    def get(self, key, default=None, version=None):
+        return self.get_many([key], version).get(key, default)
+
+    def get_many(self, keys, version=None):
+        key_map = {self.make_and_validate_key(key, version=version): key for key in keys}
+        if not key_map:
+            return {}
+
+        now = time.time()
+        connection = self.connect()
+        rows = connection.execute(
+            f'SELECT key, value, accessed FROM cache_entry WHERE key IN ({", ".join("?" * len(key_map))}) '
+            'AND (expires IS NULL OR expires > ?)',
+            [*key_map, now]
+        ).fetchall()
+
+        stale = [key for key, _, accessed in rows if accessed < now - self.ACCESS_RESOLUTION]
+        if stale:
+            connection.execute(
+                f'UPDATE cache_entry SET accessed = ? WHERE key IN ({", ".join("?" * len(stale))})',
+                [now, *stale]
+            )
+        return {key_map[key]: self.decode(value) for key, value, _ in rows}
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.set_many({key: value}, timeout, version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        if not data:
+            return []
+
+        now = time.time()
+        expires = self.get_backend_timeout(timeout)
+        connection = self.connect()
+        connection.executemany(
+            'INSERT INTO cache_entry (key, value, expires, accessed) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT (key) DO UPDATE SET '
+            'value = excluded.value, expires = excluded.expires, accessed = excluded.accessed',
+            [(self.make_and_validate_key(key, version=version), self.encode(value), expires, now)
+             for key, value in data.items()]
+        )
+        self._cull(connection, now, len(data))
+        return []
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        connection = self.connect()
+        # Replaces the entry only if it has expired
+        cursor = connection.execute(
+            'INSERT INTO cache_entry (key, value, expires, accessed) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT (key) DO UPDATE SET '
+            'value = excluded.value, expires = excluded.expires, accessed = excluded.accessed '
+            'WHERE cache_entry.expires IS NOT NULL AND cache_entry.expires <= ?',
+            (key, self.encode(value), self.get_backend_timeout(timeout), now, now)
+        )
+        if cursor.rowcount:
+            self._cull(connection, now)
+        return bool(cursor.rowcount)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        cursor = self.connect().execute(
+            'UPDATE cache_entry SET expires = ? WHERE key = ? AND (expires IS NULL OR expires > ?)',
+            (self.get_backend_timeout(timeout), key, time.time())
+        )
+        return bool(cursor.rowcount)
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        row = self.connect().execute(
+            'UPDATE cache_entry SET value = value + ? '
+            "WHERE key = ? AND typeof(value) = 'integer' AND (expires IS NULL OR expires > ?) "
+            'RETURNING value',
+            (delta, key, time.time())
+        ).fetchone()
+        if row is None:
+            raise ValueError("Key '%s' not found" % key)
+        return row[0]
+
+    def has_key(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self.connect().execute(
+            'SELECT 1 FROM cache_entry WHERE key = ? AND (expires IS NULL OR expires > ?)',
+            (key, time.time())
+        ).fetchone() is not None
+
+    def delete(self, key, version=None):
+        return self.delete_many([key], version)
+
+    def delete_many(self, keys, version=None):
+        keys = [self.make_and_validate_key(key, version=version) for key in keys]
+        if not keys:
+            return False
+        cursor = self.connect().execute(
+            f'DELETE FROM cache_entry WHERE key IN ({", ".join("?" * len(keys))})', keys
+        )
+        return bool(cursor.rowcount)
+
+    def clear(self):
+        self.connect().execute('DELETE FROM cache_entry')
+
+    def _cull(self, connection, now, writes=1):
+        self.writes += writes
+        if self.writes < self.cull_every:
+            return
+        self.writes = 0
+
+        count = connection.execute('SELECT count(*) FROM cache_entry').fetchone()[0]
+        if count <= self._max_entries:
+            return
+
+        count -= connection.execute('DELETE FROM cache_entry WHERE expires <= ?', (now,)).rowcount
+        if count <= self._max_entries:
+            return
+        if self._cull_frequency == 0:
+            connection.execute('DELETE FROM cache_entry')
+            return
+        connection.execute(
+            'DELETE FROM cache_entry WHERE key IN (SELECT key FROM cache_entry ORDER BY accessed LIMIT ?)',
+            (count // self._cull_frequency,)
+        )
+
+    def close(self, **kwargs):
+        # Connections are kept open per thread for the life of the process
+        pass
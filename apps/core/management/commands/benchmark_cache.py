@@ -0,0 +1,64 @@
+import os
+import tempfile
+import time
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand
+from apps.core.cache.sqlite import SQLiteCache
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmarks the SQLite cache backend against LocMemCache and FileBasedCache, '
+        'reporting the mean time of set, get, get_many and incr operations.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--operations', type=int, default=5000, help='Operations per test (default: 5000).')
+        parser.add_argument('--keys', type=int, default=500, help='Distinct keys (default: 500).')
+        parser.add_argument(
+            '--value-size', type=int, default=8192,
+            help='Size in bytes of the cached values, about a cached API page (default: 8192).'
+        )
+        parser.add_argument('--max-entries', type=int, default=10000, help='MAX_ENTRIES of every backend.')
+
+    def get_backends(self, directory, max_entries):
+        params = {'OPTIONS': {'MAX_ENTRIES': max_entries}}
+        return [
+            ('locmem', LocMemCache('benchmark', params)),
+            ('file', FileBasedCache(os.path.join(directory, 'file'), params)),
+            ('sqlite', SQLiteCache(os.path.join(directory, 'cache.sqlite3'), params)),
+        ]
+
+    def measure(self, operation, count):
+        started = time.perf_counter()
+        for index in range(count):
+            operation(index)
+        return (time.perf_counter() - started) / count * 1_000_000
+
+    def handle(self, *args, **options):
+        count, keys = options['operations'], options['keys']
+        value = {'results': 'x' * options['value_size']}
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.stdout.write(f"{'backend':<10} {'set us':>10} {'get us':>10} {'get_many us':>12} {'incr us':>10}")
+            for name, cache in self.get_backends(directory, options['max_entries']):
+                cache.clear()
+                cache.set('counter', 0, None)
+                results = [
+                    self.measure(lambda index: cache.set(f'key{index % keys}', value), count),
+                    self.measure(lambda index: cache.get(f'key{index % keys}'), count),
+                    self.measure(
+                        lambda index: cache.get_many([f'key{(index + offset) % keys}' for offset in range(10)]),
+                        max(count // 10, 1)
+                    ),
+                    self.measure(lambda index: cache.incr('counter'), count),
+                ]
+                self.stdout.write(f'{name:<10} ' + ' '.join(
+                    f'{result:>{width}.1f}' for result, width in zip(results, (10, 10, 12, 10))
+                ))
+                cache.clear()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Mean of {count} operations over {keys} keys of {options['value_size']} bytes."
+        ))
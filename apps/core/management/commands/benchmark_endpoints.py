@@ -0,0 +1,168 @@
+import json
+import statistics
+import time
+from datetime import datetime, timezone
+from urllib.parse import quote
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.throttling import SimpleRateThrottle
+from rest_framework_simplejwt.tokens import AccessToken
+from apps.api.models.article import Article
+from apps.api.models.comment import Comment
+from apps.api.models.keyword import Keyword
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmarks every /api/v1/ endpoint and frontend page against the current database and reports '
+        'p50/p95 latency, SQL query count and response size, optionally saved as a JSON baseline.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=20, help='Requests per endpoint (default: 20).')
+        parser.add_argument(
+            '--cold', action='store_true',
+            help='Clear the cache before every request, to measure uncached responses.'
+        )
+        parser.add_argument(
+            '--with-throttling', action='store_true',
+            help='Keep the API throttles, which otherwise reject most benchmark requests.'
+        )
+        parser.add_argument('--filter', default='', help='Only run the endpoints whose name contains this text.')
+        parser.add_argument('--output', help='Save the results to this JSON file.')
+        parser.add_argument('--compare', help='Compare the results with a JSON baseline saved by --output.')
+
+    def get_endpoints(self):
+        article = Article.objects.public_feed().first() or Article.objects.order_by('-comment_count').first()
+        if article is None:
+            raise CommandError('No articles found, run generate_dataset first.')
+        busiest = Article.objects.order_by('-comment_count').first()
+        keyword = Keyword.objects.first()
+        term = article.title.split()[0]
+        prefix = quote(keyword.name[:2]) if keyword else 'a'
+        deep_page = max(Article.objects.count() // settings.REST_FRAMEWORK['PAGE_SIZE'] // 2, 1)
+
+        return [
+            ('api: article list', '/api/v1/articles/', False),
+            ('api: article list deep page', f'/api/v1/articles/?page={deep_page}', False),
+            ('api: article list cursor', '/api/v1/articles/?pagination=cursor', False),
+            ('api: article feed', '/api/v1/articles/feed/', False),
+            ('api: article detail', f'/api/v1/articles/{article.id}/', False),
+            ('api: article detail busiest', f'/api/v1/articles/{busiest.id}/', False),
+            ('api: article comments', f'/api/v1/articles/{busiest.id}/comments/', False),
+            ('api: article related', f'/api/v1/articles/{article.id}/related/', False),
+            ('api: article search', f'/api/v1/articles/search/?q={term}', False),
+            ('api: articles by author', f'/api/v1/articles/author/{article.author_id}/', True),
+            ('api: articles by keyword', f'/api/v1/articles/?keywords={keyword.id}' if keyword else '/api/v1/articles/', False),
+            ('api: keyword list', '/api/v1/keywords/', True),
+            ('api: keyword suggest', f'/api/v1/keywords/suggest/?prefix={prefix}', False),
+            ('api: keyword popular', '/api/v1/keywords/popular/', False),
+            ('api: comment list', '/api/v1/comments/', True),
+            ('api: comment list by article', f'/api/v1/comments/?article={busiest.id}', True),
+            ('api: user list', '/api/v1/users/', False),
+            ('page: home', '/', False),
+            ('page: article list', '/article/', False),
+            ('page: article detail', f'/article/{article.id}/', False),
+            ('page: article detail busiest', f'/article/{busiest.id}/', False),
+        ]
+
+    def run_endpoint(self, client, path, headers, repeat, cold):
+        timings, queries, sizes, statuses = [], [], [], set()
+        for _ in range(repeat):
+            if cold:
+                cache.clear()
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                response = client.get(path, headers=headers)
+                content = response.content
+                timings.append((time.perf_counter() - started) * 1000)
+            queries.append(len(captured))
+            sizes.append(len(content))
+            statuses.add(response.status_code)
+
+        percentiles = statistics.quantiles(timings, n=100, method='inclusive') if len(timings) > 1 else timings * 99
+        return {
+            'path': path,
+            'status': sorted(statuses),
+            'p50_ms': round(percentiles[49], 2),
+            'p95_ms': round(percentiles[94], 2),
+            'mean_ms': round(statistics.fmean(timings), 2),
+            'queries': max(queries),
+            'bytes': max(sizes),
+        }
+
+    def compare(self, results, baseline):
+        self.stdout.write(f"\n{'endpoint':<34} {'p50 ms':>18} {'p95 ms':>18} {'queries':>10} {'bytes':>16}")
+        for name, result in results.items():
+            before = baseline.get(name)
+            if before is None:
+                continue
+
+            def delta(field, precision=1):
+                old, new = before[field], result[field]
+                change = f'{(new - old) / old * 100:+.0f}%' if old else 'n/a'
+                return f'{old:.{precision}f}->{new:.{precision}f} {change}'
+
+            self.stdout.write(
+                f"{name:<34} {delta('p50_ms'):>18} {delta('p95_ms'):>18} "
+                f"{before['queries']:>4}->{result['queries']:<4} {before['bytes']:>7}->{result['bytes']:<7}"
+            )
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options['compare']:
+            with open(options['compare'], encoding='utf-8') as stream:
+                baseline = json.load(stream)['results']
+
+        user = User.objects.order_by('id').first()
+        if user is None:
+            raise CommandError('No users found, run generate_dataset first.')
+        auth_headers = {'Authorization': f'Bearer {AccessToken.for_user(user)}'}
+
+        throttle_rates = dict(SimpleRateThrottle.THROTTLE_RATES)
+        if not options['with_throttling']:
+            SimpleRateThrottle.THROTTLE_RATES.update({scope: None for scope in throttle_rates})
+
+        results = {}
+        try:
+            with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+                client = Client()
+                for name, path, authenticated in self.get_endpoints():
+                    if options['filter'] not in name:
+                        continue
+                    result = self.run_endpoint(
+                        client, path, auth_headers if authenticated else {}, options['repeat'], options['cold']
+                    )
+                    results[name] = result
+                    self.stdout.write(
+                        f"{name:<34} p50 {result['p50_ms']:>8.1f} ms  p95 {result['p95_ms']:>8.1f} ms  "
+                        f"{result['queries']:>3} queries  {result['bytes']:>8} bytes  {result['status']}"
+                    )
+        finally:
+            SimpleRateThrottle.THROTTLE_RATES.update(throttle_rates)
+
+        if baseline is not None:
+            self.compare(results, baseline)
+
+        if options['output']:
+            report = {
+                'meta': {
+                    'created_at': datetime.now(timezone.utc).isoformat(),
+                    'repeat': options['repeat'],
+                    'cold': options['cold'],
+                    'database': connection.vendor,
+                    'articles': Article.objects.count(),
+                    'comments': Comment.objects.count(),
+                    'keywords': Keyword.objects.count(),
+                    'users': User.objects.count(),
+                },
+                'results': results,
+            }
+            with open(options['output'], 'w', encoding='utf-8') as stream:
+                json.dump(report, stream, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Saved {len(results)} results to {options['output']}."))
@@ -0,0 +1,58 @@
+import time
+from unittest import mock
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+from rest_framework.throttling import SimpleRateThrottle
+
+USERNAME_PREFIX = 'bench_login_'
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmarks the frontend login and registration pages, reporting their throughput '
+        'and the number of password hashes computed per request.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=20, help='Logins and registrations to run (default: 20).')
+        parser.add_argument('--password', default='bench-Password-1', help='Password of the benchmark users.')
+
+    def run_flow(self, name, count, post):
+        hasher = type(get_hasher())
+        with mock.patch.object(hasher, 'encode', autospec=True, side_effect=hasher.encode) as encode:
+            started = time.perf_counter()
+            statuses = {post(index).status_code for index in range(count)}
+            elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f'{name:<10} {count / elapsed:>8.1f} req/s  {elapsed / count * 1000:>8.1f} ms/req  '
+            f'{encode.call_count / count:>4.1f} {hasher.algorithm} hashes/req  {sorted(statuses)}'
+        )
+
+    def handle(self, *args, **options):
+        count, password = options['requests'], options['password']
+        User.objects.filter(username__startswith=USERNAME_PREFIX).delete()
+        User.objects.create_user(username=f'{USERNAME_PREFIX}user', password=password)
+
+        def login(index):
+            return Client().post('/login/', {'username': f'{USERNAME_PREFIX}user', 'password': password})
+
+        def register(index):
+            return Client().post('/register/', {
+                'username': f'{USERNAME_PREFIX}{index}', 'email': f'{USERNAME_PREFIX}{index}@example.com',
+                'first_name': 'Bench', 'last_name': 'User', 'password': password, 'password_confirm': password,
+            })
+
+        # Throttling would reject most of the benchmark requests
+        throttle_rates = dict(SimpleRateThrottle.THROTTLE_RATES)
+        SimpleRateThrottle.THROTTLE_RATES.update({scope: None for scope in throttle_rates})
+        try:
+            with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+                self.run_flow('login', count, login)
+                self.run_flow('register', count, register)
+        finally:
+            SimpleRateThrottle.THROTTLE_RATES.update(throttle_rates)
+            User.objects.filter(username__startswith=USERNAME_PREFIX).delete()
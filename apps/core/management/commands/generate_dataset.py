@@ -0,0 +1,73 @@
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from apps.core.services.dataset_service import DatasetService
+
+
+class Command(BaseCommand):
+    help = 'Generates synthetic users, keywords, articles and comments with bulk inserts, for benchmarking.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000, help='Number of users (default: 1000).')
+        parser.add_argument('--articles', type=int, default=10000, help='Number of articles (default: 10000).')
+        parser.add_argument('--keywords', type=int, default=500, help='Number of distinct keywords (default: 500).')
+        parser.add_argument('--comments', type=int, default=50000, help='Total number of comments (default: 50000).')
+        parser.add_argument(
+            '--keywords-per-article', type=int, default=3,
+            help='Keywords drawn for each article (default: 3).'
+        )
+        parser.add_argument(
+            '--zipf-exponent', type=float, default=1.1,
+            help='Skew of the keyword popularity, higher is more skewed (default: 1.1).'
+        )
+        parser.add_argument(
+            '--content-words', type=int, default=200,
+            help='Words in the content of each article (default: 200).'
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=5000,
+            help='Number of articles written per transaction (default: 5000).'
+        )
+        parser.add_argument('--seed', type=int, default=None, help='Seed for a reproducible dataset.')
+        parser.add_argument(
+            '--password', default='benchmark',
+            help='Password of every generated user (default: benchmark).'
+        )
+        parser.add_argument(
+            '--skip-related', action='store_true',
+            help='Do not rebuild the related articles afterwards; run rebuild_related_articles later.'
+        )
+
+    def handle(self, *args, **options):
+        def progress(stats, elapsed):
+            rows = stats['articles'] + stats['comments'] + stats['keyword_links']
+            self.stdout.write(
+                f"{stats['articles']} articles, {stats['comments']} comments, "
+                f"{stats['keyword_links']} keyword links "
+                f"({rows / elapsed if elapsed else 0:.0f} rows/s)"
+            )
+
+        stats = DatasetService.generate(
+            users=options['users'],
+            articles=options['articles'],
+            keywords=options['keywords'],
+            comments=options['comments'],
+            keywords_per_article=options['keywords_per_article'],
+            zipf_exponent=options['zipf_exponent'],
+            content_words=options['content_words'],
+            chunk_size=options['chunk_size'],
+            seed=options['seed'],
+            password=options['password'],
+            progress=progress,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {stats['users']} users, {stats['keywords']} keywords, {stats['articles']} articles, "
+            f"{stats['keyword_links']} keyword links and {stats['comments']} comments."
+        ))
+
+        # Generated articles are not tracked incrementally in the related lists
+        if options['skip_related']:
+            self.stdout.write(self.style.WARNING(
+                'Related articles are out of date: run rebuild_related_articles.'
+            ))
+        else:
+            call_command('rebuild_related_articles', stdout=self.stdout, stderr=self.stderr)
@@ -0,0 +1,51 @@
+import sys
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from apps.core.services.import_service import ImportService
+
+
+class Command(BaseCommand):
+    help = 'Streams articles, keywords and comments from an NDJSON file into the database.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Path of the NDJSON file to import, or - to read from stdin.')
+        parser.add_argument(
+            '--chunk-size', type=int, default=1000,
+            help='Number of articles written per transaction (default: 1000).'
+        )
+        parser.add_argument(
+            '--skip-related', action='store_true',
+            help='Do not rebuild the related articles afterwards; run rebuild_related_articles later.'
+        )
+
+    def handle(self, *args, **options):
+        def progress(stats, elapsed):
+            rows = stats['articles'] + stats['comments'] + stats['keyword_links']
+            self.stdout.write(
+                f"{stats['articles']} articles, {stats['comments']} comments, "
+                f"{stats['keyword_links']} keyword links, {stats['skipped']} skipped "
+                f"({rows / elapsed if elapsed else 0:.0f} rows/s)"
+            )
+
+        if options['path'] == '-':
+            stats = ImportService.import_articles(sys.stdin, options['chunk_size'], progress)
+        else:
+            with open(options['path'], encoding='utf-8') as stream:
+                stats = ImportService.import_articles(stream, options['chunk_size'], progress)
+
+        for error in stats['errors']:
+            self.stderr.write(error)
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {stats['articles']} articles and {stats['comments']} comments "
+            f"({stats['skipped']} lines skipped)."
+        ))
+
+        # Imported articles are not tracked incrementally in the related lists
+        if not stats['articles']:
+            return
+        if options['skip_related']:
+            self.stdout.write(self.style.WARNING(
+                'Related articles are out of date: run rebuild_related_articles.'
+            ))
+        else:
+            call_command('rebuild_related_articles', stdout=self.stdout, stderr=self.stderr)
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.core.services.cache_service import CacheService
+from apps.core.services.keyword_usage_service import KeywordUsageService
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the usage counts of every keyword from the article-keyword links.'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            keywords = KeywordUsageService.rebuild()
+        CacheService.invalidate(CacheService.KEYWORDS)
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt the usage of {keywords} keywords.'))
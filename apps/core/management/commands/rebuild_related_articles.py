@@ -0,0 +1,25 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.core.services.cache_service import CacheService
+from apps.core.services.related_article_service import RelatedArticleService
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the related articles of every article from their keywords. Requires numpy and scipy.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size', type=int, default=1000,
+            help='Articles scored per sparse matrix product (default: 1000).'
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        with transaction.atomic():
+            stored = RelatedArticleService.rebuild(options['chunk_size'])
+        CacheService.invalidate(CacheService.ARTICLES)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Stored {stored} related articles in {time.monotonic() - started:.1f}s.'
+        ))
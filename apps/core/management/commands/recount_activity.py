@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.core.services.cache_service import CacheService
+from apps.core.services.counter_service import CounterService
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the comment count of every article and the activity counters of every user.'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            updated = CounterService.recount()
+        CacheService.invalidate(CacheService.ARTICLES, CacheService.COMMENTS)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Recounted {updated['articles']} articles and {updated['users']} users."
+        ))
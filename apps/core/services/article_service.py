@@ -1,25 +1,119 @@
 from apps.api.models.article import Article
+from apps.api.models.comment import Comment
 from typing import Dict, List
 from django.contrib.auth.models import User
-from apps.api.serializers.keyword import KeywordCreateSerializer
+from django.db import transaction
+from django.db.models import F, Prefetch, QuerySet
+from django.db.models.functions import Substr
+from apps.core.services.counter_service import CounterService
 from apps.core.services.keyword_service import KeywordService
+from apps.core.services.keyword_usage_service import KeywordUsageService
+from apps.core.services.related_article_service import RelatedArticleService
+from apps.core.services.search_service import SearchService
 
 class ArticleService:
     """
     Service class for managing articles.
     """
+    EXCERPT_LENGTH = 200
+
     @staticmethod
-    def get_articles_by_author(author: User) -> List[Article]:
+    def get_article_summaries() -> QuerySet:
         """
-        Retrieves all articles by a specific author.
-        
+        Retrieves articles prepared for the summary (list) representation.
+
+        Only an excerpt of the content is loaded, and the comment count is
+        read from the stored counter instead of loading every comment.
+
+        Returns:
+            QuerySet: Articles annotated with ``excerpt``.
+        """
+        return Article.objects.select_related('author').prefetch_related('keywords').defer('content').annotate(
+            excerpt=Substr('content', 1, ArticleService.EXCERPT_LENGTH),
+        )
+
+    @staticmethod
+    def get_public_feed() -> QuerySet:
+        """
+        Retrieves the published public articles, newest first, in the summary
+        representation.
+
+        Returns:
+            QuerySet: The feed, ordered to match the composite feed index
+            (article_public_feed_idx).
+        """
+        return ArticleService.get_article_summaries().public_feed()
+
+    @staticmethod
+    def search_articles(query: str, limit: int, offset: int = 0) -> List[Article]:
+        """
+        Searches articles through the full-text index.
+
         Args:
-            author (User): The author whose articles to retrieve.
-        
+            query (str): The search query.
+            limit (int): Maximum number of articles to return.
+            offset (int): Number of hits to skip.
+
+        Returns:
+            List[Article]: Summary articles in rank order, each with the
+            ``rank`` and ``snippet`` of its hit.
+        """
+        hits = SearchService.search_articles(query, limit, offset)
+        articles = ArticleService.get_article_summaries().in_bulk([hit.id for hit in hits])
+
+        results = []
+        for hit in hits:
+            article = articles.get(hit.id)
+            if article:
+                article.rank = hit.rank
+                article.snippet = hit.snippet
+                results.append(article)
+        return results
+
+    @staticmethod
+    def get_related_articles(article: Article) -> QuerySet:
+        """
+        Retrieves the precomputed related articles of an article.
+
+        Args:
+            article (Article): The article whose related articles to retrieve.
+
         Returns:
-            List[Article]: A list of articles by the specified author.
+            QuerySet: Summary articles annotated with their ``score``, most
+            similar first.
         """
-        return Article.objects.filter(author=author).select_related('author')
+        return ArticleService.get_article_summaries().filter(related_from__article=article).annotate(
+            score=F('related_from__score')
+        ).order_by('-score', '-related_from__related_id')
+
+    @staticmethod
+    def get_article_comments(article: Article) -> QuerySet:
+        """
+        Retrieves the comments of an article, ready to be serialized.
+
+        Args:
+            article (Article): The article whose comments to retrieve.
+
+        Returns:
+            QuerySet: The comments of the article with their authors.
+        """
+        return Comment.objects.filter(article=article).select_related('author')
+
+    @staticmethod
+    def get_articles_by_author(author_id: int) -> QuerySet:
+        """
+        Retrieves the articles of an author, newest first, with their
+        keywords and their comments and comment authors prefetched.
+
+        Args:
+            author_id (int): The ID of the author whose articles to retrieve.
+
+        Returns:
+            QuerySet: The articles, ordered to match the author feed index.
+        """
+        return Article.objects.filter(author_id=author_id).select_related('author').prefetch_related(
+            'keywords', Prefetch('comments', queryset=Comment.objects.select_related('author'))
+        ).order_by('-created_at', '-id')
 
     @staticmethod
     def create_article(article_data: Dict, author: User) -> Article:
@@ -40,21 +134,31 @@ class ArticleService:
         # Add author to article data
         article_data['author'] = author
 
-        # Create article
-        article = Article.objects.create(**article_data)
-
-        # Set keywords for the article
-        keywords_objs = []
-        if keywords:
-            for name in keywords:
-                serializer = KeywordCreateSerializer(data={'name': name})
-                serializer.is_valid(raise_exception=True)
-                keyword = serializer.save()
-                keywords_objs.append(keyword)
-        article.keywords.set(keywords_objs)
+        with transaction.atomic():
+            # Create article
+            article = Article.objects.create(**article_data)
+
+            # Resolve all keywords in one batch and link them in one insert
+            keywords_objs = KeywordService.get_or_create_keywords(keywords)
+            links = Article.keywords.through.objects.bulk_create([
+                Article.keywords.through(article_id=article.id, keyword_id=keyword.id)
+                for keyword in keywords_objs
+            ])
+            CounterService.article_created(article)
+            KeywordUsageService.articles_created([article], links)
+            RelatedArticleService.article_created(article)
         return article
-    
-    
-        
 
-    
\ No newline at end of file
+    @staticmethod
+    def delete_article(article: Article) -> None:
+        """
+        Deletes an article with its comments.
+
+        Args:
+            article (Article): The article to delete.
+        """
+        with transaction.atomic():
+            CounterService.article_deleted(article)
+            KeywordUsageService.article_deleted(article)
+            RelatedArticleService.articles_deleted([article.id])
+            article.delete()
@@ -0,0 +1,150 @@
+import time
+from typing import Dict, Iterable, Tuple
+from django.core.cache import cache
+
+
+class CacheService:
+    """
+    Service class for namespaced, versioned cache invalidation.
+
+    Every cached response is keyed with the current version of the namespaces
+    it depends on. Invalidating a namespace only bumps its version number, so
+    stale entries are never read again and simply expire with their timeout,
+    while the rest of the cache (other resources, rendered fragments) is kept.
+
+    Namespaces:
+    - articles: article list pages
+    - article:{id}: a single article detail and its comment lists
+    - author:{id}: the article feed of an author
+    - comments: comment list pages
+    - keywords: keyword list pages
+    """
+    ARTICLES = 'articles'
+    COMMENTS = 'comments'
+    KEYWORDS = 'keywords'
+
+    VERSION_KEY = 'cache_version:{}'
+
+    @staticmethod
+    def article(article_id: int) -> str:
+        """
+        Returns the namespace of a single article.
+        """
+        return f'article:{article_id}'
+
+    @staticmethod
+    def author(author_id: int) -> str:
+        """
+        Returns the namespace of the article feed of an author.
+        """
+        return f'author:{author_id}'
+
+    @staticmethod
+    def _initial_version() -> int:
+        # A fresh version is never lower than one issued before the key was
+        # evicted, so old entries cannot be resurrected.
+        return time.time_ns() // 1000
+
+    @staticmethod
+    def get_versions(namespaces: Iterable[str]) -> Dict[str, int]:
+        """
+        Retrieves the current version of each namespace, creating missing ones.
+
+        Args:
+            namespaces (Iterable[str]): The namespaces to look up.
+
+        Returns:
+            Dict[str, int]: The version of each namespace.
+        """
+        keys = {CacheService.VERSION_KEY.format(namespace): namespace for namespace in namespaces}
+        found = cache.get_many(keys)
+
+        versions = {}
+        for key, namespace in keys.items():
+            if key not in found:
+                cache.add(key, CacheService._initial_version(), None)
+                found[key] = cache.get(key)
+            versions[namespace] = found[key]
+        return versions
+
+    @staticmethod
+    def invalidate(*namespaces: str) -> None:
+        """
+        Invalidates every cache entry that depends on the given namespaces.
+
+        Args:
+            *namespaces (str): The namespaces to invalidate.
+        """
+        for namespace in set(namespaces):
+            key = CacheService.VERSION_KEY.format(namespace)
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.add(key, CacheService._initial_version(), None)
+
+    @staticmethod
+    def invalidate_article(article_id: int, author_id: int, deleted: bool = False) -> None:
+        """
+        Invalidates the caches affected by an article update or deletion.
+
+        Args:
+            article_id (int): The ID of the changed article.
+            author_id (int): The ID of its author.
+            deleted (bool): Whether the article (and its comments) was deleted.
+        """
+        namespaces = [CacheService.ARTICLES, CacheService.article(article_id), CacheService.author(author_id)]
+        if deleted:
+            namespaces.append(CacheService.COMMENTS)
+        CacheService.invalidate(*namespaces)
+
+    @staticmethod
+    def invalidate_comment(article_id: int, article_author_id: int) -> None:
+        """
+        Invalidates the caches affected by a comment write on an article.
+
+        Args:
+            article_id (int): The ID of the commented article.
+            article_author_id (int): The ID of the author of the article,
+                whose feed shows its comment count.
+        """
+        # The article lists and feeds embed the comment count
+        CacheService.invalidate(
+            CacheService.ARTICLES, CacheService.COMMENTS, CacheService.article(article_id),
+            CacheService.author(article_author_id)
+        )
+
+    @staticmethod
+    def invalidate_user(user_id: int, articles: Iterable[Tuple[int, int]] = ()) -> None:
+        """
+        Invalidates the caches affected by a user update or deletion.
+
+        Articles and comments embed their author, and deleting a user also
+        deletes their articles and comments.
+
+        Args:
+            user_id (int): The ID of the changed user.
+            articles (Iterable[Tuple[int, int]]): The ID and author ID of the
+                articles they wrote or commented on.
+        """
+        namespaces = [CacheService.ARTICLES, CacheService.COMMENTS, CacheService.author(user_id)]
+        for article_id, author_id in articles:
+            namespaces.extend((CacheService.article(article_id), CacheService.author(author_id)))
+        CacheService.invalidate(*namespaces)
+
+    @staticmethod
+    def invalidate_keyword(articles: Iterable[Tuple[int, int]] = ()) -> None:
+        """
+        Invalidates the caches affected by a keyword write.
+
+        Args:
+            articles (Iterable[Tuple[int, int]]): The ID and author ID of the
+                articles embedding the keyword. Empty for newly created
+                keywords.
+        """
+        namespaces = [CacheService.KEYWORDS]
+        articles = list(articles)
+        if articles:
+            namespaces.append(CacheService.ARTICLES)
+            for article_id, author_id in articles:
+                namespaces.extend((CacheService.article(article_id), CacheService.author(author_id)))
+        CacheService.invalidate(*namespaces)
@@ -0,0 +1,65 @@
+from typing import Dict
+from django.contrib.auth.models import User
+from django.db import transaction
+from apps.api.models.comment import Comment
+from apps.core.services.counter_service import CounterService
+
+class CommentService:
+    """
+    Service class for managing comments.
+
+    Every write also updates the comment counters of the article and the
+    author, in the same transaction.
+    """
+
+    @staticmethod
+    def create_comment(comment_data: Dict, author: User) -> Comment:
+        """
+        Creates a new comment.
+
+        Args:
+            comment_data (Dict): The validated comment data (article, content).
+            author (User): The author of the comment.
+
+        Returns:
+            Comment: The created comment instance.
+        """
+        with transaction.atomic():
+            comment = Comment.objects.create(author=author, **comment_data)
+            CounterService.comment_created(comment)
+        return comment
+
+    @staticmethod
+    def update_comment(comment: Comment, comment_data: Dict) -> Comment:
+        """
+        Updates a comment, moving it between article counters if its article
+        changes.
+
+        Args:
+            comment (Comment): The comment to update.
+            comment_data (Dict): The validated fields to update.
+
+        Returns:
+            Comment: The updated comment instance.
+        """
+        previous_article_id = comment.article_id
+        for field, value in comment_data.items():
+            setattr(comment, field, value)
+
+        with transaction.atomic():
+            comment.save()
+            if comment.article_id != previous_article_id:
+                CounterService.comment_moved(previous_article_id, comment.article_id)
+        return comment
+
+    @staticmethod
+    def delete_comment(comment: Comment) -> None:
+        """
+        Deletes a comment.
+
+        Args:
+            comment (Comment): The comment to delete.
+        """
+        with transaction.atomic():
+            CounterService.comment_deleted(comment)
+            comment.delete()
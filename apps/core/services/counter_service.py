@@ -0,0 +1,147 @@
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, Mapping
+from django.contrib.auth.models import User
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from apps.api.models.article import Article
+from apps.api.models.comment import Comment
+from apps.api.models.user_stats import UserStats
+
+
+class CounterService:
+    """
+    Service class for the denormalized activity counters.
+
+    ``Article.comment_count`` and ``UserStats.article_count`` /
+    ``UserStats.comment_count`` are adjusted with ``F()`` expressions, so
+    concurrent writers never overwrite each other. Call these methods inside
+    the transaction of the write they account for: a rollback then also
+    reverts the counters.
+
+    Writes that bypass the services (admin, raw ORM calls) are not counted;
+    ``recount`` repairs every counter in bulk.
+    """
+
+    @staticmethod
+    def _apply(queryset, field: str, deltas: Mapping[int, int]) -> None:
+        # One UPDATE per distinct delta instead of one per row
+        by_delta: Dict[int, list] = defaultdict(list)
+        for pk, delta in deltas.items():
+            if delta:
+                by_delta[delta].append(pk)
+        for delta, pks in by_delta.items():
+            queryset.filter(pk__in=pks).update(**{field: F(field) + delta})
+
+    @staticmethod
+    def add_user_activity(articles: Mapping[int, int] = None, comments: Mapping[int, int] = None) -> None:
+        """
+        Adjusts the counters of several users at once.
+
+        Args:
+            articles (Mapping[int, int], optional): Article count delta by user id.
+            comments (Mapping[int, int], optional): Comment count delta by user id.
+        """
+        articles, comments = articles or {}, comments or {}
+        created = {user_id for user_id, delta in {**articles, **comments}.items() if delta > 0}
+        if created:
+            UserStats.objects.bulk_create([UserStats(user_id=user_id) for user_id in created], ignore_conflicts=True)
+        CounterService._apply(UserStats.objects, 'article_count', articles)
+        CounterService._apply(UserStats.objects, 'comment_count', comments)
+
+    @staticmethod
+    def add_article_comments(comments: Mapping[int, int]) -> None:
+        """
+        Adjusts the comment count of several articles at once.
+
+        Args:
+            comments (Mapping[int, int]): Comment count delta by article id.
+        """
+        CounterService._apply(Article.objects, 'comment_count', comments)
+
+    @staticmethod
+    def article_created(article: Article) -> None:
+        CounterService.add_user_activity(articles={article.author_id: 1})
+
+    @staticmethod
+    def article_deleted(article: Article) -> None:
+        """
+        Accounts for an article about to be deleted with its comments.
+        """
+        comments = Counter(dict(
+            Comment.objects.filter(article=article).order_by().values('author').annotate(
+                count=Count('id')
+            ).values_list('author', 'count')
+        ))
+        CounterService.add_user_activity(
+            articles={article.author_id: -1},
+            comments={author_id: -count for author_id, count in comments.items()},
+        )
+
+    @staticmethod
+    def comment_created(comment: Comment) -> None:
+        CounterService.add_article_comments({comment.article_id: 1})
+        CounterService.add_user_activity(comments={comment.author_id: 1})
+
+    @staticmethod
+    def comment_deleted(comment: Comment) -> None:
+        CounterService.add_article_comments({comment.article_id: -1})
+        CounterService.add_user_activity(comments={comment.author_id: -1})
+
+    @staticmethod
+    def comment_moved(previous_article_id: int, article_id: int) -> None:
+        CounterService.add_article_comments({previous_article_id: -1, article_id: 1})
+
+    @staticmethod
+    def user_deleted(user: User) -> None:
+        """
+        Accounts for a user about to be deleted with their articles and
+        comments: their comments on other articles and other users' comments
+        on their articles go away too.
+        """
+        own_comments = Comment.objects.filter(author=user).exclude(article__author=user).order_by()
+        CounterService.add_article_comments({
+            article_id: -count
+            for article_id, count in own_comments.values('article').annotate(count=Count('id')).values_list('article', 'count')
+        })
+
+        received_comments = Comment.objects.filter(article__author=user).exclude(author=user).order_by()
+        CounterService.add_user_activity(comments={
+            author_id: -count
+            for author_id, count in received_comments.values('author').annotate(count=Count('id')).values_list('author', 'count')
+        })
+
+    @staticmethod
+    def recount(article_ids: Iterable[int] = None) -> Dict[str, int]:
+        """
+        Recomputes every counter from the article and comment tables.
+
+        Args:
+            article_ids (Iterable[int], optional): Only recount these articles;
+                user counters are always recounted.
+
+        Returns:
+            Dict: Number of articles and users whose counters were rewritten.
+        """
+        comment_count = Comment.objects.filter(article=OuterRef('pk')).order_by().values('article').annotate(
+            count=Count('id')
+        ).values('count')
+        articles = Article.objects.all() if article_ids is None else Article.objects.filter(pk__in=article_ids)
+        updated_articles = articles.update(
+            comment_count=Coalesce(Subquery(comment_count, output_field=IntegerField()), Value(0))
+        )
+
+        active_users = set(Article.objects.values_list('author', flat=True).distinct())
+        active_users |= set(Comment.objects.values_list('author', flat=True).distinct())
+        UserStats.objects.bulk_create([UserStats(user_id=user_id) for user_id in active_users], ignore_conflicts=True)
+
+        user_articles = Article.objects.filter(author=OuterRef('pk')).order_by().values('author').annotate(
+            count=Count('id')
+        ).values('count')
+        user_comments = Comment.objects.filter(author=OuterRef('pk')).order_by().values('author').annotate(
+            count=Count('id')
+        ).values('count')
+        updated_users = UserStats.objects.update(
+            article_count=Coalesce(Subquery(user_articles, output_field=IntegerField()), Value(0)),
+            comment_count=Coalesce(Subquery(user_comments, output_field=IntegerField()), Value(0)),
+        )
+        return {'articles': updated_articles, 'users': updated_users}
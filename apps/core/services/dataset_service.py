@@ -0,0 +1,169 @@
+import random
+import time
+from bisect import bisect
+from collections import Counter
+from itertools import accumulate
+from typing import Callable, Dict, List, Optional
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+from apps.api.models.article import Article
+from apps.api.models.comment import Comment
+from apps.api.models.keyword import Keyword
+from apps.core.services.cache_service import CacheService
+from apps.core.services.counter_service import CounterService
+from apps.core.services.keyword_usage_service import KeywordUsageService
+
+WORDS = (
+    'lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore et '
+    'dolore magna aliqua enim ad minim veniam quis nostrud exercitation ullamco laboris nisi aliquip ex ea '
+    'commodo consequat duis aute irure in reprehenderit voluptate velit esse cillum fugiat nulla pariatur '
+    'excepteur sint occaecat cupidatat non proident sunt culpa qui officia deserunt mollit anim id est laborum'
+).split()
+
+
+class DatasetService:
+    """
+    Service class for generating synthetic datasets to exercise the project
+    at scale.
+
+    Rows are written with bulk inserts, one transaction per chunk of
+    articles, together with their keyword links, comments and activity
+    counters. Users share one precomputed password hash, since hashing is by
+    design the slowest part of creating a user.
+
+    Keyword popularity follows a Zipf distribution: the keyword of rank r is
+    picked with a weight of 1 / r ** s, so a few tags are on most articles
+    and most tags are rare, as in real tag clouds.
+    """
+    USERNAME_PREFIX = 'bench_user_'
+    KEYWORD_PREFIX = 'tag-'
+
+    @staticmethod
+    def zipf_sampler(size: int, exponent: float, rng: random.Random) -> Callable[[int], List[int]]:
+        """
+        Builds a sampler of Zipf distributed indexes in ``range(size)``.
+
+        Args:
+            size (int): Number of distinct values.
+            exponent (float): The Zipf exponent ``s``; higher is more skewed.
+            rng (random.Random): The random generator to draw from.
+
+        Returns:
+            Callable: Takes ``k`` and returns up to ``k`` distinct indexes.
+        """
+        cumulative = list(accumulate(1 / rank ** exponent for rank in range(1, size + 1)))
+        total = cumulative[-1]
+
+        def sample(k: int) -> List[int]:
+            return list(dict.fromkeys(
+                bisect(cumulative, rng.random() * total) for _ in range(min(k, size))
+            ))
+        return sample
+
+    @staticmethod
+    def _text(rng: random.Random, words: int) -> str:
+        return ' '.join(rng.choices(WORDS, k=words)).capitalize() + '.'
+
+    @staticmethod
+    def generate(users: int, articles: int, keywords: int, comments: int,
+                 keywords_per_article: int = 3, zipf_exponent: float = 1.1, content_words: int = 200,
+                 chunk_size: int = 5000, seed: Optional[int] = None, password: str = 'benchmark',
+                 progress: Optional[Callable[[Dict, float], None]] = None) -> Dict:
+        """
+        Generates users, keywords, articles with keyword links, and comments.
+
+        Args:
+            users (int): Number of users to create.
+            articles (int): Number of articles to create.
+            keywords (int): Number of distinct keywords.
+            comments (int): Total number of comments, spread over the articles.
+            keywords_per_article (int): Keywords drawn for each article.
+            zipf_exponent (float): Skew of the keyword distribution.
+            content_words (int): Words in the content of each article.
+            chunk_size (int): Articles written per transaction.
+            seed (int, optional): Seed for a reproducible dataset.
+            password (str): Password of every generated user.
+            progress (Callable, optional): Called after every chunk with the
+                running statistics and the elapsed time in seconds.
+
+        Returns:
+            Dict: Counts of the rows created by table.
+        """
+        rng = random.Random(seed)
+        started = time.monotonic()
+        stats = {'users': 0, 'keywords': 0, 'articles': 0, 'keyword_links': 0, 'comments': 0}
+
+        # Continue numbering after a previous run, so runs can be stacked
+        offset = User.objects.filter(username__startswith=DatasetService.USERNAME_PREFIX).count()
+        password_hash = make_password(password)
+        for start in range(0, users, chunk_size):
+            created = User.objects.bulk_create([
+                User(username=f'{DatasetService.USERNAME_PREFIX}{offset + index}', password=password_hash,
+                     email=f'{DatasetService.USERNAME_PREFIX}{offset + index}@example.com')
+                for index in range(start, min(start + chunk_size, users))
+            ])
+            stats['users'] += len(created)
+        user_ids = list(User.objects.filter(username__startswith=DatasetService.USERNAME_PREFIX).values_list('id', flat=True))
+        if not user_ids:
+            user_ids = list(User.objects.values_list('id', flat=True))
+        if not user_ids:
+            return stats
+
+        names = [f'{DatasetService.KEYWORD_PREFIX}{rank}' for rank in range(keywords)]
+        Keyword.objects.bulk_create([Keyword(name=name) for name in names], ignore_conflicts=True)
+        stats['keywords'] = len(names)
+        keyword_ids = dict(Keyword.objects.filter(name__in=names).values_list('name', 'id'))
+        keyword_ids = [keyword_ids[name] for name in names]
+        sample_keywords = DatasetService.zipf_sampler(len(keyword_ids), zipf_exponent, rng) if keyword_ids else None
+
+        for start in range(0, articles, chunk_size):
+            size = min(chunk_size, articles - start)
+            # Spread this chunk's share of the comments over its articles
+            quota = comments * (start + size) // articles - comments * start // articles
+            comment_counts = Counter(rng.choices(range(size), k=quota))
+
+            with transaction.atomic():
+                chunk = Article.objects.bulk_create([
+                    Article(
+                        title=DatasetService._text(rng, rng.randint(4, 10))[:200],
+                        subtitle=DatasetService._text(rng, rng.randint(6, 14))[:200],
+                        content=DatasetService._text(rng, content_words),
+                        type=rng.choices(list(Article.ArticleType), weights=(15, 80, 5))[0],
+                        status=rng.choices(list(Article.ArticleStatus), weights=(20, 80))[0],
+                        author_id=rng.choice(user_ids),
+                        comment_count=comment_counts[index],
+                    )
+                    for index in range(size)
+                ], batch_size=1000)
+
+                links = Article.keywords.through.objects.bulk_create([
+                    Article.keywords.through(article_id=article.id, keyword_id=keyword_ids[index])
+                    for article in chunk
+                    for index in (sample_keywords(keywords_per_article) if sample_keywords else [])
+                ], batch_size=5000)
+
+                created_comments = Comment.objects.bulk_create([
+                    Comment(article_id=chunk[index].id, author_id=rng.choice(user_ids),
+                            content=DatasetService._text(rng, rng.randint(5, 40)))
+                    for index, count in comment_counts.items()
+                    for _ in range(count)
+                ], batch_size=5000)
+
+                KeywordUsageService.articles_created(chunk, links)
+                CounterService.add_user_activity(
+                    articles=Counter(article.author_id for article in chunk),
+                    comments=Counter(comment.author_id for comment in created_comments),
+                )
+
+            stats['articles'] += len(chunk)
+            stats['keyword_links'] += len(links)
+            stats['comments'] += len(created_comments)
+            if progress:
+                progress(stats, time.monotonic() - started)
+
+        CacheService.invalidate(
+            CacheService.ARTICLES, CacheService.COMMENTS, CacheService.KEYWORDS,
+            *(CacheService.author(user_id) for user_id in user_ids)
+        )
+        return stats
@@ -0,0 +1,223 @@
+import json
+import time
+from collections import Counter
+from itertools import islice
+from typing import Callable, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+from django.contrib.auth.models import User
+from django.db import transaction
+from apps.api.models.article import Article
+from apps.api.models.comment import Comment
+from apps.core.services.cache_service import CacheService
+from apps.core.services.counter_service import CounterService
+from apps.core.services.keyword_service import KeywordService
+from apps.core.services.keyword_usage_service import KeywordUsageService
+
+
+class ImportService:
+    """
+    Service class for bulk importing content from NDJSON streams.
+
+    Each line of the stream is one article:
+
+        {"title": "...", "subtitle": "...", "content": "...", "type": 1,
+         "status": 1, "author": "username", "keywords": ["python"],
+         "comments": [{"author": "username", "content": "..."}]}
+
+    The stream is consumed lazily and written in chunks, each chunk in its
+    own transaction together with the activity counters it adds, so memory
+    stays flat regardless of the input size. Only the username -> id and
+    keyword name -> id maps are kept between chunks.
+    """
+    MAX_REPORTED_ERRORS = 100
+
+    @staticmethod
+    def read_ndjson(stream: IO) -> Iterator[Tuple[int, Dict]]:
+        """
+        Lazily parses an NDJSON stream.
+
+        Args:
+            stream (IO): A text or binary stream with one JSON object per line.
+
+        Yields:
+            Tuple[int, Dict]: The line number and the decoded record. Lines
+            that are blank or not valid JSON objects yield ``None`` records.
+        """
+        for line_number, line in enumerate(stream, start=1):
+            if isinstance(line, bytes):
+                line = line.decode('utf-8')
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            yield line_number, record if isinstance(record, dict) else None
+
+    @staticmethod
+    def chunked(iterable: Iterable, size: int) -> Iterator[List]:
+        """
+        Splits an iterable in lists of at most ``size`` items.
+        """
+        iterator = iter(iterable)
+        while chunk := list(islice(iterator, size)):
+            yield chunk
+
+    @staticmethod
+    def import_articles(stream: IO, chunk_size: int = 1000,
+                        progress: Optional[Callable[[Dict, float], None]] = None) -> Dict:
+        """
+        Imports articles, keywords and comments from an NDJSON stream.
+
+        Args:
+            stream (IO): The NDJSON stream to import.
+            chunk_size (int): Number of articles written per transaction.
+            progress (Callable, optional): Called after every chunk with the
+                running statistics and the elapsed time in seconds.
+
+        Returns:
+            Dict: Counts of imported articles, comments, keyword links and
+            skipped lines, and the first errors found.
+        """
+        stats = {'articles': 0, 'comments': 0, 'keyword_links': 0, 'skipped': 0, 'errors': []}
+        author_ids: Dict[str, int] = {}
+        keyword_ids: Dict[str, int] = {}
+        started = time.monotonic()
+
+        for chunk in ImportService.chunked(ImportService.read_ndjson(stream), chunk_size):
+            with transaction.atomic():
+                ImportService._import_chunk(chunk, author_ids, keyword_ids, stats)
+            if progress:
+                progress(stats, time.monotonic() - started)
+
+        if stats['articles']:
+            CacheService.invalidate(
+                CacheService.ARTICLES, CacheService.COMMENTS, CacheService.KEYWORDS,
+                *(CacheService.author(author_id) for author_id in author_ids.values())
+            )
+        return stats
+
+    @staticmethod
+    def _skip(stats: Dict, line_number: int, reason: str) -> None:
+        stats['skipped'] += 1
+        if len(stats['errors']) < ImportService.MAX_REPORTED_ERRORS:
+            stats['errors'].append(f'line {line_number}: {reason}')
+
+    @staticmethod
+    def _invalid(record: Optional[Dict]) -> Optional[str]:
+        """
+        Checks the shape of a record.
+
+        Returns:
+            Optional[str]: Why the record is skipped, or None when it is valid.
+        """
+        if record is None:
+            return 'invalid JSON object'
+        if not all(isinstance(record.get(field), str) and record[field] for field in ('title', 'content')):
+            return 'title and content are required strings'
+        if not isinstance(record.get('subtitle') or '', str):
+            return 'subtitle must be a string'
+        if record.get('type', Article.ArticleType.DRAFT) not in Article.ArticleType.values:
+            return f"invalid type {record.get('type')!r}"
+        if record.get('status', Article.ArticleStatus.PRIVATE) not in Article.ArticleStatus.values:
+            return f"invalid status {record.get('status')!r}"
+        keywords = record.get('keywords') or []
+        if not isinstance(keywords, list) or not all(isinstance(name, str) for name in keywords):
+            return 'keywords must be a list of strings'
+        if not isinstance(record.get('comments') or [], list):
+            return 'comments must be a list'
+        if not isinstance(record.get('author'), str):
+            return f"unknown author {record.get('author')!r}"
+        return None
+
+    @staticmethod
+    def _valid_comment(comment, author_ids: Dict[str, int]) -> bool:
+        return (
+            isinstance(comment, dict) and isinstance(comment.get('author'), str)
+            and comment['author'] in author_ids and isinstance(comment.get('content'), str) and comment['content']
+        )
+
+    @staticmethod
+    def _resolve_authors(usernames: Iterable[str], author_ids: Dict[str, int]) -> None:
+        missing = {username for username in usernames if username not in author_ids}
+        if missing:
+            author_ids.update(User.objects.filter(username__in=missing).values_list('username', 'id'))
+
+    @staticmethod
+    def _resolve_keywords(names: Iterable[str], keyword_ids: Dict[str, int]) -> None:
+        missing = [name for name in names if name not in keyword_ids]
+        if missing:
+            keyword_ids.update(
+                (keyword.name, keyword.id) for keyword in KeywordService.get_or_create_keywords(missing)
+            )
+
+    @staticmethod
+    def _import_chunk(chunk: List[Tuple[int, Dict]], author_ids: Dict[str, int],
+                      keyword_ids: Dict[str, int], stats: Dict) -> None:
+        checked = []
+        for line_number, record in chunk:
+            reason = ImportService._invalid(record)
+            if reason:
+                ImportService._skip(stats, line_number, reason)
+            else:
+                checked.append((line_number, record))
+
+        usernames = set()
+        for _, record in checked:
+            usernames.add(record['author'])
+            usernames.update(
+                comment.get('author') for comment in record.get('comments') or [] if isinstance(comment, dict)
+            )
+        ImportService._resolve_authors({name for name in usernames if isinstance(name, str)}, author_ids)
+
+        records = []
+        for line_number, record in checked:
+            if record['author'] not in author_ids:
+                ImportService._skip(stats, line_number, f"unknown author {record['author']!r}")
+            else:
+                records.append(record)
+        if not records:
+            return
+
+        record_comments = [
+            [comment for comment in record.get('comments') or [] if ImportService._valid_comment(comment, author_ids)]
+            for record in records
+        ]
+        articles = Article.objects.bulk_create([
+            Article(
+                title=record['title'][:200],
+                subtitle=(record.get('subtitle') or '')[:200],
+                content=record['content'],
+                type=record.get('type', Article.ArticleType.DRAFT),
+                status=record.get('status', Article.ArticleStatus.PRIVATE),
+                author_id=author_ids[record['author']],
+                comment_count=len(comments),
+            )
+            for record, comments in zip(records, record_comments)
+        ])
+
+        keywords = [
+            [name for name in KeywordService.normalize_names(record.get('keywords') or []) if len(name) <= 50]
+            for record in records
+        ]
+        ImportService._resolve_keywords({name for names in keywords for name in names}, keyword_ids)
+        links = Article.keywords.through.objects.bulk_create([
+            Article.keywords.through(article_id=article.id, keyword_id=keyword_ids[name])
+            for article, names in zip(articles, keywords)
+            for name in names
+        ])
+
+        comments = Comment.objects.bulk_create([
+            Comment(article_id=article.id, author_id=author_ids[comment['author']], content=comment['content'])
+            for article, article_comments in zip(articles, record_comments)
+            for comment in article_comments
+        ])
+        KeywordUsageService.articles_created(articles, links)
+        CounterService.add_user_activity(
+            articles=Counter(article.author_id for article in articles),
+            comments=Counter(comment.author_id for comment in comments),
+        )
+
+        stats['articles'] += len(articles)
+        stats['keyword_links'] += len(links)
+        stats['comments'] += len(comments)
@@ -1,6 +1,8 @@
 from django.db.models import Q
+from typing import Iterable, List
 from apps.api.models.keyword import Keyword
 from apps.core.exceptions.business_exceptions import BusinessException, KeywordNotFoundError
+from apps.core.services.keyword_suggest_service import KeywordSuggestService
 
 class KeywordService:
     """
@@ -27,5 +29,51 @@ class KeywordService:
         
         """
         keyword, created = Keyword.objects.get_or_create(name=name)
+        if created:
+            KeywordSuggestService.keywords_created([keyword])
 
-        return keyword
\ No newline at end of file
+        return keyword
+
+    @staticmethod
+    def normalize_names(names: Iterable[str]) -> List[str]:
+        """
+        Normalizes keyword names the same way the keyword serializers do.
+
+        Args:
+            names (Iterable[str]): The raw keyword names.
+
+        Returns:
+            List[str]: The stripped, lowercased names without blanks and
+            duplicates, in their original order.
+        """
+        return list(dict.fromkeys(name.strip().lower() for name in names if name and name.strip()))
+
+    @staticmethod
+    def get_or_create_keywords(names: Iterable[str]) -> List[Keyword]:
+        """
+        Resolves a batch of keyword names, creating the missing ones.
+
+        The whole batch costs a constant number of queries: one IN lookup, one
+        bulk insert of the missing names and one IN lookup to fetch their IDs.
+        Conflicting inserts from concurrent requests are ignored, so two
+        articles introducing the same keyword at once both succeed.
+
+        Args:
+            names (Iterable[str]): The keyword names to resolve.
+
+        Returns:
+            List[Keyword]: The keywords, in the order of the normalized names.
+        """
+        names = KeywordService.normalize_names(names)
+        if not names:
+            return []
+
+        keywords = {keyword.name: keyword for keyword in Keyword.objects.filter(name__in=names)}
+        missing = [name for name in names if name not in keywords]
+        if missing:
+            Keyword.objects.bulk_create([Keyword(name=name) for name in missing], ignore_conflicts=True)
+            created = list(Keyword.objects.filter(name__in=missing))
+            keywords.update({keyword.name: keyword for keyword in created})
+            KeywordSuggestService.keywords_created(created)
+
+        return [keywords[name] for name in names]
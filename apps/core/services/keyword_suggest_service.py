@@ -0,0 +1,243 @@
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from apps.api.models.keyword import Keyword
+from apps.api.models.keyword_usage import KeywordUsage
+
+# Sorts after every character, so prefix + MAX_CHAR bounds the names starting with prefix
+MAX_CHAR = chr(0x10FFFF)
+
+
+class KeywordIndex:
+    """
+    Prefix index over the keyword names, ranked by usage.
+
+    Names are kept in a sorted list, where the names starting with a prefix
+    form one contiguous range found by two binary searches. Ranking a small
+    range on the fly is cheap; for the prefixes whose range holds more than
+    DENSE names, the top MAX_RESULTS names are precomputed, so any lookup
+    ranks at most DENSE names.
+
+    Changes to the index must hold ``lock``; lookups only take it to store
+    the ranking of a prefix that became dense.
+    """
+    DENSE = 128
+    MAX_RESULTS = 10
+
+    def __init__(self, keywords: Iterable[Tuple[int, str, int]]):
+        """
+        Args:
+            keywords (Iterable[Tuple[int, str, int]]): The id, normalized
+                name and usage of every keyword.
+        """
+        self.keywords: Dict[str, Tuple[int, int]] = {name: (id, usage) for id, name, usage in keywords}
+        self.names: List[str] = sorted(self.keywords)
+        self.top: Dict[str, List[str]] = {}
+        self.lock = threading.Lock()
+        self._precompute('', 0, len(self.names))
+
+    def _rank_key(self, name: str):
+        return -self.keywords[name][1], name
+
+    def _range(self, prefix: str) -> Tuple[int, int]:
+        return bisect_left(self.names, prefix), bisect_left(self.names, prefix + MAX_CHAR)
+
+    def _rank(self, lo: int, hi: int, limit: int) -> List[str]:
+        return heapq.nsmallest(limit, self.names[lo:hi], key=self._rank_key)
+
+    def _precompute(self, prefix: str, lo: int, hi: int) -> None:
+        if hi - lo <= self.DENSE:
+            return
+        self.top[prefix] = self._rank(lo, hi, self.MAX_RESULTS)
+
+        # Split the range by the next character; names equal to the prefix come first
+        depth = len(prefix) + 1
+        start = lo
+        while start < hi and len(self.names[start]) < depth:
+            start += 1
+        while start < hi:
+            child = self.names[start][:depth]
+            end = bisect_left(self.names, child + MAX_CHAR, start, hi)
+            self._precompute(child, start, end)
+            start = end
+
+    def lookup(self, prefix: str, limit: int = MAX_RESULTS) -> List[Dict]:
+        """
+        Returns the most used keywords starting with a normalized prefix.
+        """
+        limit = min(limit, self.MAX_RESULTS)
+        names = self.top.get(prefix)
+        if names is None:
+            lo, hi = self._range(prefix)
+            if hi - lo > self.DENSE:
+                # The range grew past DENSE through add(); rank it again under
+                # the lock so a concurrent add() cannot be left out
+                with self.lock:
+                    names = self.top.get(prefix)
+                    if names is None:
+                        lo, hi = self._range(prefix)
+                        names = self.top[prefix] = self._rank(lo, hi, self.MAX_RESULTS)
+            else:
+                names = self._rank(lo, hi, limit)
+        return [
+            {'id': self.keywords[name][0], 'name': name, 'usage': self.keywords[name][1]}
+            for name in names[:limit]
+        ]
+
+    def add(self, id: int, name: str, usage: int = 0) -> None:
+        """
+        Adds a keyword, unused unless it is a renamed one.
+        """
+        if name in self.keywords:
+            return
+        self.keywords[name] = (id, usage)
+        insort(self.names, name)
+        for length in range(len(name) + 1):
+            top = self.top.get(name[:length])
+            if top is not None and (len(top) < self.MAX_RESULTS or self._rank_key(name) < self._rank_key(top[-1])):
+                top.append(name)
+                top.sort(key=self._rank_key)
+                del top[self.MAX_RESULTS:]
+
+    def rename(self, old_name: str, name: str) -> None:
+        """
+        Renames a keyword, keeping its usage.
+        """
+        if old_name not in self.keywords:
+            return
+        id, usage = self.keywords[old_name]
+        self.remove(old_name)
+        self.add(id, name, usage)
+
+    def remove(self, name: str) -> None:
+        if name not in self.keywords:
+            return
+        del self.names[bisect_left(self.names, name)]
+        for length in range(len(name) + 1):
+            prefix = name[:length]
+            if name in self.top.get(prefix, ()):
+                del self.top[prefix]
+        del self.keywords[name]
+
+
+class KeywordSuggestService:
+    """
+    Service class for keyword autocompletion.
+
+    Every process keeps a KeywordIndex in memory, built from the database
+    when the server loads the application (see warm_up) or else on first
+    use. The first lookup after KEYWORD_SUGGEST_TTL seconds rebuilds
+    it, to pick up usage changes and keywords created by other processes,
+    while concurrent lookups keep using the previous index. Keywords created
+    or deleted through the services of this process are applied at once,
+    after the commit.
+    """
+    _index: Optional[KeywordIndex] = None
+    _built_at = 0.0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def build() -> KeywordIndex:
+        """
+        Builds the index from the database, with the article count of each
+        keyword in KeywordUsage as its usage.
+        """
+        usage = dict(KeywordUsage.objects.values_list('keyword_id', 'article_count'))
+        index = KeywordIndex(
+            (id, name, usage.get(id, 0)) for id, name in Keyword.objects.values_list('id', 'name').iterator()
+        )
+        KeywordSuggestService._index, KeywordSuggestService._built_at = index, time.monotonic()
+        return index
+
+    @staticmethod
+    def warm_up() -> None:
+        """
+        Builds the index ahead of the first request. Called by the WSGI and
+        ASGI entry points rather than AppConfig.ready(), which also runs for
+        migrate, tests and every other management command.
+        """
+        try:
+            KeywordSuggestService.get_index()
+        except DatabaseError:
+            # Not migrated yet; the first lookup builds it
+            pass
+
+    @staticmethod
+    def get_index() -> KeywordIndex:
+        index = KeywordSuggestService._index
+        expired = time.monotonic() - KeywordSuggestService._built_at > settings.KEYWORD_SUGGEST_TTL
+        if index is not None and not expired:
+            return index
+
+        # One thread rebuilds, the others keep using the current index
+        if KeywordSuggestService._lock.acquire(blocking=index is None):
+            try:
+                if index is KeywordSuggestService._index:
+                    index = KeywordSuggestService.build()
+            finally:
+                KeywordSuggestService._lock.release()
+        return KeywordSuggestService._index
+
+    @staticmethod
+    def suggest(prefix: str, limit: int = KeywordIndex.MAX_RESULTS) -> List[Dict]:
+        """
+        Suggests the most used keywords starting with a prefix.
+
+        Args:
+            prefix (str): The typed prefix; normalized like keyword names.
+            limit (int): Maximum number of suggestions.
+
+        Returns:
+            List[Dict]: The ``id``, ``name`` and ``usage`` of each keyword.
+        """
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        return KeywordSuggestService.get_index().lookup(prefix, limit)
+
+    @staticmethod
+    def keywords_created(keywords: Iterable[Keyword]) -> None:
+        """
+        Adds new keywords to the index once the transaction commits.
+        """
+        keywords = [(keyword.id, keyword.name) for keyword in keywords]
+
+        def apply():
+            index = KeywordSuggestService._index
+            if index is not None:
+                with index.lock:
+                    for id, name in keywords:
+                        index.add(id, name)
+        transaction.on_commit(apply)
+
+    @staticmethod
+    def keyword_renamed(old_name: str, keyword: Keyword) -> None:
+        """
+        Renames a keyword in the index once the transaction commits, keeping
+        its usage.
+        """
+        name = keyword.name
+
+        def apply():
+            index = KeywordSuggestService._index
+            if index is not None:
+                with index.lock:
+                    index.rename(old_name, name)
+        transaction.on_commit(apply)
+
+    @staticmethod
+    def keyword_removed(name: str) -> None:
+        """
+        Removes a deleted keyword from the index once the transaction
+        commits.
+        """
+        def apply():
+            index = KeywordSuggestService._index
+            if index is not None:
+                with index.lock:
+                    index.remove(name)
+        transaction.on_commit(apply)
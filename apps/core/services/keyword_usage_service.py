@@ -0,0 +1,162 @@
+from collections import Counter, defaultdict
+from typing import Container, Dict, Iterable, List, Mapping, Tuple
+from django.contrib.auth.models import User
+from django.db.models import Count, F, Q
+from apps.api.models.article import Article
+from apps.api.models.keyword_usage import KeywordUsage
+
+
+class KeywordUsageService:
+    """
+    Service class for the materialized keyword usage counts.
+
+    ``KeywordUsage.article_count`` and ``KeywordUsage.public_count`` are
+    adjusted with ``F()`` expressions whenever article-keyword links are
+    created or deleted, or an article is published or unpublished. Like
+    CounterService, call these methods inside the transaction of the write
+    they account for.
+
+    Writes that bypass the services are not counted; ``rebuild`` recomputes
+    the whole table from the article-keyword links.
+    """
+
+    @staticmethod
+    def is_public(article: Article) -> bool:
+        return article.type == Article.ArticleType.PUBLISHED and article.status == Article.ArticleStatus.PUBLIC
+
+    @staticmethod
+    def add_usage(articles: Mapping[int, int] = None, public: Mapping[int, int] = None) -> None:
+        """
+        Adjusts the usage counts of several keywords at once.
+
+        Args:
+            articles (Mapping[int, int], optional): Article count delta by keyword id.
+            public (Mapping[int, int], optional): Public article count delta by keyword id.
+        """
+        articles, public = articles or {}, public or {}
+        created = {keyword_id for keyword_id, delta in {**articles, **public}.items() if delta > 0}
+        if created:
+            KeywordUsage.objects.bulk_create(
+                [KeywordUsage(keyword_id=keyword_id) for keyword_id in created], ignore_conflicts=True
+            )
+
+        # One UPDATE per field and distinct delta instead of one per row
+        for field, deltas in (('article_count', articles), ('public_count', public)):
+            by_delta: Dict[int, list] = defaultdict(list)
+            for keyword_id, delta in deltas.items():
+                if delta:
+                    by_delta[delta].append(keyword_id)
+            for delta, keyword_ids in by_delta.items():
+                KeywordUsage.objects.filter(pk__in=keyword_ids).update(**{field: F(field) + delta})
+
+    @staticmethod
+    def links_changed(links: Iterable[Tuple[int, int]], public_articles: Container[int], sign: int = 1) -> None:
+        """
+        Accounts for created (or, with a negative sign, deleted) links.
+
+        Args:
+            links (Iterable[Tuple[int, int]]): The (article id, keyword id) pairs.
+            public_articles (Container[int]): The ids of the published public
+                articles among them.
+            sign (int): 1 for created links, -1 for deleted ones.
+        """
+        articles, public = Counter(), Counter()
+        for article_id, keyword_id in links:
+            articles[keyword_id] += sign
+            if article_id in public_articles:
+                public[keyword_id] += sign
+        KeywordUsageService.add_usage(articles, public)
+
+    @staticmethod
+    def articles_created(articles: Iterable[Article], links: Iterable) -> None:
+        """
+        Accounts for new articles and their keyword links.
+
+        Args:
+            articles (Iterable[Article]): The created articles.
+            links (Iterable): The created ``Article.keywords.through`` rows.
+        """
+        public = {article.id for article in articles if KeywordUsageService.is_public(article)}
+        KeywordUsageService.links_changed(((link.article_id, link.keyword_id) for link in links), public)
+
+    @staticmethod
+    def article_deleted(article: Article) -> None:
+        """
+        Accounts for an article about to be deleted with its keyword links.
+        """
+        keyword_ids = Article.keywords.through.objects.filter(article=article).values_list('keyword', flat=True)
+        public = {article.id} if KeywordUsageService.is_public(article) else ()
+        KeywordUsageService.links_changed(((article.id, keyword_id) for keyword_id in keyword_ids), public, -1)
+
+    @staticmethod
+    def article_updated(article: Article, was_public: bool) -> None:
+        """
+        Accounts for an article whose type or status may have changed.
+
+        Args:
+            article (Article): The saved article.
+            was_public (bool): Whether it was published and public before.
+        """
+        is_public = KeywordUsageService.is_public(article)
+        if is_public == was_public:
+            return
+        keyword_ids = Article.keywords.through.objects.filter(article=article).values_list('keyword', flat=True)
+        KeywordUsageService.add_usage(public={keyword_id: 1 if is_public else -1 for keyword_id in keyword_ids})
+
+    @staticmethod
+    def user_deleted(user: User) -> None:
+        """
+        Accounts for a user about to be deleted with their articles.
+        """
+        usage = KeywordUsageService._count_links(Article.keywords.through.objects.filter(article__author=user))
+        KeywordUsageService.add_usage(
+            articles={keyword_id: -count for keyword_id, count, _ in usage},
+            public={keyword_id: -count for keyword_id, _, count in usage},
+        )
+
+    @staticmethod
+    def _count_links(links) -> List[Tuple[int, int, int]]:
+        # (keyword id, article count, public article count) of a links queryset
+        public = Q(article__type=Article.ArticleType.PUBLISHED, article__status=Article.ArticleStatus.PUBLIC)
+        return list(links.order_by().values('keyword').annotate(
+            articles=Count('id'), public=Count('id', filter=public)
+        ).values_list('keyword', 'articles', 'public'))
+
+    @staticmethod
+    def get_popular(limit: int, public: bool = True) -> List[KeywordUsage]:
+        """
+        Retrieves the most used keywords.
+
+        The counts are read in index order, so the cost depends on ``limit``
+        only, not on the number of keywords or articles.
+
+        Args:
+            limit (int): Maximum number of keywords to return.
+            public (bool): Rank by published public articles instead of all
+                articles.
+
+        Returns:
+            List[KeywordUsage]: The usage rows with their keywords, most used
+            first; unused keywords are left out.
+        """
+        field = 'public_count' if public else 'article_count'
+        return list(
+            KeywordUsage.objects.select_related('keyword').filter(**{f'{field}__gt': 0})
+            .order_by(f'-{field}', 'keyword_id')[:limit]
+        )
+
+    @staticmethod
+    def rebuild() -> int:
+        """
+        Recomputes the whole table from the article-keyword links.
+
+        Returns:
+            int: Number of keywords in use.
+        """
+        usage = KeywordUsageService._count_links(Article.keywords.through.objects.all())
+        KeywordUsage.objects.all().delete()
+        KeywordUsage.objects.bulk_create([
+            KeywordUsage(keyword_id=keyword_id, article_count=articles, public_count=public)
+            for keyword_id, articles, public in usage
+        ], batch_size=1000)
+        return len(usage)
@@ -0,0 +1,318 @@
+import heapq
+import math
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+from django.db import connection, transaction
+from django.db.models import Count, F, Min, Window
+from django.db.models.functions import RowNumber
+from apps.api.models.article import Article
+from apps.api.models.keyword_usage import KeywordUsage
+from apps.api.models.related_article import RelatedArticle
+
+
+class RelatedArticleService:
+    """
+    Service class for the precomputed related articles.
+
+    Every article keeps its TOP_K most similar published public articles in
+    RelatedArticle. Similarity is the Jaccard index of the keyword sets,
+    with each keyword weighted by its rarity, ``log(1 + N / df)``: sharing a
+    niche keyword counts more than sharing a popular one.
+
+    Lists are updated incrementally when an article is created, deleted,
+    published or unpublished, or a keyword is deleted. Only dropping stale
+    entries happens inside the write transaction; scoring a new article and
+    refilling the lists that lost entries are deferred with
+    ``transaction.on_commit``, so the write lock is not held while the
+    keyword overlaps are computed. A write refills at most REFRESH_LIMIT
+    lists, the others stay short until the next ``rebuild``.
+
+    The weights drift as articles are added and a refilled list is
+    recomputed with the current weights, so ``rebuild`` recomputes every
+    list at once from a sparse article-keyword matrix; run it after bulk
+    imports, which are not tracked, and from time to time.
+    """
+    TOP_K = 10
+    # Lists refilled after a single write, each scored with its own query
+    REFRESH_LIMIT = 20
+
+    @staticmethod
+    def _weights(keyword_ids: Iterable[int]) -> Dict[int, float]:
+        total = Article.objects.count()
+        usage = dict(KeywordUsage.objects.filter(keyword_id__in=keyword_ids).values_list('keyword_id', 'article_count'))
+        return {keyword_id: math.log1p(total / max(usage.get(keyword_id, 0), 1)) for keyword_id in keyword_ids}
+
+    @staticmethod
+    def _scores(article_id: int) -> Tuple[Dict[int, float], Set[int]]:
+        """
+        Computes the similarity of an article to every other article sharing
+        one of its keywords.
+
+        Returns:
+            Tuple[Dict[int, float], Set[int]]: The score by article id, and
+            the ids of the published public articles among them.
+        """
+        links = Article.keywords.through.objects
+        keyword_ids = set(links.filter(article_id=article_id).values_list('keyword_id', flat=True))
+        if not keyword_ids:
+            return {}, set()
+
+        rows = list(
+            links.filter(article__in=links.filter(keyword__in=keyword_ids).values('article'))
+            .exclude(article_id=article_id)
+            .values_list('article_id', 'keyword_id', 'article__type', 'article__status')
+        )
+        weights = RelatedArticleService._weights(keyword_ids | {keyword_id for _, keyword_id, _, _ in rows})
+        own_weight = sum(weights[keyword_id] for keyword_id in keyword_ids)
+
+        shared, weight, public = defaultdict(float), defaultdict(float), set()
+        for other_id, keyword_id, type, status in rows:
+            weight[other_id] += weights[keyword_id]
+            if keyword_id in keyword_ids:
+                shared[other_id] += weights[keyword_id]
+            if type == Article.ArticleType.PUBLISHED and status == Article.ArticleStatus.PUBLIC:
+                public.add(other_id)
+
+        scores = {
+            other_id: common / (own_weight + weight[other_id] - common)
+            for other_id, common in shared.items()
+        }
+        return scores, public
+
+    @staticmethod
+    def _store(article_id: int, scores: Dict[int, float], public: Set[int]) -> None:
+        # Ties go to the newest article
+        top = heapq.nlargest(
+            RelatedArticleService.TOP_K,
+            ((score, other_id) for other_id, score in scores.items() if other_id in public)
+        )
+        RelatedArticle.objects.filter(article_id=article_id).delete()
+        RelatedArticle.objects.bulk_create([
+            RelatedArticle(article_id=article_id, related_id=other_id, score=score) for score, other_id in top
+        ])
+
+    @staticmethod
+    def _offer(article_id: int, scores: Dict[int, float]) -> None:
+        """
+        Inserts a newly public article into the lists it ranks in.
+        """
+        if not scores:
+            return
+        lists = {
+            other_id: (count, lowest)
+            for other_id, count, lowest in RelatedArticle.objects.filter(article__in=scores).order_by()
+            .values('article').annotate(count=Count('id'), lowest=Min('score')).values_list('article', 'count', 'lowest')
+        }
+        entries = [
+            RelatedArticle(article_id=other_id, related_id=article_id, score=score)
+            for other_id, score in scores.items()
+            if other_id not in lists or lists[other_id][0] < RelatedArticleService.TOP_K or score > lists[other_id][1]
+        ]
+        RelatedArticle.objects.bulk_create(
+            entries, update_conflicts=True, unique_fields=['article', 'related'], update_fields=['score']
+        )
+
+        # Drop the entries pushed out of the lists that were full
+        full = [entry.article_id for entry in entries if lists.get(entry.article_id, (0,))[0] >= RelatedArticleService.TOP_K]
+        if full:
+            ranked = RelatedArticle.objects.filter(article__in=full).annotate(position=Window(
+                RowNumber(), partition_by=[F('article')], order_by=[F('score').desc(), F('related').desc()]
+            ))
+            RelatedArticle.objects.filter(
+                pk__in=list(ranked.filter(position__gt=RelatedArticleService.TOP_K).values_list('pk', flat=True))
+            ).delete()
+
+    @staticmethod
+    def _refresh_later(article_ids: Set[int]) -> None:
+        # The newest lists first, the most likely to be read
+        refreshed = sorted(article_ids, reverse=True)[:RelatedArticleService.REFRESH_LIMIT]
+        transaction.on_commit(lambda: RelatedArticleService.refresh(refreshed))
+
+    @staticmethod
+    def _withdraw(article_ids: Iterable[int]) -> None:
+        """
+        Removes articles from every list, refilling the lists they were in
+        once the transaction commits.
+        """
+        article_ids = set(article_ids)
+        affected = set(
+            RelatedArticle.objects.filter(related__in=article_ids).values_list('article', flat=True)
+        ) - article_ids
+        RelatedArticle.objects.filter(related__in=article_ids).delete()
+        RelatedArticleService._refresh_later(affected)
+
+    @staticmethod
+    def refresh(article_ids: Iterable[int]) -> None:
+        """
+        Recomputes the lists of some articles, one query each. Use
+        ``rebuild`` for many lists.
+
+        Args:
+            article_ids (Iterable[int]): The articles whose lists to recompute.
+        """
+        for article_id in set(article_ids):
+            scores, public = RelatedArticleService._scores(article_id)
+            RelatedArticleService._store(article_id, scores, public)
+
+    @staticmethod
+    def keyword_deleted(keyword) -> None:
+        """
+        Accounts for a keyword about to be deleted: drops the entries between
+        two of its articles, whose overlap shrinks, and refills their lists
+        once the transaction commits.
+
+        Args:
+            keyword (Keyword): The keyword, with its article links still in place.
+        """
+        articles = Article.keywords.through.objects.filter(keyword=keyword).values('article_id')
+        RelatedArticle.objects.filter(article__in=articles, related__in=articles).delete()
+        RelatedArticleService._refresh_later(set(articles.values_list('article_id', flat=True)))
+
+    @staticmethod
+    def article_created(article: Article) -> None:
+        """
+        Computes the list of a new article, with its keywords already linked,
+        and inserts it in the lists of the others if it is public, once the
+        transaction commits.
+        """
+        def apply():
+            scores, public = RelatedArticleService._scores(article.id)
+            RelatedArticleService._store(article.id, scores, public)
+            if article.type == Article.ArticleType.PUBLISHED and article.status == Article.ArticleStatus.PUBLIC:
+                RelatedArticleService._offer(article.id, scores)
+        transaction.on_commit(apply)
+
+    @staticmethod
+    def article_updated(article: Article, was_public: bool) -> None:
+        """
+        Accounts for an article whose type or status may have changed.
+
+        Args:
+            article (Article): The saved article.
+            was_public (bool): Whether it was published and public before.
+        """
+        is_public = article.type == Article.ArticleType.PUBLISHED and article.status == Article.ArticleStatus.PUBLIC
+        if is_public and not was_public:
+            transaction.on_commit(
+                lambda: RelatedArticleService._offer(article.id, RelatedArticleService._scores(article.id)[0])
+            )
+        elif was_public and not is_public:
+            RelatedArticleService._withdraw([article.id])
+
+    @staticmethod
+    def articles_deleted(article_ids: Iterable[int]) -> None:
+        """
+        Accounts for articles about to be deleted, refilling the lists they
+        appear in without them once the transaction commits.
+        """
+        RelatedArticleService._withdraw(article_ids)
+
+    @staticmethod
+    def _matrix():
+        """
+        Loads the weighted article-keyword matrix.
+
+        Returns:
+            Tuple: The sorted article ids, the weighted matrix (one row per
+            article), the total weight of each row, and the keyword-article
+            matrix of the published public articles.
+        """
+        import numpy as np
+        from scipy import sparse
+
+        articles = list(Article.objects.order_by('id').values_list('id', 'type', 'status'))
+        article_ids = np.array([article_id for article_id, _, _ in articles], dtype=np.int64)
+        public = np.array([
+            type == Article.ArticleType.PUBLISHED and status == Article.ArticleStatus.PUBLIC
+            for _, type, status in articles
+        ], dtype=bool)
+
+        links = np.array(
+            list(Article.keywords.through.objects.values_list('article_id', 'keyword_id').iterator()), dtype=np.int64
+        ).reshape(-1, 2)
+        keyword_ids, columns = np.unique(links[:, 1], return_inverse=True)
+        matrix = sparse.csr_matrix(
+            (np.ones(len(links)), (np.searchsorted(article_ids, links[:, 0]), columns)),
+            shape=(len(article_ids), len(keyword_ids))
+        )
+
+        frequency = np.asarray(matrix.sum(axis=0)).ravel()
+        weighted = (matrix @ sparse.diags(np.log1p(len(article_ids) / frequency))).tocsr()
+        totals = np.asarray(weighted.sum(axis=1)).ravel()
+        candidates = (sparse.diags(public.astype(float)) @ matrix).T.tocsr()
+        return article_ids, weighted, totals, candidates
+
+    @staticmethod
+    def _ranked(matrix, rows) -> List[Tuple[int, int, float]]:
+        """
+        Scores some rows of the matrix against every public article.
+
+        The weighted keyword overlap of the rows with every public article
+        is one sparse matrix product, from which the Jaccard scores and the
+        top TOP_K of each row are derived with vectorized operations.
+
+        Returns:
+            List[Tuple[int, int, float]]: The (article id, related id, score)
+            entries of the rows.
+        """
+        import numpy as np
+
+        article_ids, weighted, totals, candidates = matrix
+        top_k = RelatedArticleService.TOP_K
+        # Weighted size of the intersection with every public article
+        shared = (weighted[rows] @ candidates).tocsr()
+        own = np.repeat(rows, np.diff(shared.indptr))
+        scores = shared.data / (totals[own] - shared.data + totals[shared.indices])
+        # The article itself, dropped below
+        scores[shared.indices == own] = 0
+
+        entries = []
+        for position, row in enumerate(rows.tolist()):
+            lo, hi = shared.indptr[position], shared.indptr[position + 1]
+            row_scores, others = scores[lo:hi], shared.indices[lo:hi]
+            if hi - lo > top_k:
+                # Keeps every tie with the k-th score, to rank them by age
+                keep = row_scores >= np.partition(row_scores, -top_k)[-top_k]
+                row_scores, others = row_scores[keep], others[keep]
+            order = np.lexsort((-others, -row_scores))[:top_k]
+            article_id = int(article_ids[row])
+            entries.extend(
+                (article_id, related_id, score)
+                for related_id, score in zip(article_ids[others[order]].tolist(), row_scores[order].tolist())
+                if score > 0
+            )
+        return entries
+
+    @staticmethod
+    def _insert(entries: List[Tuple[int, int, float]]) -> None:
+        # Up to hundreds of thousands of rows: skip building model instances
+        insert = (
+            f'INSERT INTO {connection.ops.quote_name(RelatedArticle._meta.db_table)} '
+            '(article_id, related_id, score) VALUES (%s, %s, %s)'
+        )
+        with connection.cursor() as cursor:
+            cursor.executemany(insert, entries)
+
+    @staticmethod
+    def rebuild(chunk_size: int = 1000) -> int:
+        """
+        Recomputes every list from a sparse article-keyword matrix.
+        Requires numpy and scipy.
+
+        Args:
+            chunk_size (int): Articles scored per matrix product, bounding
+                the memory used.
+
+        Returns:
+            int: Number of related article entries stored.
+        """
+        import numpy as np
+
+        matrix = RelatedArticleService._matrix()
+        RelatedArticle.objects.all().delete()
+        stored = 0
+        for start in range(0, len(matrix[0]), chunk_size):
+            entries = RelatedArticleService._ranked(matrix, np.arange(start, min(start + chunk_size, len(matrix[0]))))
+            RelatedArticleService._insert(entries)
+            stored += len(entries)
+        return stored
@@ -0,0 +1,197 @@
+import html
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+from django.db import connection
+from django.db.models import Q
+from apps.api.models.article import Article
+
+# Private-use markers wrapped around matches, replaced after HTML escaping
+HIGHLIGHT_START = '\x02'
+HIGHLIGHT_STOP = '\x03'
+
+SQLITE_INSTALL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS api_article_fts USING fts5(
+        title, subtitle, content,
+        content='api_article', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS api_article_fts_insert AFTER INSERT ON api_article BEGIN
+        INSERT INTO api_article_fts(rowid, title, subtitle, content)
+        VALUES (new.id, new.title, new.subtitle, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS api_article_fts_delete AFTER DELETE ON api_article BEGIN
+        INSERT INTO api_article_fts(api_article_fts, rowid, title, subtitle, content)
+        VALUES ('delete', old.id, old.title, old.subtitle, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS api_article_fts_update AFTER UPDATE OF title, subtitle, content ON api_article BEGIN
+        INSERT INTO api_article_fts(api_article_fts, rowid, title, subtitle, content)
+        VALUES ('delete', old.id, old.title, old.subtitle, old.content);
+        INSERT INTO api_article_fts(rowid, title, subtitle, content)
+        VALUES (new.id, new.title, new.subtitle, new.content);
+    END
+    """,
+]
+
+SQLITE_UNINSTALL = [
+    'DROP TRIGGER IF EXISTS api_article_fts_insert',
+    'DROP TRIGGER IF EXISTS api_article_fts_delete',
+    'DROP TRIGGER IF EXISTS api_article_fts_update',
+    'DROP TABLE IF EXISTS api_article_fts',
+]
+
+# Title matches weigh more than subtitle matches, which weigh more than content
+SQLITE_RANK = 'bm25(api_article_fts, 10.0, 5.0, 1.0)'
+
+POSTGRESQL_VECTOR = (
+    "(setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(subtitle, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(content, '')), 'C'))"
+)
+
+POSTGRESQL_INSTALL = [
+    f'CREATE INDEX IF NOT EXISTS api_article_search_idx ON api_article USING GIN ({POSTGRESQL_VECTOR})',
+]
+
+POSTGRESQL_UNINSTALL = [
+    'DROP INDEX IF EXISTS api_article_search_idx',
+]
+
+
+@dataclass
+class SearchHit:
+    id: int
+    rank: float
+    snippet: Optional[str]
+
+
+class SearchService:
+    """
+    Service class for full-text search over articles.
+
+    The index is maintained by the database itself on every article insert,
+    update and delete:
+    - SQLite: an FTS5 external content table kept in sync by triggers
+    - PostgreSQL: a GIN index over the weighted tsvector of the article
+
+    Other backends fall back to unranked substring matching.
+    """
+    SNIPPET_TOKENS = 24
+
+    @staticmethod
+    def install(conn=connection) -> None:
+        """
+        Creates the search index and its triggers if they don't exist yet.
+
+        Safe to run repeatedly. It runs after every migrate, because SQLite
+        drops the triggers whenever a migration rebuilds the article table.
+
+        Args:
+            conn: The database connection to install the index on.
+        """
+        statements = {'sqlite': SQLITE_INSTALL, 'postgresql': POSTGRESQL_INSTALL}.get(conn.vendor, [])
+        with conn.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+    @staticmethod
+    def rebuild(conn=connection) -> None:
+        """
+        Rebuilds the SQLite index from the article table.
+        """
+        if conn.vendor == 'sqlite':
+            with conn.cursor() as cursor:
+                cursor.execute("INSERT INTO api_article_fts(api_article_fts) VALUES ('rebuild')")
+
+    @staticmethod
+    def uninstall(conn=connection) -> None:
+        """
+        Drops the search index and its triggers.
+        """
+        statements = {'sqlite': SQLITE_UNINSTALL, 'postgresql': POSTGRESQL_UNINSTALL}.get(conn.vendor, [])
+        with conn.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+    @staticmethod
+    def search_articles(query: str, limit: int, offset: int = 0) -> List[SearchHit]:
+        """
+        Searches articles by title, subtitle and content.
+
+        Args:
+            query (str): The user search query. All terms must match.
+            limit (int): Maximum number of hits to return.
+            offset (int): Number of hits to skip.
+
+        Returns:
+            List[SearchHit]: The hits, best ranked first, with an HTML-safe
+            snippet of the content where matches are wrapped in <mark>.
+        """
+        terms = re.findall(r'\w+', query)
+        if not terms:
+            return []
+
+        if connection.vendor == 'sqlite':
+            hits = SearchService._search_sqlite(terms, limit, offset)
+        elif connection.vendor == 'postgresql':
+            hits = SearchService._search_postgresql(terms, limit, offset)
+        else:
+            hits = SearchService._search_fallback(terms, limit, offset)
+
+        for hit in hits:
+            if hit.snippet is not None:
+                hit.snippet = html.escape(hit.snippet).replace(
+                    HIGHLIGHT_START, '<mark>'
+                ).replace(HIGHLIGHT_STOP, '</mark>')
+        return hits
+
+    @staticmethod
+    def _search_sqlite(terms: List[str], limit: int, offset: int) -> List[SearchHit]:
+        match = ' '.join('"{}"'.format(term.replace('"', '""')) for term in terms)
+        sql = f"""
+            SELECT rowid, -{SQLITE_RANK}, snippet(api_article_fts, 2, %s, %s, '…', %s)
+            FROM api_article_fts
+            WHERE api_article_fts MATCH %s
+            ORDER BY {SQLITE_RANK}, rowid DESC
+            LIMIT %s OFFSET %s
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [
+                HIGHLIGHT_START, HIGHLIGHT_STOP, SearchService.SNIPPET_TOKENS, match, limit, offset
+            ])
+            return [SearchHit(*row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _search_postgresql(terms: List[str], limit: int, offset: int) -> List[SearchHit]:
+        # Snippets are only computed for the rows of the requested page
+        options = f'StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxWords={SearchService.SNIPPET_TOKENS}'
+        sql = f"""
+            SELECT hits.id, hits.rank, ts_headline('simple', article.content, hits.query, %s)
+            FROM (
+                SELECT id, ts_rank({POSTGRESQL_VECTOR}, query) AS rank, query
+                FROM api_article, plainto_tsquery('simple', %s) AS query
+                WHERE {POSTGRESQL_VECTOR} @@ query
+                ORDER BY rank DESC, id DESC
+                LIMIT %s OFFSET %s
+            ) AS hits
+            JOIN api_article AS article ON article.id = hits.id
+            ORDER BY hits.rank DESC, hits.id DESC
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [options, ' '.join(terms), limit, offset])
+            return [SearchHit(*row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _search_fallback(terms: List[str], limit: int, offset: int) -> List[SearchHit]:
+        condition = Q()
+        for term in terms:
+            condition &= Q(title__icontains=term) | Q(subtitle__icontains=term) | Q(content__icontains=term)
+        ids = Article.objects.filter(condition).order_by('-created_at', '-id').values_list('id', flat=True)
+        return [SearchHit(id=article_id, rank=0.0, snippet=None) for article_id in ids[offset:offset + limit]]
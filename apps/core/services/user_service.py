@@ -2,7 +2,13 @@ from django.contrib.auth.models import User
 from rest_framework_simplejwt.tokens import RefreshToken
 from typing import Dict, List, Tuple
 from django.db import transaction
+from django.db.models import Q
+from apps.api.models.article import Article
+from apps.api.models.user_stats import UserStats
 from apps.api.serializers.user import UserSerializer
+from apps.core.services.counter_service import CounterService
+from apps.core.services.keyword_usage_service import KeywordUsageService
+from apps.core.services.related_article_service import RelatedArticleService
 from ..exceptions.business_exceptions import ValidationError
 
 class UserService:
@@ -109,19 +115,37 @@ class UserService:
                 - Activity counts (articles, comments)
                 
         Note:
-            This method performs efficient database queries by using
-            the reverse relationships defined in the User model
+            The counts are read from the stored activity counters in a single
+            query instead of counting articles and comments
         """
+        stats = UserStats.objects.filter(user=user).first() or UserStats(user=user)
         return {
             'id': user.id,
             'username': user.username,
             'email': user.email,
             'first_name': user.first_name,
             'last_name': user.last_name,
-            'articles_count': user.articles.count(),
-            'comments_count': user.comments.count()
+            'articles_count': stats.article_count,
+            'comments_count': stats.comment_count
         }
     
+    @staticmethod
+    def get_embedding_articles(user: User) -> List[Tuple[int, int]]:
+        """
+        Retrieves the articles whose representations embed a user: the ones
+        they wrote and the ones they commented on.
+
+        Args:
+            user (User): The user
+
+        Returns:
+            List[Tuple[int, int]]: The ID and author ID of each article
+        """
+        return list(
+            Article.objects.filter(Q(author=user) | Q(comments__author=user))
+            .values_list('id', 'author_id').distinct().order_by()
+        )
+
     @staticmethod
     def update_user(user: User, data: Dict) -> User:
         """
@@ -159,4 +183,7 @@ class UserService:
             This operation is wrapped in a transaction to ensure data consistency
         """
         with transaction.atomic():
+            CounterService.user_deleted(user)
+            KeywordUsageService.user_deleted(user)
+            RelatedArticleService.articles_deleted(user.articles.values_list('id', flat=True))
             user.delete()
\ No newline at end of file
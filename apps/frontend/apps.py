@@ -1,6 +1,16 @@
 from django.apps import AppConfig
+from apps.api import timing
+
+
+def record_api_call(sender, duration, **kwargs):
+    timing.record_api_call(duration)
 
 
 class FrontendConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.frontend'
+
+    def ready(self):
+        from apps.frontend.services.http_client import api_request_finished
+
+        api_request_finished.connect(record_api_call, dispatch_uid='apps.frontend.record_api_call')
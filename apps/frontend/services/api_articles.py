@@ -1,16 +1,30 @@
-from django.conf import settings
-import requests
+from urllib.parse import parse_qs, urlparse
+from apps.frontend.services import http_client
 
 
-def get_articles():
-    # Url apis to fetch articles
-    api_url = f'{settings.API_URL}/api/v1/articles/'
+def _next_cursor(page):
+    # Keep only the cursor of the API next link, the frontend builds its own urls
+    if page.get('next'):
+        return parse_qs(urlparse(page['next']).query).get('cursor', [None])[0]
+    return None
+
+
+def _json_headers(token=None):
     headers = {
         'Content-Type': 'application/json'
     }
+    if token is not None:
+        headers['Authorization'] = f'Bearer {token}'
+    return headers
 
-    # Fetch articles from the API
-    response = requests.get(api_url, headers=headers)
+
+def get_articles():
+    # Url apis to fetch articles
+    api_path = '/api/v1/articles/'
+    headers = _json_headers()
+
+    # Fetch articles from the API, reusing the stored copy while unchanged
+    response = http_client.get_conditional(api_path, headers=headers)
 
     if response.status_code == 200:
         articles = response.json()
@@ -18,25 +32,44 @@ def get_articles():
     
 def get_article_by_id(request, article_id):
     # Url apis to fetch articles
-    api_url = f'{settings.API_URL}/api/v1/articles/{article_id}/'
-    headers = {
-        'Content-Type': 'application/json'
-    }
+    api_path = f'/api/v1/articles/{article_id}/'
+    headers = _json_headers()
 
-    # Fetch articles from the API
-    response = requests.get(api_url, headers=headers)
+    # Fetch the article from the API, reusing the stored copy while unchanged
+    response = http_client.get_conditional(api_path, headers=headers)
 
     if response.status_code == 200:
         article = response.json()
+        article['comments']['next_cursor'] = _next_cursor(article['comments'])
         return article
+
+def get_related_articles(request, article_id):
+    # Url apis to fetch the related articles of an article
+    api_path = f'/api/v1/articles/{article_id}/related/'
+
+    response = http_client.get(api_path, headers=_json_headers())
+
+    if response.status_code == 200:
+        return response.json()['results']
+
+def get_article_comments(request, article_id, cursor=None):
+    # Url apis to fetch the comments of an article
+    api_path = f'/api/v1/articles/{article_id}/comments/'
+    headers = _json_headers()
+    params = {'cursor': cursor} if cursor else None
+
+    # Fetch the next page of comments from the API
+    response = http_client.get(api_path, headers=headers, params=params)
+
+    if response.status_code == 200:
+        comments = response.json()
+        comments['next_cursor'] = _next_cursor(comments)
+        return comments
     
 def create_comment(request, article_id, comment):
     # Url apis to fetch articles
-    api_url = f'{settings.API_URL}/api/v1/comments/'
-    headers = {
-        'Content-Type': 'application/json', 
-        'Authorization': f'Bearer {request.session.get('jwt_token')}'
-    }
+    api_path = '/api/v1/comments/'
+    headers = _json_headers(request.session.get('jwt_token'))
 
     payload = {
         'content': comment,
@@ -44,7 +77,7 @@ def create_comment(request, article_id, comment):
     }
 
     # Fetch articles from the API
-    response = requests.post(api_url, headers=headers, json=payload)
+    response = http_client.post(api_path, headers=headers, json=payload)
 
     if response.status_code == 201:
         comment = response.json()
@@ -52,11 +85,8 @@ def create_comment(request, article_id, comment):
     
 def create_article(request, article):
     # Url apis to fetch articles
-    api_url = f'{settings.API_URL}/api/v1/articles/'
-    headers = {
-        'Content-Type': 'application/json', 
-        'Authorization': f'Bearer {request.session.get('jwt_token')}'
-    }
+    api_path = '/api/v1/articles/'
+    headers = _json_headers(request.session.get('jwt_token'))
 
     payload = {
         'title': article['title'],
@@ -68,8 +98,54 @@ def create_article(request, article):
     }
 
     # Fetch articles from the API
-    response = requests.post(api_url, headers=headers, json=payload)
+    response = http_client.post(api_path, headers=headers, json=payload)
 
     if response.status_code == 201:
         article = response.json()
-        return article
\ No newline at end of file
+        return article
+
+
+# Async versions of the calls above, for the async views
+
+async def aget_articles():
+    response = await http_client.aget_conditional('/api/v1/articles/', headers=_json_headers())
+
+    if response.status_code == 200:
+        return response.json()
+
+async def aget_article_by_id(request, article_id):
+    response = await http_client.aget_conditional(f'/api/v1/articles/{article_id}/', headers=_json_headers())
+
+    if response.status_code == 200:
+        article = response.json()
+        article['comments']['next_cursor'] = _next_cursor(article['comments'])
+        return article
+
+async def aget_related_articles(request, article_id):
+    response = await http_client.aget(f'/api/v1/articles/{article_id}/related/', headers=_json_headers())
+
+    if response.status_code == 200:
+        return response.json()['results']
+
+async def aget_article_comments(request, article_id, cursor=None):
+    params = {'cursor': cursor} if cursor else None
+    response = await http_client.aget(
+        f'/api/v1/articles/{article_id}/comments/', headers=_json_headers(), params=params
+    )
+
+    if response.status_code == 200:
+        comments = response.json()
+        comments['next_cursor'] = _next_cursor(comments)
+        return comments
+
+async def acreate_comment(request, article_id, comment):
+    headers = _json_headers(await request.session.aget('jwt_token'))
+    payload = {
+        'content': comment,
+        'article': article_id
+    }
+
+    response = await http_client.apost('/api/v1/comments/', headers=headers, json=payload)
+
+    if response.status_code == 201:
+        return response.json()
@@ -1,6 +1,9 @@
+from typing import Optional
 from django.contrib.auth.models import User
-from django.conf import settings
-import requests
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from apps.frontend.services import http_client
 
 
 def register_user(user: User) -> dict:
@@ -13,7 +16,7 @@ def register_user(user: User) -> dict:
     """
     
     # Url apis to fetch articles
-    api_url = f'{settings.API_URL}/api/v1/users/'
+    api_path = '/api/v1/users/'
     headers = {
         'Content-Type': 'application/json'
     }
@@ -26,7 +29,7 @@ def register_user(user: User) -> dict:
         'last_name': user.last_name,
     }
 
-    response = requests.post(api_url, headers=headers, json=payload)
+    response = http_client.post(api_path, headers=headers, json=payload)
     
     if response.status_code == 201:
         return response.json()
@@ -45,7 +48,7 @@ def login_user(username: str, password: str) -> dict:
     """
     
     # Url apis to fetch articles
-    api_url = f'{settings.API_URL}/api/v1/token/'
+    api_path = '/api/v1/token/'
     headers = {
         'Content-Type': 'application/json'
     }
@@ -55,9 +58,29 @@ def login_user(username: str, password: str) -> dict:
         'password': password,
     }
 
-    response = requests.post(api_url, headers=headers, json=payload)
+    response = http_client.post(api_path, headers=headers, json=payload)
     
     if response.status_code == 200:
         return response.json()
     else:
-        return {'error': response.json()}
\ No newline at end of file
+        return {'error': response.json()}
+
+
+def get_token_user(access: str) -> Optional[User]:
+    """
+    Returns the active user an access token from the API was issued to.
+
+    The API checked the password before issuing the token, so the session
+    can be opened for this user without checking the password again.
+
+    Parameters:
+        - access (str): The access token returned by the API.
+
+    Returns:
+        - User: The user, or None if the token is invalid or the user is not active.
+    """
+    try:
+        user_id = AccessToken(access)[api_settings.USER_ID_CLAIM]
+    except (TokenError, KeyError):
+        return None
+    return User.objects.filter(**{api_settings.USER_ID_FIELD: user_id}, is_active=True).first()
@@ -0,0 +1,74 @@
+import hashlib
+from typing import Callable, Dict
+from django.core.cache import cache
+
+# Rendered fragments are keyed by their content version, so a long timeout
+# only bounds how long unused fragments take up space.
+FRAGMENT_TIMEOUT = 60 * 60 * 24
+
+HITS_KEY = 'fragment_cache:hits'
+MISSES_KEY = 'fragment_cache:misses'
+
+
+def article_card_key(article: Dict) -> str:
+    """
+    Builds the cache key of the card of an article from the API.
+
+    The key changes whenever the article does (id and updated_at), and also
+    when the author or keyword names embedded in the card change, which does
+    not touch the article's updated_at.
+    """
+    author = article.get('author') or {}
+    embedded = repr((
+        author.get('username'), author.get('first_name'), author.get('last_name'),
+        [keyword.get('name') for keyword in article.get('keywords') or []],
+    ))
+    digest = hashlib.md5(embedded.encode(), usedforsecurity=False).hexdigest()[:12]
+    return f"fragment:article_card:{article['id']}:{article.get('updated_at')}:{digest}"
+
+
+def _count(key: str, amount: int) -> None:
+    if not amount:
+        return
+    try:
+        cache.incr(key, amount)
+    except ValueError:
+        if not cache.add(key, amount, None):
+            cache.incr(key, amount)
+
+
+def render_many(fragments: Dict[str, Callable[[], str]]) -> Dict[str, str]:
+    """
+    Returns the HTML of several fragments, rendering only the missing ones.
+
+    All fragments are read with one cache round trip and the rendered ones
+    written back with another.
+
+    Parameters:
+        - fragments (Dict[str, Callable]): Render function of each fragment by key.
+
+    Returns:
+        - Dict[str, str]: The HTML of each fragment by key.
+    """
+    found = cache.get_many(list(fragments))
+    rendered = {key: render() for key, render in fragments.items() if key not in found}
+    if rendered:
+        cache.set_many(rendered, FRAGMENT_TIMEOUT)
+
+    _count(HITS_KEY, len(found))
+    _count(MISSES_KEY, len(rendered))
+    return {**found, **rendered}
+
+
+def get_stats() -> Dict:
+    """
+    Returns the fragment cache hits, misses and hit rate since the last reset.
+    """
+    counts = cache.get_many([HITS_KEY, MISSES_KEY])
+    hits, misses = counts.get(HITS_KEY, 0), counts.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {'hits': hits, 'misses': misses, 'hit_rate': round(hits / total, 4) if total else None}
+
+
+def reset_stats() -> None:
+    cache.delete_many([HITS_KEY, MISSES_KEY])
@@ -0,0 +1,240 @@
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+import weakref
+import httpx
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.dispatch import Signal
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from apps.frontend.services import local_transport
+
+logger = logging.getLogger(__name__)
+
+# Sent after every API call with method, path, status_code (None on network
+# errors) and duration in seconds.
+api_request_finished = Signal()
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+# One async client per event loop: httpx pools can't be shared across loops
+_async_clients = weakref.WeakKeyDictionary()
+
+# How long a validated copy of a GET response is kept for revalidation
+CONDITIONAL_CACHE_TIMEOUT = 60 * 60
+
+
+def _build_session() -> requests.Session:
+    """
+    Builds a session with a keep-alive connection pool and bounded retries.
+
+    Only idempotent methods are retried on read errors and 502/503/504
+    responses; connection errors are retried for every method since the
+    request never reached the API.
+    """
+    retry = Retry(
+        total=settings.API_MAX_RETRIES,
+        backoff_factor=settings.API_RETRY_BACKOFF,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({'GET', 'HEAD'}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_maxsize=settings.API_POOL_MAXSIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the session shared by the current process.
+
+    A new session is built after a fork, so worker processes never share
+    pooled sockets with their parent.
+    """
+    global _session, _session_pid
+
+    if _session is None or _session_pid != os.getpid():
+        with _session_lock:
+            if _session is None or _session_pid != os.getpid():
+                _session = _build_session()
+                _session_pid = os.getpid()
+    return _session
+
+
+def _build_async_client() -> httpx.AsyncClient:
+    """
+    Builds an async client with the same pool size and timeouts as the
+    session. Connection errors are retried; the request never reached the API.
+    """
+    return httpx.AsyncClient(
+        base_url=settings.API_URL,
+        timeout=httpx.Timeout(settings.API_READ_TIMEOUT, connect=settings.API_CONNECT_TIMEOUT),
+        limits=httpx.Limits(max_connections=settings.API_POOL_MAXSIZE),
+        transport=httpx.AsyncHTTPTransport(retries=settings.API_MAX_RETRIES),
+    )
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Returns the async client of the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = _build_async_client()
+    return client
+
+
+def _cache_key(path: str, params) -> str:
+    return 'api_etag:' + hashlib.md5(
+        repr((path, sorted((params or {}).items()))).encode(), usedforsecurity=False
+    ).hexdigest()
+
+
+def request(method: str, path: str, **kwargs) -> requests.Response:
+    """
+    Calls the API, in process or through the shared session depending on
+    settings.API_TRANSPORT.
+
+    Parameters:
+        - method (str): The HTTP method.
+        - path (str): The API path, e.g. /api/v1/articles/.
+        - kwargs: Passed to requests (headers, params, json, ...).
+
+    Returns:
+        - requests.Response: The API response, or a LocalResponse with the
+          same status_code, headers and json() in process.
+
+    Exceptions:
+        - requests.RequestException: On connection errors and timeouts.
+    """
+    kwargs.setdefault('timeout', (settings.API_CONNECT_TIMEOUT, settings.API_READ_TIMEOUT))
+
+    status_code = None
+    started = time.perf_counter()
+    try:
+        if settings.API_TRANSPORT == 'local':
+            response = local_transport.request(method, path, **kwargs)
+        else:
+            response = get_session().request(method, f'{settings.API_URL}{path}', **kwargs)
+        status_code = response.status_code
+        return response
+    finally:
+        duration = time.perf_counter() - started
+        logger.debug('API %s %s -> %s in %.1f ms', method, path, status_code, duration * 1000)
+        api_request_finished.send(
+            sender=request, method=method, path=path, status_code=status_code, duration=duration
+        )
+
+
+def get(path: str, **kwargs) -> requests.Response:
+    return request('GET', path, **kwargs)
+
+
+def post(path: str, **kwargs) -> requests.Response:
+    return request('POST', path, **kwargs)
+
+
+def get_conditional(path: str, **kwargs):
+    """
+    GETs an API resource, revalidating the locally stored copy if any.
+
+    The last 200 response of every path and query string is stored with its
+    ETag. It is sent back as If-None-Match, and on 304 the stored data is
+    returned without downloading or decoding the body again. Only use it for
+    responses that don't depend on the caller's credentials.
+
+    Parameters:
+        - path (str): The API path, e.g. /api/v1/articles/.
+        - kwargs: Passed to requests (headers, params, ...).
+
+    Returns:
+        - requests.Response: The API response, or a LocalResponse with status
+          200 and the stored data when the API answered 304.
+    """
+    key = _cache_key(path, kwargs.get('params'))
+    stored = cache.get(key)
+
+    headers = dict(kwargs.pop('headers', None) or {})
+    if stored:
+        headers['If-None-Match'] = stored['etag']
+
+    response = request('GET', path, headers=headers, **kwargs)
+    if response.status_code == 304 and stored:
+        return local_transport.LocalResponse(200, stored['data'], dict(response.headers))
+    if response.status_code == 200 and response.headers.get('ETag'):
+        cache.set(key, {'etag': response.headers['ETag'], 'data': response.json()}, CONDITIONAL_CACHE_TIMEOUT)
+    return response
+
+
+async def arequest(method: str, path: str, **kwargs):
+    """
+    Async version of request, so a slow API response doesn't hold a thread.
+
+    In process, the API view runs on the thread shared by all sync code of
+    the request, like any sync view under ASGI.
+
+    Parameters:
+        - method (str): The HTTP method.
+        - path (str): The API path, e.g. /api/v1/articles/.
+        - kwargs: Passed to httpx (headers, params, json, ...).
+
+    Returns:
+        - httpx.Response: The API response, or a LocalResponse in process.
+
+    Exceptions:
+        - httpx.HTTPError: On connection errors and timeouts.
+    """
+    status_code = None
+    started = time.perf_counter()
+    try:
+        if settings.API_TRANSPORT == 'local':
+            response = await sync_to_async(local_transport.request)(method, path, **kwargs)
+        else:
+            response = await get_async_client().request(method, path, **kwargs)
+        status_code = response.status_code
+        return response
+    finally:
+        duration = time.perf_counter() - started
+        logger.debug('API %s %s -> %s in %.1f ms', method, path, status_code, duration * 1000)
+        api_request_finished.send(
+            sender=request, method=method, path=path, status_code=status_code, duration=duration
+        )
+
+
+async def aget(path: str, **kwargs):
+    return await arequest('GET', path, **kwargs)
+
+
+async def apost(path: str, **kwargs):
+    return await arequest('POST', path, **kwargs)
+
+
+async def aget_conditional(path: str, **kwargs):
+    """
+    Async version of get_conditional, sharing its stored copies.
+    """
+    key = _cache_key(path, kwargs.get('params'))
+    stored = await cache.aget(key)
+
+    headers = dict(kwargs.pop('headers', None) or {})
+    if stored:
+        headers['If-None-Match'] = stored['etag']
+
+    response = await arequest('GET', path, headers=headers, **kwargs)
+    if response.status_code == 304 and stored:
+        return local_transport.LocalResponse(200, stored['data'], dict(response.headers))
+    if response.status_code == 200 and response.headers.get('ETag'):
+        await cache.aset(key, {'etag': response.headers['ETag'], 'data': response.json()}, CONDITIONAL_CACHE_TIMEOUT)
+    return response
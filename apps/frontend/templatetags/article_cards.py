@@ -0,0 +1,24 @@
+from django import template
+from django.template.loader import get_template
+from django.utils.safestring import mark_safe
+from apps.frontend.services import fragment_cache
+
+register = template.Library()
+
+@register.simple_tag
+def article_cards(articles):
+    """
+    Render the cards of a list of articles, reusing the cached HTML of every
+    card whose article did not change.
+
+    template example:
+    {% load article_cards %}
+    {% article_cards articles %}
+    """
+    card = get_template('shared/article_card.html')
+    keys = [fragment_cache.article_card_key(article) for article in articles]
+    fragments = fragment_cache.render_many({
+        key: (lambda article=article: card.render({'article': article}))
+        for key, article in zip(keys, articles)
+    })
+    return mark_safe(''.join(fragments[key] for key in keys))
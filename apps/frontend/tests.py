@@ -1,3 +1,229 @@
-from django.test import TestCase
+import asyncio
+from unittest import mock
+import httpx
+from django.contrib.auth.hashers import get_hasher
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.auth.models import User
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import AsyncRequestFactory, SimpleTestCase, TestCase, override_settings
+from apps.api.models.article import Article
+from apps.api.throttling import AnonRateThrottle, get_store
+from apps.core.services.article_service import ArticleService
+from apps.frontend.services import fragment_cache, http_client
+from apps.frontend.views import article as article_views, home as home_views
 
-# Create your tests here.
+
+@override_settings(API_TRANSPORT='http', API_URL='http://api.test', API_CONNECT_TIMEOUT=1.5, API_READ_TIMEOUT=4)
+class HttpClientTestCase(SimpleTestCase):
+    def test_requests_share_a_pooled_session_with_timeouts(self):
+        calls = []
+
+        def receiver(sender, **kwargs):
+            calls.append(kwargs)
+
+        http_client.api_request_finished.connect(receiver)
+        self.addCleanup(http_client.api_request_finished.disconnect, receiver)
+
+        session = http_client.get_session()
+        self.assertIs(session, http_client.get_session())
+        self.assertEqual(session.get_adapter('http://api.test').max_retries.total, 2)
+
+        with mock.patch.object(session, 'request', return_value=mock.Mock(status_code=200)) as request:
+            http_client.get('/api/v1/articles/', params={'page': 2})
+
+        request.assert_called_once_with(
+            'GET', 'http://api.test/api/v1/articles/', params={'page': 2}, timeout=(1.5, 4)
+        )
+        self.assertEqual(calls[-1]['path'], '/api/v1/articles/')
+        self.assertEqual(calls[-1]['status_code'], 200)
+
+
+@override_settings(API_TRANSPORT='local', API_URL='http://testserver')
+class LocalTransportTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='writer', password='secret123')
+        self.article = Article.objects.create(
+            title='In process', subtitle='Sub', content='Content',
+            type=Article.ArticleType.PUBLISHED, status=Article.ArticleStatus.PUBLIC, author=self.user
+        )
+
+    def test_requests_are_dispatched_without_the_network(self):
+        with mock.patch.object(http_client, 'get_session') as get_session:
+            response = http_client.get(f'/api/v1/articles/{self.article.id}/')
+            token = http_client.post('/api/v1/token/', json={'username': 'writer', 'password': 'secret123'})
+
+        get_session.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'In process')
+        self.assertEqual(token.status_code, 200)
+        self.assertIn('access', token.json())
+
+    def test_conditional_get_reuses_the_stored_copy(self):
+        cache.clear()
+        statuses = []
+
+        def receiver(sender, **kwargs):
+            statuses.append(kwargs['status_code'])
+
+        http_client.api_request_finished.connect(receiver)
+        self.addCleanup(http_client.api_request_finished.disconnect, receiver)
+
+        path = f'/api/v1/articles/{self.article.id}/'
+        first = http_client.get_conditional(path)
+        second = http_client.get_conditional(path)
+
+        self.assertEqual(statuses, [200, 304])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), first.json())
+
+    def test_frontend_pages_render_through_the_local_transport(self):
+        response = self.client.get(f'/article/{self.article.id}/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'In process')
+
+    def test_anonymous_visitors_are_throttled_apart(self):
+        rates = {**AnonRateThrottle.THROTTLE_RATES, 'anon': '3/day'}
+        self.enterContext(mock.patch.object(AnonRateThrottle, 'THROTTLE_RATES', rates))
+        get_store().clear()
+        self.addCleanup(get_store().clear)
+
+        def home(address):
+            # Skips the stored copies and cached responses, answered before throttling
+            cache.clear()
+            return self.client.get('/', REMOTE_ADDR=address)
+
+        for index in range(5):
+            self.assertContains(home(f'203.0.113.{index}'), 'In process')
+
+        for _ in range(3):
+            home('198.51.100.7')
+        self.assertNotContains(home('198.51.100.7'), 'In process')
+        self.assertContains(home('198.51.100.8'), 'In process')
+
+    def test_article_page_lists_related_articles(self):
+        for title in ('In process', 'Nearby'):
+            with self.captureOnCommitCallbacks(execute=True):
+                ArticleService.create_article({
+                    'title': title, 'subtitle': 'Sub', 'content': 'Content', 'keywords': ['shared'],
+                    'type': Article.ArticleType.PUBLISHED, 'status': Article.ArticleStatus.PUBLIC,
+                }, self.user)
+        article = Article.objects.filter(title='In process').latest('id')
+
+        response = self.client.get(f'/article/{article.id}/')
+        self.assertContains(response, 'Artigos relacionados')
+        self.assertContains(response, 'Nearby')
+
+
+@override_settings(API_TRANSPORT='local', API_URL='http://testserver')
+class LoginTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='reader', password='secret-Pass-123')
+        hasher = type(get_hasher())
+        patcher = mock.patch.object(hasher, 'encode', autospec=True, side_effect=hasher.encode)
+        self.encode = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_login_checks_the_password_once(self):
+        response = self.client.post('/login/', {'username': 'reader', 'password': 'secret-Pass-123'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.encode.call_count, 1)
+        self.assertEqual(self.client.session['_auth_user_id'], str(self.user.id))
+        self.assertIn('jwt_token', self.client.session)
+
+    def test_registration_hashes_the_password_once(self):
+        response = self.client.post('/register/', {
+            'username': 'newcomer', 'email': 'new@example.com', 'first_name': 'New', 'last_name': 'Comer',
+            'password': 'secret-Pass-123', 'password_confirm': 'secret-Pass-123',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.encode.call_count, 1)
+        user = User.objects.get(username='newcomer')
+        self.assertEqual(self.client.session['_auth_user_id'], str(user.id))
+        self.assertTrue(user.check_password('secret-Pass-123'))
+
+
+class ArticleCardCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.articles = [
+            {'id': index, 'title': f'Card {index}', 'subtitle': 'Sub', 'excerpt': 'Excerpt',
+             'created_at': '2025-04-18T15:30:00Z', 'updated_at': '2025-04-18T15:30:00Z',
+             'author': {'username': 'writer'}, 'keywords': [{'name': 'python'}]}
+            for index in range(3)
+        ]
+
+    def render(self):
+        return Template('{% load article_cards %}{% article_cards articles %}').render(
+            Context({'articles': self.articles})
+        )
+
+    def test_only_changed_cards_are_rendered_again(self):
+        first = self.render()
+        self.assertEqual(fragment_cache.get_stats(), {'hits': 0, 'misses': 3, 'hit_rate': 0.0})
+        self.assertEqual(self.render(), first)
+
+        self.articles[1]['updated_at'] = '2025-04-19T10:00:00Z'
+        self.articles[1]['title'] = 'Edited card'
+        self.articles[2]['keywords'] = [{'name': 'django'}]
+        html = self.render()
+
+        self.assertIn('Edited card', html)
+        self.assertIn('django', html)
+        self.assertEqual(html.count('class="card"'), 3)
+        self.assertEqual(fragment_cache.get_stats(), {'hits': 4, 'misses': 5, 'hit_rate': 0.4444})
+
+
+@override_settings(API_TRANSPORT='http', API_URL='http://api.test')
+class AsyncHttpClientTestCase(SimpleTestCase):
+    async def test_upstream_calls_run_concurrently(self):
+        arrived = []
+        both_arrived = asyncio.Event()
+
+        async def handler(request):
+            # Only answers once both requests are in flight at the same time
+            arrived.append(request.url.path)
+            if len(arrived) == 2:
+                both_arrived.set()
+            await asyncio.wait_for(both_arrived.wait(), timeout=2)
+            return httpx.Response(200, json={'path': request.url.path})
+
+        client = httpx.AsyncClient(base_url='http://api.test', transport=httpx.MockTransport(handler))
+        with mock.patch.object(http_client, '_build_async_client', return_value=client):
+            first, second = await asyncio.gather(
+                http_client.aget('/api/v1/articles/'), http_client.aget('/api/v1/keywords/')
+            )
+        await client.aclose()
+
+        self.assertEqual(first.json(), {'path': '/api/v1/articles/'})
+        self.assertEqual(second.json(), {'path': '/api/v1/keywords/'})
+
+
+@override_settings(API_TRANSPORT='local', API_URL='http://testserver')
+class AsyncViewsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='writer', password='secret123')
+        self.article = Article.objects.create(
+            title='Async article', subtitle='Sub', content='Content',
+            type=Article.ArticleType.PUBLISHED, status=Article.ArticleStatus.PUBLIC, author=self.user
+        )
+
+    def build_request(self, path):
+        request = AsyncRequestFactory().get(path)
+        SessionMiddleware(lambda request: None).process_request(request)
+        AuthenticationMiddleware(lambda request: None).process_request(request)
+        MessageMiddleware(lambda request: None).process_request(request)
+        return request
+
+    async def test_async_views_render_articles(self):
+        response = await article_views.aarticle_detail(self.build_request('/article/'), self.article.id)
+        self.assertContains(response, 'Async article')
+
+        response = await home_views.aindex(self.build_request('/'))
+        self.assertContains(response, 'Async article')
@@ -1,17 +1,29 @@
+from django.conf import settings
 from django.urls import path
 from apps.frontend.views import article, auth, home
 
 
 app_name = 'frontend'
 
+# Async views await the API calls instead of holding a thread, use them
+# under an ASGI server
+if settings.FRONTEND_ASYNC_VIEWS:
+    index, article_list = home.aindex, article.aarticle_list
+    article_detail, comment_create = article.aarticle_detail, article.acomment_create
+else:
+    index, article_list = home.index, article.article_list
+    article_detail, comment_create = article.article_detail, article.comment_create
+
 urlpatterns = [
-    path('', home.index, name='index'),
+    path('', index, name='index'),
+    path('fragment-cache/stats/', home.fragment_cache_stats, name='fragment_cache_stats'),
     path('register/', auth.register, name='register'),
     path('logout/', auth.logout, name='logout'),
     path('login/', auth.login, name='login'),
-    path('article/', article.article_list, name='article_list'),
-    path('article/<int:pk>/', article.article_detail, name='article_detail'),
-    path('article/<int:pk>/comment/', article.comment_create, name='comment_create'),
+    path('article/', article_list, name='article_list'),
+    path('article/<int:pk>/', article_detail, name='article_detail'),
+    path('article/<int:pk>/comment/', comment_create, name='comment_create'),
+    path('article/<int:pk>/comments/', article.comment_list, name='comment_list'),
     path('article/create/', article.article_create, name='article_create'),
 ]
     
\ No newline at end of file
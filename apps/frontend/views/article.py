@@ -3,7 +3,9 @@ from django.shortcuts import render, redirect
 from django.conf import settings
 from apps.frontend.forms import ArticleCreateForm
 from apps.frontend.services import api_articles
+from apps.frontend.views.common import gather_with_user
 from django.contrib import messages
+import httpx
 import requests
 
 def article_list(request):
@@ -35,9 +37,34 @@ def article_detail(request, pk):
     except requests.RequestException as e:
         messages.error(request, 'Failed to fetch article details. Please try again later.')
         return render(request, 'article/article_detail.html', {'article': None})
+
+    # Related articles are optional, the page renders without them
+    try:
+        related = api_articles.get_related_articles(request, pk)
+    except requests.RequestException as e:
+        related = None
     
     return render(request, 'article/article_detail.html', {
-        'article': article
+        'article': article,
+        'related_articles': related or [],
+    })
+
+def comment_list(request, pk):
+    """
+    View to fetch the next page of comments of an article as an HTML fragment.
+    """
+    try:
+        comments = api_articles.get_article_comments(request, pk, request.GET.get('cursor'))
+    except requests.RequestException as e:
+        comments = None
+
+    if not comments:
+        comments = {'results': [], 'next_cursor': None}
+
+    return render(request, 'article/comment_list.html', {
+        'article_id': pk,
+        'comments': comments['results'],
+        'next_cursor': comments['next_cursor'],
     })
 
 def comment_create(request, pk):
@@ -77,4 +104,62 @@ def article_create(request):
     else:
         form = ArticleCreateForm()
 
-    return render(request, 'article/article_create.html', {'form': form})
\ No newline at end of file
+    return render(request, 'article/article_create.html', {'form': form})
+
+# Async versions of the views above. Upstream calls are awaited, so under an
+# ASGI server a slow API response doesn't hold a thread.
+
+async def aarticle_list(request):
+    """
+    Async version of article_list.
+    """
+    articles, = await gather_with_user(request, api_articles.aget_articles())
+    if isinstance(articles, httpx.HTTPError):
+        messages.error(request, 'Failed to fetch articles. Please try again later.')
+        articles = {'results': []}
+    elif not articles:
+        messages.error(request, 'No articles found.')
+        articles = {'results': []}
+
+    return render(request, 'article/article_list.html', {
+        'articles': articles['results']
+    })
+
+async def aarticle_detail(request, pk):
+    """
+    Async version of article_detail.
+    """
+    article, related = await gather_with_user(
+        request, api_articles.aget_article_by_id(request, pk), api_articles.aget_related_articles(request, pk)
+    )
+    if isinstance(article, httpx.HTTPError):
+        messages.error(request, 'Failed to fetch article details. Please try again later.')
+        return render(request, 'article/article_detail.html', {'article': None})
+    if not article:
+        messages.error(request, 'Article not found.')
+        return render(request, 'article/article_detail.html', {'article': None})
+    if isinstance(related, httpx.HTTPError):
+        related = None
+
+    return render(request, 'article/article_detail.html', {
+        'article': article,
+        'related_articles': related or [],
+    })
+
+async def acomment_create(request, pk):
+    """
+    Async version of comment_create.
+    """
+    if request.method == 'POST':
+        comment = request.POST.get('comment-content')
+        if not comment:
+            messages.error(request, 'Comment cannot be empty.')
+            return redirect('frontend:article_detail', pk=pk)
+
+        try:
+            await api_articles.acreate_comment(request, pk, comment)
+            messages.success(request, 'Comment added successfully.')
+        except httpx.HTTPError as e:
+            messages.error(request, 'Failed to add comment. Please try again later.')
+
+    return redirect('frontend:article_detail', pk=pk)
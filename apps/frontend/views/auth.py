@@ -3,7 +3,10 @@ from django.conf import settings
 from django.shortcuts import redirect, render
 from apps.frontend.forms import LoginForm, RegisterForm
 from apps.frontend.services import api_auth as auth_service
-from django.contrib.auth import authenticate, login as auth_login, logout as auth_logout
+from django.contrib.auth import login as auth_login, logout as auth_logout
+
+# The API verifies the password, the session is opened for the user of its token
+SESSION_BACKEND = 'django.contrib.auth.backends.ModelBackend'
 
 def register(request):
     """
@@ -20,14 +23,12 @@ def register(request):
             api_response = auth_service.register_user(user)
 
             if 'error' not in api_response:
-                # Registered successfully, redirect to login page
-                user_login = authenticate(
-                    request, username=user.username, password=form.cleaned_data['password']
-                )
+                # Registered successfully, log in the user the token was issued to
+                user_login = auth_service.get_token_user(api_response['access'])
 
                 # If user is authenticated, log them in
                 if user_login is not None:
-                    auth_login(request, user_login)                
+                    auth_login(request, user_login, backend=SESSION_BACKEND)
 
                 # Store JWT token in session
                 request.session['jwt_token'] = api_response['access']
@@ -73,14 +74,12 @@ def login(request):
             api_response = auth_service.login_user(username, password)
             
             if 'error' not in api_response:
-                # Registered successfully, redirect to login page
-                user_login = authenticate(
-                    request, username=username, password=password
-                )
+                # Logged in successfully, log in the user the token was issued to
+                user_login = auth_service.get_token_user(api_response['access'])
 
                 # If user is authenticated, log them in
                 if user_login is not None:
-                    auth_login(request, user_login)                
+                    auth_login(request, user_login, backend=SESSION_BACKEND)
 
                 # Store JWT token in session
                 request.session['jwt_token'] = api_response['access']
@@ -0,0 +1,20 @@
+import asyncio
+
+
+async def gather_with_user(request, *coroutines):
+    """
+    Loads the session user concurrently with the given upstream calls.
+
+    Sets request.user, so templates never hit the database lazily from the
+    event loop. Errors of the calls are returned in place of their results.
+
+    The calls only overlap with the http transport. With API_TRANSPORT set
+    to 'local' each one runs the API view on the request's sync thread, so
+    they run one after another; moving them to other threads would give
+    each its own database connection, outside the request's.
+    """
+    user, *results = await asyncio.gather(request.auser(), *coroutines, return_exceptions=True)
+    if isinstance(user, BaseException):
+        raise user
+    request.user = user
+    return results
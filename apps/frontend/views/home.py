@@ -1,9 +1,13 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse
 from django.shortcuts import render
 from django.contrib import messages
 from django.conf import settings
+import httpx
 import requests
 
-from apps.frontend.services import api_articles
+from apps.frontend.services import api_articles, fragment_cache
+from apps.frontend.views.common import gather_with_user
 
 
 def index(request):
@@ -19,4 +23,25 @@ def index(request):
 
     return render(request, 'home/index.html', {
         'articles': articles.get('results', [])
-    })
\ No newline at end of file
+    })
+
+
+async def aindex(request):
+    """Async version of index, loading the user and the articles concurrently."""
+    articles, = await gather_with_user(request, api_articles.aget_articles())
+    if isinstance(articles, httpx.HTTPError):
+        messages.error(request, 'Failed to fetch articles. Please try again later.')
+        articles = {'results': []}
+    elif not articles:
+        messages.error(request, 'No articles found.')
+        articles = {'results': []}
+
+    return render(request, 'home/index.html', {
+        'articles': articles.get('results', [])
+    })
+
+
+@staff_member_required
+def fragment_cache_stats(request):
+    """Report the hits and misses of the rendered article card cache."""
+    return JsonResponse(fragment_cache.get_stats())
@@ -14,3 +14,7 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blog_samplemed.settings')
 
 application = get_asgi_application()
+
+from apps.core.services.keyword_suggest_service import KeywordSuggestService  # noqa: E402
+
+KeywordSuggestService.warm_up()
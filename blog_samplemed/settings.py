@@ -40,12 +40,15 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'apps.api.middleware.RequestTimingMiddleware',
+    'apps.api.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'apps.frontend.middleware.ClientAddressMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'apps.api.middleware.JSONMiddleware',
@@ -126,7 +129,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.api.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
@@ -137,22 +140,43 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 10,
     'MAX_PAGE_SIZE': 100,
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle'
+        'apps.api.throttling.AnonRateThrottle',
+        'apps.api.throttling.UserRateThrottle'
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '100/day',
-        'user': '1000/day'
+        'user': '1000/day',
+        'suggest': '120/min',
     },
 
 }
 
 # Caching settings
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',  # In-memory cache for development
+# 'sqlite' shares one cache between the worker processes of the host, so an
+# invalidation reaches all of them; 'locmem' keeps a separate cache per process.
+CACHE_BACKEND = config('CACHE_BACKEND', default='sqlite')
+if CACHE_BACKEND == 'sqlite':
+    CACHES = {
+        'default': {
+            'BACKEND': 'apps.core.cache.sqlite.SQLiteCache',
+            'LOCATION': config('CACHE_LOCATION', default=str(BASE_DIR / 'cache.sqlite3')),
+            'OPTIONS': {
+                'MAX_ENTRIES': config('CACHE_MAX_ENTRIES', default=10000, cast=int),
+            },
+        }
     }
-}
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',  # In-memory cache for development
+        }
+    }
+
+# Throttle token buckets, shared by the worker processes of the host.
+THROTTLE_STORE_PATH = config('THROTTLE_STORE_PATH', default=str(BASE_DIR / 'throttle.sqlite3'))
+
+# Tests run with the in-memory cache and throttle store of blog_samplemed.testing
+TEST_RUNNER = 'blog_samplemed.testing.TestRunner'
 
 # JWT settings
 SIMPLE_JWT = {
@@ -160,12 +184,57 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=config('JWT_REFRESH_TOKEN_LIFETIME_DAYS', default=1, cast=int)),
 }
 
+# Seconds between rebuilds of the in-memory keyword suggestion index
+KEYWORD_SUGGEST_TTL = config('KEYWORD_SUGGEST_TTL', default=300, cast=int)
+
+# Seconds the user of a JWT is cached for (0 selects it on every request)
+JWT_USER_CACHE_TTL = config('JWT_USER_CACHE_TTL', default=60, cast=int)
+
 # CORS settings
 CORS_ALLOWED_ORIGINS = config('CORS_ALLOWED_ORIGINS', default='', cast=Csv())
 CORS_ALLOW_CREDENTIALS = config('CORS_ALLOW_CREDENTIALS', default=True, cast=bool)
 
 # API settings
+# 'local' dispatches frontend API calls to the API views in process; 'http'
+# calls API_URL over the network, for deployments where the API runs apart.
+API_TRANSPORT = config('API_TRANSPORT', default='local')
 API_URL = config('API_URL', default='http://localhost:8000')
+API_CONNECT_TIMEOUT = config('API_CONNECT_TIMEOUT', default=3.05, cast=float)
+API_READ_TIMEOUT = config('API_READ_TIMEOUT', default=10, cast=float)
+API_MAX_RETRIES = config('API_MAX_RETRIES', default=2, cast=int)
+API_RETRY_BACKOFF = config('API_RETRY_BACKOFF', default=0.2, cast=float)
+API_POOL_MAXSIZE = config('API_POOL_MAXSIZE', default=10, cast=int)
+
+# Serve the home, article list, article detail and comment views asynchronously
+FRONTEND_ASYNC_VIEWS = config('FRONTEND_ASYNC_VIEWS', default=False, cast=bool)
+
+# Fraction of the requests measured by RequestTimingMiddleware (0 disables it)
+REQUEST_TIMING_SAMPLE_RATE = config('REQUEST_TIMING_SAMPLE_RATE', default=1.0, cast=float)
+
+# Metrics settings
+# Directory shared by the worker processes, each writing a snapshot of its
+# metrics there for /metrics to add up; empty for a single process.
+METRICS_MULTIPROC_DIR = config('METRICS_MULTIPROC_DIR', default='')
+METRICS_FLUSH_INTERVAL = config('METRICS_FLUSH_INTERVAL', default=1.0, cast=float)
+METRICS_ALLOWED_IPS = config('METRICS_ALLOWED_IPS', default='127.0.0.1,::1', cast=Csv())
+
+# Logging settings
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'apps.api.timing': {
+            'handlers': ['console'],
+            'level': config('REQUEST_TIMING_LOG_LEVEL', default='INFO'),
+            'propagate': False,
+        },
+    },
+}
 
 # Error handlers
 HANDLER404 = 'apps.api.handlers.handler404'
@@ -0,0 +1,45 @@
+import logging
+from contextlib import contextmanager
+from django.test import override_settings
+from django.test.runner import DiscoverRunner
+
+# Tests keep the cache and the throttle buckets in memory instead of the
+# files shared by the worker processes
+TEST_SETTINGS = {
+    'CACHES': {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    },
+    'THROTTLE_STORE_PATH': ':memory:',
+}
+
+
+@contextmanager
+def test_environment():
+    """
+    Applies TEST_SETTINGS and leaves the timing log lines out of the test
+    output, whatever the environment configures.
+    """
+    timing_logger = logging.getLogger('apps.api.timing')
+    level = timing_logger.level
+    timing_logger.setLevel(logging.WARNING)
+    try:
+        with override_settings(**TEST_SETTINGS):
+            yield
+    finally:
+        timing_logger.setLevel(level)
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Runs the tests of ``manage.py test`` in the test environment.
+    """
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._test_environment = test_environment()
+        self._test_environment.__enter__()
+
+    def teardown_test_environment(self, **kwargs):
+        self._test_environment.__exit__(None, None, None)
+        super().teardown_test_environment(**kwargs)
@@ -3,6 +3,7 @@ from django.urls import path, include
 from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
+from apps.api.views.metrics import metrics_view
 
 # Swagger schema view
 schema_view = get_schema_view(
@@ -25,6 +26,7 @@ api_info = openapi.Info(
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('apps.api.urls')),
+    path('metrics', metrics_view, name='metrics'),
     path('', include('apps.frontend.urls')),
     
     # Swagger URLs
@@ -14,3 +14,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blog_samplemed.settings')
 
 application = get_wsgi_application()
+
+from apps.core.services.keyword_suggest_service import KeywordSuggestService  # noqa: E402
+
+KeywordSuggestService.warm_up()
@@ -0,0 +1,9 @@
+import pytest
+
+
+@pytest.fixture(autouse=True, scope='session')
+def _test_environment():
+    # Same settings as blog_samplemed.testing.TestRunner under pytest-django
+    from blog_samplemed.testing import test_environment
+    with test_environment():
+        yield